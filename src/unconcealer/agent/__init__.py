@@ -1,6 +1,7 @@
 """Agent components: tools, orchestration, providers, and MCP server."""
 
 from unconcealer.agent.tools import create_debug_tools, create_debug_server
+from unconcealer.agent.cache import ResponseCache
 from unconcealer.agent.orchestrator import (
     AgentOrchestrator,
     SessionMemory,
@@ -23,6 +24,8 @@ __all__ = [
     "AgentOrchestrator",
     "SessionMemory",
     "Finding",
+    # Cache
+    "ResponseCache",
     # Providers
     "ModelProvider",
     "CompletionChunk",
@@ -0,0 +1,201 @@
+"""On-disk response cache for LLM queries.
+
+Repeated questions about the same firmware (for example running
+``unconcealer analyze`` twice on an unchanged ELF) are answered from disk
+instead of paying the full model latency again. Cached answers are
+replayed in small chunks so callers keep their streaming behaviour.
+
+Example:
+    cache = ResponseCache()
+    key = cache.make_key(elf_digest=digest, prompt=prompt, model=model)
+    async for chunk in cache.stream(key, lambda: orchestrator.query_stream(prompt)):
+        print(chunk, end="")
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "unconcealer"
+DEFAULT_TTL = 24 * 60 * 60
+REPLAY_CHUNK_SIZE = 64
+
+
+class ResponseCache:
+    """Stores LLM responses on disk, keyed by firmware, model and prompt.
+
+    Attributes:
+        cache_dir: Directory holding one JSON file per cached response
+        ttl: Maximum age of an entry in seconds (0 disables expiry)
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """Initialize response cache.
+
+        Args:
+            cache_dir: Cache directory (default: ~/.cache/unconcealer/responses)
+            ttl: Entry lifetime in seconds (default: $UNCONCEALER_CACHE_TTL or 24h)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR / "responses"
+        if ttl is None:
+            ttl = float(os.environ.get("UNCONCEALER_CACHE_TTL", DEFAULT_TTL))
+        self.ttl = ttl
+
+    @staticmethod
+    def make_key(
+        elf_digest: str,
+        prompt: str,
+        model: Optional[str] = None,
+        fault: Optional[str] = None,
+        context: Optional[str] = None,
+        provider: Optional[str] = None,
+        target_state: Optional[str] = None,
+    ) -> str:
+        """Build a cache key for a query.
+
+        Args:
+            elf_digest: SHA-256 hex digest of the firmware the query is about
+            prompt: User prompt
+            model: Model name
+            fault: Fault type being analyzed, if any
+            context: Hash of the preceding conversation (see chain_turn()),
+                so follow-up questions only hit after the same history
+            provider: LLM provider name
+            target_state: Description of where the target is stopped, so
+                questions about live state only hit at the same stop
+
+        Returns:
+            16-character hex key
+        """
+        payload = json.dumps(
+            {
+                "elf": elf_digest,
+                "model": model,
+                "prompt": prompt,
+                "fault": fault,
+                "context": context,
+                "provider": provider,
+                "target_state": target_state,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+    @staticmethod
+    def chain_turn(chain: str, prompt: str) -> str:
+        """Extend a conversation hash chain with another user turn.
+
+        Args:
+            chain: Hash of the conversation so far ("" at the start)
+            prompt: User prompt of the completed turn
+
+        Returns:
+            16-character hex hash covering the whole conversation
+        """
+        return hashlib.sha256(f"{chain}||{prompt}".encode()).hexdigest()[:16]
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read an entry, or None if it is missing, unreadable or expired."""
+        try:
+            with open(self._path(key)) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(entry, dict):
+            return None
+        if self.ttl > 0 and time.time() - entry.get("created", 0) > self.ttl:
+            return None
+        return entry
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a cached response.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached response text, or None if missing or expired
+        """
+        entry = self._load(key)
+        text = entry.get("text") if entry else None
+        return text if isinstance(text, str) else None
+
+    def get_extras(self, key: str) -> Dict[str, str]:
+        """Look up the extra texts stored alongside a response.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Extra texts by name (empty if missing or expired)
+        """
+        entry = self._load(key)
+        extras = entry.get("extras") if entry else None
+        return extras if isinstance(extras, dict) else {}
+
+    def put(self, key: str, text: str, extras: Optional[Dict[str, str]] = None) -> None:
+        """Store a response (best effort).
+
+        Args:
+            key: Cache key from make_key()
+            text: Full response text
+            extras: Other output of the query to replay with it (e.g. findings)
+        """
+        entry: Dict[str, Any] = {"created": time.time(), "text": text}
+        if extras:
+            entry["extras"] = extras
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self._path(key), "w") as f:
+                json.dump(entry, f)
+        except OSError as e:
+            logger.warning(f"Failed to write response cache: {e}")
+
+    async def stream(
+        self,
+        key: str,
+        source: Callable[[], AsyncIterator[str]],
+        extras: Optional[Callable[[], Dict[str, str]]] = None,
+    ) -> AsyncIterator[str]:
+        """Stream a response, serving it from the cache when possible.
+
+        On a hit the cached text is replayed in ``REPLAY_CHUNK_SIZE`` chunks
+        and ``source`` is never called. On a miss the chunks from ``source()``
+        are passed through and the full text is stored once the stream
+        completes, together with whatever ``extras()`` returns then.
+
+        Args:
+            key: Cache key from make_key()
+            source: Factory returning the live response stream
+            extras: Called after a miss completes; its texts are stored with
+                the response and can be read back with get_extras()
+
+        Yields:
+            Response text chunks
+        """
+        cached = self.get(key)
+        if cached is not None:
+            for i in range(0, len(cached), REPLAY_CHUNK_SIZE):
+                yield cached[i:i + REPLAY_CHUNK_SIZE]
+            return
+
+        text = io.StringIO()
+        async for chunk in source():
+            text.write(chunk)
+            yield chunk
+        self.put(key, text.getvalue(), extras() if extras else None)
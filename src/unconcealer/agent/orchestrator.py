@@ -13,8 +13,10 @@ Example:
     print(response)
 """
 
+import hashlib
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, AsyncIterator, TYPE_CHECKING
+from pathlib import Path
+from typing import Any, Dict, List, Optional, AsyncIterator, Tuple, TYPE_CHECKING
 from datetime import datetime
 
 from claude_agent_sdk import query, ClaudeAgentOptions
@@ -26,7 +28,7 @@ if TYPE_CHECKING:
     from unconcealer.agent.providers.base import ModelProvider
 
 
-@dataclass
+@dataclass(frozen=True)
 class Finding:
     """A debugging finding or observation."""
     timestamp: datetime
@@ -47,6 +49,11 @@ class SessionMemory:
     findings: List[Finding] = field(default_factory=list)
     context: Dict[str, Any] = field(default_factory=dict)
 
+    # (number of findings rendered, rendered text)
+    _findings_render: Optional[Tuple[int, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def add_finding(
         self,
         description: str,
@@ -61,6 +68,18 @@ class SessionMemory:
             severity=severity
         ))
 
+    def render_findings(self) -> str:
+        """Render all findings as "  [severity] description" lines.
+
+        Findings are immutable and only ever appended, so the rendered text
+        is cached and rebuilt only when the number of findings changes.
+        """
+        count = len(self.findings)
+        if self._findings_render is None or self._findings_render[0] != count:
+            text = "\n".join(f"  [{f.severity}] {f.description}" for f in self.findings)
+            self._findings_render = (count, text)
+        return self._findings_render[1]
+
     def get_context_summary(self) -> str:
         """Get a summary of current context for the agent."""
         lines = []
@@ -148,6 +167,8 @@ class AgentOrchestrator:
         provider: Optional["ModelProvider"] = None,
         model: Optional[str] = None,
         system_prompt: Optional[str] = None,
+        prefix_cacheable: bool = False,
+        elf_digest: Optional[str] = None,
     ):
         """Initialize the orchestrator.
 
@@ -156,6 +177,10 @@ class AgentOrchestrator:
             provider: LLM provider (default: uses Claude via claude-agent-sdk)
             model: Model name (only used when provider is None)
             system_prompt: Custom system prompt (default: built-in)
+            prefix_cacheable: Ask the provider to cache the system prompt
+                prefix across turns
+            elf_digest: SHA-256 of the ELF, part of the prefix cache key
+                (computed from session.elf_path if not given)
         """
         self.session = session
         self.memory = SessionMemory()
@@ -171,6 +196,17 @@ class AgentOrchestrator:
         # Track conversation for context
         self._conversation_history: List[Dict[str, str]] = []
 
+        # Prefix cache hints passed to the provider on every turn
+        self.prefix_cache_key: Optional[str] = None
+        self._cache_options: Dict[str, Any] = {}
+        if prefix_cacheable and provider is not None:
+            if elf_digest is None:
+                elf_digest = hashlib.sha256(Path(session.elf_path).read_bytes()).hexdigest()
+            self.prefix_cache_key = hashlib.sha256(
+                (self.system_prompt + elf_digest).encode()
+            ).hexdigest()
+            self._cache_options = provider.prefix_cache_options(self.prefix_cache_key)
+
     def _build_options(self, **kwargs: Any) -> ClaudeAgentOptions:
         """Build ClaudeAgentOptions with debug tools."""
         # Tool names from our debug server
@@ -227,7 +263,7 @@ class AgentOrchestrator:
             async for chunk in self._provider.complete_with_tools(
                 messages=messages,
                 system_prompt=self.system_prompt,
-                **kwargs,
+                **{**self._cache_options, **kwargs},
             ):
                 if chunk.type == "text" and chunk.text:
                     response_parts.append(chunk.text)
@@ -275,7 +311,7 @@ class AgentOrchestrator:
             async for chunk in self._provider.complete_with_tools(
                 messages=messages,
                 system_prompt=self.system_prompt,
-                **kwargs,
+                **{**self._cache_options, **kwargs},
             ):
                 if chunk.type == "text" and chunk.text:
                     response_parts.append(chunk.text)
@@ -345,11 +381,25 @@ class AgentOrchestrator:
         """Get all findings."""
         return self.memory.findings
 
+    def render_findings(self) -> str:
+        """Get all findings rendered as text lines (cached)."""
+        return self.memory.render_findings()
+
     @property
     def conversation_history(self) -> List[Dict[str, str]]:
         """Get conversation history."""
         return self._conversation_history.copy()
 
+    def record_turn(self, prompt: str, response: str) -> None:
+        """Add a turn answered outside the provider (e.g. from a cache).
+
+        Args:
+            prompt: User's question
+            response: Response shown to the user
+        """
+        self._conversation_history.append({"role": "user", "content": prompt})
+        self._conversation_history.append({"role": "assistant", "content": response})
+
     def clear_history(self) -> None:
         """Clear conversation history."""
         self._conversation_history.clear()
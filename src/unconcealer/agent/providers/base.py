@@ -1,5 +1,7 @@
 """Base types and protocol for model providers."""
 
+import asyncio
+import inspect
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any, AsyncIterator, Callable, Literal
@@ -59,7 +61,8 @@ class ModelProvider(ABC):
             name: Tool name
             description: What the tool does
             parameters: JSON Schema for tool parameters
-            handler: Async function to execute the tool
+            handler: Function to execute the tool. Coroutine functions are
+                awaited; plain functions run in the default thread pool.
         """
         self._tools[name] = ToolDefinition(
             name=name,
@@ -97,7 +100,13 @@ class ModelProvider(ABC):
 
         tool = self._tools[tool_name]
         try:
-            result = await tool.handler(**arguments)
+            if inspect.iscoroutinefunction(tool.handler):
+                result = await tool.handler(**arguments)
+            else:
+                # Keep blocking handlers off the event loop
+                result = await asyncio.to_thread(tool.handler, **arguments)
+                if inspect.isawaitable(result):
+                    result = await result
             if isinstance(result, str):
                 return result
             import json
@@ -105,6 +114,21 @@ class ModelProvider(ABC):
         except Exception as e:
             return f"Error calling {tool_name}: {e}"
 
+    def prefix_cache_options(self, cache_key: str) -> dict[str, Any]:
+        """Get request options that let the backend reuse a cached prompt prefix.
+
+        The system prompt and firmware context are identical on every turn
+        of a session, so providers that support prompt caching can skip
+        re-processing them. Providers without such support return no options.
+
+        Args:
+            cache_key: Stable key identifying the prompt prefix
+
+        Returns:
+            Extra keyword arguments for complete()
+        """
+        return {}
+
     @abstractmethod
     async def complete(
         self,
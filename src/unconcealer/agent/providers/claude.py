@@ -171,6 +171,10 @@ class ClaudeProviderWithTools(ModelProvider):
             for tool in self._tools.values()
         ]
 
+    def prefix_cache_options(self, cache_key: str) -> dict[str, Any]:
+        """Mark the system prompt as a cache breakpoint."""
+        return {"cache_system_prompt": True}
+
     async def complete(
         self,
         messages: list[dict[str, Any]],
@@ -182,16 +186,25 @@ class ClaudeProviderWithTools(ModelProvider):
         Args:
             messages: Conversation history
             system_prompt: System instructions
-            **kwargs: Additional parameters
+            **kwargs: Additional parameters. ``cache_system_prompt=True``
+                sends the system prompt as an ephemeral cache block.
 
         Yields:
             CompletionChunk with text or tool calls
         """
         tools = self._convert_tools_to_anthropic() if self._tools else None
 
+        system: str | list[dict[str, Any]] = system_prompt
+        if kwargs.pop("cache_system_prompt", False):
+            system = [{
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"},
+            }]
+
         async with self.client.messages.stream(
             model=self.model,
-            system=system_prompt,
+            system=system,
             messages=messages,
             tools=tools,
             max_tokens=4096,
@@ -72,6 +72,10 @@ class OpenAICompatibleProvider(ModelProvider):
         )
         self.model = model
 
+    def prefix_cache_options(self, cache_key: str) -> dict[str, Any]:
+        """Route requests sharing a prefix to the same prompt cache."""
+        return {"extra_body": {"prompt_cache_key": cache_key}}
+
     async def complete(
         self,
         messages: list[dict[str, Any]],
@@ -24,6 +24,7 @@ Adding a new architecture:
     3. Register in ARCHITECTURES dict below
 """
 
+import functools
 from typing import Dict, Type
 
 from unconcealer.arch.base import (
@@ -67,9 +68,13 @@ ARCHITECTURES: Dict[str, Type[TargetArchitecture]] = {
 }
 
 
+@functools.lru_cache(maxsize=8)
 def get_architecture(name: str) -> TargetArchitecture:
     """Get an architecture handler by name.
 
+    Architecture handlers are stateless, so instances are cached and
+    shared between callers.
+
     Args:
         name: Architecture name (e.g., "cortex-m3", "riscv32")
 
@@ -93,9 +98,12 @@ def get_architecture(name: str) -> TargetArchitecture:
     return arch_class()
 
 
+@functools.lru_cache(maxsize=32)
 def detect_architecture(cpu: str, machine: str) -> str:
     """Auto-detect architecture from QEMU cpu/machine.
 
+    Results are cached per (cpu, machine) pair.
+
     Args:
         cpu: QEMU CPU type (e.g., "cortex-m3", "rv32")
         machine: QEMU machine type (e.g., "lm3s6965evb", "sifive_e")
@@ -6,11 +6,14 @@ implementations must follow, along with common data structures.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from unconcealer.core.session import DebugSession
 
+# Formats a 32-bit value as 0x-prefixed, zero-padded hex
+fmt32 = "0x{:08x}".format
+
 
 @dataclass
 class FaultState:
@@ -41,9 +44,7 @@ class FaultState:
                 f"0x{self.fault_address:08x}" if self.fault_address else None
             ),
             "is_valid": self.is_valid,
-            "raw_registers": {
-                k: f"0x{v:08x}" for k, v in self.raw_registers.items()
-            },
+            "raw_registers": {k: fmt32(v) for k, v in self.raw_registers.items()},
             "decoded": self.decoded,
         }
 
@@ -70,7 +71,7 @@ class ExceptionFrame:
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
-            "registers": {k: f"0x{v:08x}" for k, v in self.registers.items()},
+            "registers": {k: fmt32(v) for k, v in self.registers.items()},
             "return_address": f"0x{self.return_address:08x}",
             "stack_pointer": f"0x{self.stack_pointer:08x}",
             "frame_type": self.frame_type,
@@ -186,6 +187,10 @@ class TargetArchitecture(ABC):
     register_names: List[str] = []
     pointer_size: int = 4  # 4 for 32-bit, 8 for 64-bit
 
+    # Fixed (address, length) memory reads made by read_fault_state() and
+    # check_interrupt_config(), so callers can prefetch them in one batch
+    crash_regions: Tuple[Tuple[int, int], ...] = ()
+
     @abstractmethod
     async def read_fault_state(self, session: "DebugSession") -> FaultState:
         """Read and decode fault/exception state.
@@ -4,7 +4,8 @@ Provides fault analysis, NVIC configuration checking, and MPU decoding
 for ARM Cortex-M processors (M0, M0+, M3, M4, M7, M23, M33).
 """
 
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from unconcealer.arch.base import (
     TargetArchitecture,
@@ -69,6 +70,12 @@ class CortexMTarget(TargetArchitecture):
     MPU_RBAR = 0xE000ED9C
     MPU_RASR = 0xE000EDA0
 
+    crash_regions: Tuple[Tuple[int, int], ...] = (
+        (CFSR, 4), (HFSR, 4), (MMFAR, 4), (BFAR, 4),
+        (SHPR1, 4), (SHPR2, 4), (SHPR3, 4),
+        (NVIC_ISER_BASE, 4), (NVIC_ISPR_BASE, 4),
+    )
+
     def _decode_cfsr(self, value: int) -> Dict[str, str]:
         """Decode CFSR bits into human-readable messages."""
         decoded = {}
@@ -171,11 +178,13 @@ class CortexMTarget(TargetArchitecture):
         Returns:
             FaultState with decoded fault information
         """
-        # Read fault registers
-        cfsr_data = await session.read_memory(self.CFSR, 4)
-        hfsr_data = await session.read_memory(self.HFSR, 4)
-        mmfar_data = await session.read_memory(self.MMFAR, 4)
-        bfar_data = await session.read_memory(self.BFAR, 4)
+        # Read fault registers (issued together so the session can merge them)
+        cfsr_data, hfsr_data, mmfar_data, bfar_data = await asyncio.gather(
+            session.read_memory(self.CFSR, 4),
+            session.read_memory(self.HFSR, 4),
+            session.read_memory(self.MMFAR, 4),
+            session.read_memory(self.BFAR, 4),
+        )
 
         cfsr = int.from_bytes(cfsr_data, "little")
         hfsr = int.from_bytes(hfsr_data, "little")
@@ -278,9 +287,11 @@ class CortexMTarget(TargetArchitecture):
             InterruptAnalysis with configuration and warnings
         """
         # Read system handler priorities
-        shpr1_data = await session.read_memory(self.SHPR1, 4)
-        shpr2_data = await session.read_memory(self.SHPR2, 4)
-        shpr3_data = await session.read_memory(self.SHPR3, 4)
+        shpr1_data, shpr2_data, shpr3_data = await asyncio.gather(
+            session.read_memory(self.SHPR1, 4),
+            session.read_memory(self.SHPR2, 4),
+            session.read_memory(self.SHPR3, 4),
+        )
 
         shpr1 = int.from_bytes(shpr1_data, "little")
         shpr2 = int.from_bytes(shpr2_data, "little")
@@ -441,6 +452,12 @@ class CortexM0Target(CortexMTarget):
 
     name = "cortex-m0"
 
+    crash_regions: Tuple[Tuple[int, int], ...] = (
+        (CortexMTarget.HFSR, 4),
+        (CortexMTarget.SHPR1, 4), (CortexMTarget.SHPR2, 4), (CortexMTarget.SHPR3, 4),
+        (CortexMTarget.NVIC_ISER_BASE, 4), (CortexMTarget.NVIC_ISPR_BASE, 4),
+    )
+
     async def read_fault_state(self, session: "DebugSession") -> FaultState:
         """Read fault state for M0 (limited fault info)."""
         # M0 only has HFSR, no CFSR
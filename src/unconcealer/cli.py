@@ -1,18 +1,29 @@
 """Command-line interface for Unconcealer."""
 
-import asyncio
+import atexit
+import functools
+import hashlib
+import io
+import json
 import os
 import shutil
 import subprocess
 import sys
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import (
+    TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple,
+)
 
 import typer
 from rich.console import Console
-from rich.markdown import Markdown
-from rich.panel import Panel
-from rich.prompt import Prompt
+
+if TYPE_CHECKING:
+    from rich.panel import Panel
+
+    from unconcealer.agent.orchestrator import AgentOrchestrator
+    from unconcealer.core.session import DebugSession
 
 app = typer.Typer(
     name="unconcealer",
@@ -81,8 +92,11 @@ def mcp_server(
           }
         }
     """
+    import asyncio
     from unconcealer.mcp import run_stdio_server
 
+    _install_fast_loop()
+
     asyncio.run(
         run_stdio_server(
             gdb_path=gdb_path,
@@ -119,6 +133,177 @@ def _get_provider(
     return None
 
 
+HISTORY_PATH = Path.home() / ".unconcealer_history"
+
+
+def _make_line_reader(prompt: str) -> Callable[[], Awaitable[str]]:
+    """Create an async line reader for REPL input.
+
+    Uses prompt_toolkit (with line editing and persistent history) when it
+    is installed and stdin is a terminal, otherwise plain ``input()``.
+    Either way the prompt skips Rich's markup rendering on every turn.
+
+    Args:
+        prompt: Prompt text, e.g. ">"
+
+    Returns:
+        Coroutine function returning the next input line. Raises EOFError
+        or KeyboardInterrupt like ``input()``.
+    """
+    message = f"\x1b[1;36m{prompt}\x1b[0m " if sys.stdout.isatty() else f"{prompt} "
+
+    async def read_line() -> str:
+        return input(message)
+
+    if not sys.stdin.isatty():
+        return read_line
+
+    try:
+        from prompt_toolkit import PromptSession
+        from prompt_toolkit.formatted_text import ANSI
+        from prompt_toolkit.history import FileHistory
+    except ImportError:
+        return read_line
+
+    prompt_session: PromptSession[str] = PromptSession(
+        message=ANSI(message),
+        history=FileHistory(str(HISTORY_PATH)),
+    )
+    return prompt_session.prompt_async
+
+
+_elf_digests: Dict[Tuple[str, int], str] = {}
+
+
+def _elf_digest(elf: Path) -> str:
+    """Get the SHA-256 hex digest of an ELF, cached by path and mtime.
+
+    Args:
+        elf: Path to ELF binary
+
+    Returns:
+        Hex digest of the file contents
+    """
+    key = (str(elf.resolve()), elf.stat().st_mtime_ns)
+    digest = _elf_digests.get(key)
+    if digest is None:
+        with elf.open("rb") as f:
+            if hasattr(hashlib, "file_digest"):
+                digest = hashlib.file_digest(f, "sha256").hexdigest()
+            else:  # Python 3.10
+                h = hashlib.sha256()
+                for block in iter(lambda: f.read(1 << 16), b""):
+                    h.update(block)
+                digest = h.hexdigest()
+        _elf_digests[key] = digest
+    return digest
+
+
+def _install_fast_loop() -> None:
+    """Use uvloop (winloop on Windows) for asyncio.run() when it is installed."""
+    import asyncio
+
+    try:
+        if sys.platform == "win32":
+            import winloop as fast_loop
+        else:
+            import uvloop as fast_loop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(fast_loop.EventLoopPolicy())
+
+
+EXECUTOR_WORKERS = 4
+
+
+def _configure_executor() -> None:
+    """Give the running loop a small, dedicated default thread pool.
+
+    Blocking work (synchronous tool handlers, file I/O) is pushed to this
+    pool via ``asyncio.to_thread`` so the loop keeps streaming output.
+    """
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=EXECUTOR_WORKERS, thread_name_prefix="unconcealer")
+    )
+
+
+STREAM_FLUSH_INTERVAL = 0.05
+STREAM_FLUSH_CHARS = 256
+STREAM_QUEUE_SIZE = 64
+
+
+async def _stream_response(chunks: AsyncIterator[str]) -> str:
+    """Write streamed LLM output straight to stdout in batches.
+
+    A separate task pulls chunks from the model into a bounded queue, so
+    fetching the next chunk overlaps with writing the previous ones. Chunks
+    are buffered and flushed at the end of each line, or every
+    ``STREAM_FLUSH_INTERVAL`` seconds or ``STREAM_FLUSH_CHARS`` characters,
+    instead of going through Rich's render pipeline once per token.
+
+    Args:
+        chunks: Async iterator of text chunks
+
+    Returns:
+        The full response text
+
+    Raises:
+        Exception: Whatever the chunk iterator raised
+    """
+    import asyncio
+
+    queue: "asyncio.Queue[Optional[str]]" = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+    error: Optional[BaseException] = None
+
+    async def pump() -> None:
+        nonlocal error
+        try:
+            async for chunk in chunks:
+                await queue.put(chunk)
+        except Exception as e:
+            error = e
+        await queue.put(None)
+
+    producer = asyncio.create_task(pump())
+
+    response_text = io.StringIO()
+    buf: list[str] = []
+    buffered = 0
+    last = time.monotonic()
+
+    try:
+        while (chunk := await queue.get()) is not None:
+            response_text.write(chunk)
+            buf.append(chunk)
+            buffered += len(chunk)
+            now = time.monotonic()
+            if (
+                "\n" in chunk
+                or buffered > STREAM_FLUSH_CHARS
+                or now - last > STREAM_FLUSH_INTERVAL
+            ):
+                sys.stdout.write("".join(buf))
+                sys.stdout.flush()
+                buf.clear()
+                buffered = 0
+                last = now
+    finally:
+        if buf:
+            sys.stdout.write("".join(buf))
+            sys.stdout.flush()
+        if not producer.done():
+            producer.cancel()
+
+    await producer
+    if error is not None:
+        raise error
+
+    return response_text.getvalue()
+
+
 async def _run_debug_session(
     elf_path: Path,
     machine: str,
@@ -126,17 +311,26 @@ async def _run_debug_session(
     gdb_port: int,
     provider,
     model: Optional[str],
+    use_cache: bool = True,
+    elf_digest: Optional[str] = None,
+    provider_name: Optional[str] = None,
 ) -> None:
     """Run an interactive debug session."""
+    from rich.panel import Panel
     from unconcealer.core.session import DebugSession
+    from unconcealer.agent.cache import ResponseCache
     from unconcealer.agent.orchestrator import AgentOrchestrator
     from unconcealer.tools.qemu_control import QEMUConfig
 
+    _configure_executor()
+
     config = QEMUConfig(
         machine=machine,
         cpu=cpu,
         gdb_port=gdb_port,
     )
+    if elf_digest is None:
+        elf_digest = _elf_digest(elf_path)
 
     console.print(Panel(
         f"[bold]ELF:[/bold] {elf_path}\n"
@@ -155,14 +349,19 @@ async def _run_debug_session(
                 session=session,
                 provider=provider,
                 model=model,
+                prefix_cacheable=True,
+                elf_digest=elf_digest,
             )
+            cache = ResponseCache() if use_cache else None
 
             console.print("[green]Session started. Type your questions or commands.[/green]")
             console.print("[dim]Type 'exit' or 'quit' to end the session.[/dim]\n")
+            read_line = _make_line_reader(">")
+            turn_chain = ""
 
             while True:
                 try:
-                    user_input = Prompt.ask("[bold cyan]>[/bold cyan]")
+                    user_input = await read_line()
                 except (KeyboardInterrupt, EOFError):
                     console.print("\n[yellow]Exiting...[/yellow]")
                     break
@@ -182,10 +381,27 @@ async def _run_debug_session(
                 # Stream response from LLM
                 console.print()
                 try:
-                    response_text = []
-                    async for chunk in orchestrator.query_stream(user_input):
-                        console.print(chunk, end="")
-                        response_text.append(chunk)
+                    if cache is None:
+                        await _stream_response(orchestrator.query_stream(user_input))
+                    else:
+                        history_len = len(orchestrator.conversation_history)
+                        if history_len == 0:
+                            turn_chain = ""  # fresh or /clear'ed conversation
+                        # Answers depend on where the target is stopped, and
+                        # /step, /continue and /restore don't enter the chain
+                        regs = await session.read_registers(["pc"])
+                        key = cache.make_key(
+                            elf_digest, user_input, model=model, context=turn_chain,
+                            provider=provider_name,
+                            target_state=f"{session.run_generation}:{regs.get('pc')}",
+                        )
+                        text = await _stream_response(cache.stream(
+                            key, lambda: orchestrator.query_stream(user_input)
+                        ))
+                        if len(orchestrator.conversation_history) == history_len:
+                            # Served from cache: keep the provider's history in step
+                            orchestrator.record_turn(user_input, text)
+                        turn_chain = cache.chain_turn(turn_chain, user_input)
                     console.print("\n")
 
                 except Exception as e:
@@ -196,96 +412,191 @@ async def _run_debug_session(
         raise typer.Exit(1)
 
 
-async def _handle_command(cmd: str, orchestrator, session) -> None:
-    """Handle special /commands."""
-    parts = cmd[1:].split(maxsplit=1)
-    command = parts[0].lower()
+_STATE_CACHE_SIZE = 32
+_state_cache: "OrderedDict[Tuple[Any, ...], Any]" = OrderedDict()
 
-    if command == "help":
-        console.print(Panel(
-            "[bold]/help[/bold] - Show this help\n"
-            "[bold]/regs[/bold] - Show all registers\n"
-            "[bold]/mem <addr> [size][/bold] - Read memory\n"
-            "[bold]/bt[/bold] - Show backtrace\n"
-            "[bold]/snapshot <name>[/bold] - Save snapshot\n"
-            "[bold]/restore <name>[/bold] - Restore snapshot\n"
-            "[bold]/findings[/bold] - Show recorded findings\n"
-            "[bold]/clear[/bold] - Clear conversation history",
-            title="Commands",
-        ))
-
-    elif command == "regs":
-        try:
-            regs = await session.read_registers()
-            console.print("[bold]Registers:[/bold]")
-            for name, value in sorted(regs.items()):
-                console.print(f"  {name:6} = 0x{value:08x}")
-        except Exception as e:
-            console.print(f"[red]Error reading registers: {e}[/red]")
 
-    elif command == "bt":
-        try:
-            bt = await session.get_backtrace(10)
-            console.print("[bold]Backtrace:[/bold]")
-            for i, frame in enumerate(bt):
-                func = frame.get("func", "??")
-                addr = frame.get("addr", "??")
-                console.print(f"  #{i} {addr} in {func}")
-        except Exception as e:
-            console.print(f"[red]Error getting backtrace: {e}[/red]")
+async def _cached_read(
+    session: "DebugSession", key: Tuple[Any, ...], read: Callable[[], Awaitable[Any]]
+) -> Any:
+    """Memoize a target read until the session's run generation changes.
 
-    elif command == "mem":
-        if len(parts) < 2:
-            console.print("[red]Usage: /mem <address> [size][/red]")
-            return
-        args = parts[1].split()
-        try:
-            addr = int(args[0], 0)
-            size = int(args[1], 0) if len(args) > 1 else 16
-            data = await session.read_memory(addr, size)
-            console.print(f"[bold]Memory at 0x{addr:08x}:[/bold]")
-            console.print(f"  {data.hex()}")
-        except Exception as e:
-            console.print(f"[red]Error reading memory: {e}[/red]")
+    Args:
+        session: Debug session (provides ``run_generation``)
+        key: What is being read, e.g. ("mem", addr, size)
+        read: Coroutine function performing the actual read
 
-    elif command == "snapshot":
-        if len(parts) < 2:
-            console.print("[red]Usage: /snapshot <name>[/red]")
-            return
-        name = parts[1]
-        try:
-            await session.qemu.save_snapshot(name)
-            orchestrator.record_snapshot(name)
-            console.print(f"[green]Saved snapshot: {name}[/green]")
-        except Exception as e:
-            console.print(f"[red]Error saving snapshot: {e}[/red]")
+    Returns:
+        Cached or freshly read value
+    """
+    full_key = (id(session), session.run_generation) + key
+    if full_key in _state_cache:
+        _state_cache.move_to_end(full_key)
+        return _state_cache[full_key]
+
+    value = await read()
+    _state_cache[full_key] = value
+    if len(_state_cache) > _STATE_CACHE_SIZE:
+        _state_cache.popitem(last=False)
+    return value
+
+
+@functools.lru_cache(maxsize=1)
+def _repl_help_panel() -> "Panel":
+    """Build the REPL /help panel once and reuse it."""
+    from rich.panel import Panel
+
+    return Panel(
+        "[bold]/help[/bold] - Show this help\n"
+        "[bold]/regs[/bold] - Show all registers\n"
+        "[bold]/mem <addr> \\[size][/bold] - Read memory\n"
+        "[bold]/bt[/bold] - Show backtrace\n"
+        "[bold]/snapshot <name>[/bold] - Save snapshot\n"
+        "[bold]/restore <name>[/bold] - Restore snapshot\n"
+        "[bold]/findings[/bold] - Show recorded findings\n"
+        "[bold]/clear[/bold] - Clear conversation history",
+        title="Commands",
+    )
 
-    elif command == "restore":
-        if len(parts) < 2:
-            console.print("[red]Usage: /restore <name>[/red]")
-            return
-        name = parts[1]
-        try:
-            await session.qemu.load_snapshot(name)
-            console.print(f"[green]Restored snapshot: {name}[/green]")
-        except Exception as e:
-            console.print(f"[red]Error restoring snapshot: {e}[/red]")
 
-    elif command == "findings":
-        findings = orchestrator.findings
-        if not findings:
-            console.print("[dim]No findings recorded yet.[/dim]")
-        else:
-            console.print("[bold]Findings:[/bold]")
-            for f in findings:
-                console.print(f"  [{f.severity}] {f.description}")
+async def _cmd_help(
+    args: str, orchestrator: "AgentOrchestrator", session: "DebugSession"
+) -> None:
+    """Show REPL command help."""
+    console.print(_repl_help_panel())
 
-    elif command == "clear":
-        orchestrator.clear_history()
-        console.print("[green]Conversation history cleared.[/green]")
 
-    else:
+async def _cmd_regs(
+    args: str, orchestrator: "AgentOrchestrator", session: "DebugSession"
+) -> None:
+    """Show all registers."""
+    try:
+        snap = await _cached_read(session, ("regs",), session.read_register_snapshot)
+        console.print("[bold]Registers:[/bold]")
+        console.print(
+            "\n".join(
+                f"  {name:6} = 0x{value:08x}" for name, value in zip(snap.names, snap.values)
+            ),
+            markup=False,
+            highlight=False,
+        )
+    except Exception as e:
+        console.print(f"[red]Error reading registers: {e}[/red]")
+
+
+async def _cmd_bt(
+    args: str, orchestrator: "AgentOrchestrator", session: "DebugSession"
+) -> None:
+    """Show the backtrace."""
+    try:
+        bt = await _cached_read(session, ("bt", 10), lambda: session.get_backtrace(10))
+        console.print("[bold]Backtrace:[/bold]")
+        _print_frames(bt)
+    except Exception as e:
+        console.print(f"[red]Error getting backtrace: {e}[/red]")
+
+
+async def _cmd_mem(
+    args: str, orchestrator: "AgentOrchestrator", session: "DebugSession"
+) -> None:
+    """Read memory: /mem <addr> [size]."""
+    if not args:
+        console.print("[red]Usage: /mem <address> \\[size][/red]")
+        return
+    argv = args.split()
+    try:
+        addr = int(argv[0], 0)
+        size = int(argv[1], 0) if len(argv) > 1 else 16
+        data = await _cached_read(
+            session, ("mem", addr, size), lambda: session.read_memory(addr, size)
+        )
+        console.print(f"[bold]Memory at 0x{addr:08x}:[/bold]")
+        mv = memoryview(data)
+        write = sys.stdout.write
+        for off in range(0, len(mv), 16):
+            write(f"  0x{addr + off:08x}: {mv[off:off + 16].hex(' ')}\n")
+        sys.stdout.flush()
+    except Exception as e:
+        console.print(f"[red]Error reading memory: {e}[/red]")
+
+
+async def _cmd_snapshot(
+    args: str, orchestrator: "AgentOrchestrator", session: "DebugSession"
+) -> None:
+    """Save a snapshot: /snapshot <name>."""
+    if not args:
+        console.print("[red]Usage: /snapshot <name>[/red]")
+        return
+    try:
+        await session.save_snapshot(args)
+        orchestrator.record_snapshot(args)
+        console.print(f"[green]Saved snapshot: {args}[/green]")
+    except Exception as e:
+        console.print(f"[red]Error saving snapshot: {e}[/red]")
+
+
+async def _cmd_restore(
+    args: str, orchestrator: "AgentOrchestrator", session: "DebugSession"
+) -> None:
+    """Restore a snapshot: /restore <name>."""
+    if not args:
+        console.print("[red]Usage: /restore <name>[/red]")
+        return
+    try:
+        await session.load_snapshot(args)
+        console.print(f"[green]Restored snapshot: {args}[/green]")
+    except Exception as e:
+        console.print(f"[red]Error restoring snapshot: {e}[/red]")
+
+
+async def _cmd_findings(
+    args: str, orchestrator: "AgentOrchestrator", session: "DebugSession"
+) -> None:
+    """Show recorded findings."""
+    if not orchestrator.findings:
+        console.print("[dim]No findings recorded yet.[/dim]")
+        return
+    console.print("[bold]Findings:[/bold]")
+    console.print(orchestrator.render_findings(), markup=False, highlight=False)
+
+
+async def _cmd_clear(
+    args: str, orchestrator: "AgentOrchestrator", session: "DebugSession"
+) -> None:
+    """Clear conversation history."""
+    orchestrator.clear_history()
+    console.print("[green]Conversation history cleared.[/green]")
+
+
+# REPL /command handler: (argument text, orchestrator, session)
+ReplCommand = Callable[[str, "AgentOrchestrator", "DebugSession"], Awaitable[None]]
+
+_COMMANDS: Dict[str, ReplCommand] = {
+    "help": _cmd_help,
+    "regs": _cmd_regs,
+    "bt": _cmd_bt,
+    "mem": _cmd_mem,
+    "snapshot": _cmd_snapshot,
+    "restore": _cmd_restore,
+    "findings": _cmd_findings,
+    "clear": _cmd_clear,
+}
+
+
+async def _handle_command(
+    cmd: str, orchestrator: "AgentOrchestrator", session: "DebugSession"
+) -> None:
+    """Handle special /commands."""
+    parts = cmd[1:].split(maxsplit=1)
+    if not parts:
+        parts = [""]
+    command = parts[0].lower()
+
+    handler = _COMMANDS.get(command)
+    if handler is None:
         console.print(f"[red]Unknown command: {command}. Type /help for help.[/red]")
+        return
+    await handler(parts[1] if len(parts) > 1 else "", orchestrator, session)
 
 
 # ============================================================================
@@ -293,6 +604,55 @@ async def _handle_command(cmd: str, orchestrator, session) -> None:
 # ============================================================================
 
 
+def _print_frames(frames: List[Dict[str, Any]]) -> None:
+    """Print backtrace frames as a single block.
+
+    Rendering the whole backtrace in one ``console.print`` with markup and
+    highlighting disabled avoids running Rich's highlighter per frame.
+    """
+    if not frames:
+        return
+    lines = [
+        f"  #{f.get('level', 0):<2} 0x{f.get('addr', 0):08x} in {f.get('func', '??')}"
+        for f in frames
+    ]
+    console.print("\n".join(lines), markup=False, highlight=False)
+
+
+@functools.lru_cache(maxsize=1)
+def _shell_help_panel() -> "Panel":
+    """Build the shell help panel once and reuse it."""
+    from rich.panel import Panel
+
+    return Panel(
+        "[bold]Session:[/bold]\n"
+        "  exit, quit, q     - Exit shell\n\n"
+        "[bold]Registers:[/bold]\n"
+        "  regs              - Show all registers\n"
+        "  reg <name>        - Show single register\n\n"
+        "[bold]Memory:[/bold]\n"
+        "  mem <addr> \\[len]  - Read memory (hex or symbol)\n"
+        "  write <addr> <hex> - Write memory\n\n"
+        "[bold]Execution:[/bold]\n"
+        "  c, continue       - Continue execution\n"
+        "  s, step           - Single step\n"
+        "  n, next           - Step over\n"
+        "  halt              - Halt execution\n"
+        "  reset             - Reset target\n\n"
+        "[bold]Breakpoints:[/bold]\n"
+        "  b, break <loc>    - Set breakpoint\n"
+        "  del <num>         - Delete breakpoint\n\n"
+        "[bold]Analysis:[/bold]\n"
+        "  bt                - Backtrace\n"
+        "  p, print <expr>   - Evaluate expression\n"
+        "  fault             - Show fault registers\n\n"
+        "[bold]Snapshots:[/bold]\n"
+        "  snap <name>       - Save snapshot\n"
+        "  restore <name>    - Load snapshot",
+        title="Commands",
+    )
+
+
 async def _handle_shell_command(cmd: str, session) -> bool:
     """Handle shell commands. Returns False if should exit."""
     cmd = cmd.strip()
@@ -309,33 +669,7 @@ async def _handle_shell_command(cmd: str, session) -> bool:
 
     try:
         if command in ("help", "?"):
-            console.print(Panel(
-                "[bold]Session:[/bold]\n"
-                "  exit, quit, q     - Exit shell\n\n"
-                "[bold]Registers:[/bold]\n"
-                "  regs              - Show all registers\n"
-                "  reg <name>        - Show single register\n\n"
-                "[bold]Memory:[/bold]\n"
-                "  mem <addr> [len]  - Read memory (hex or symbol)\n"
-                "  write <addr> <hex> - Write memory\n\n"
-                "[bold]Execution:[/bold]\n"
-                "  c, continue       - Continue execution\n"
-                "  s, step           - Single step\n"
-                "  n, next           - Step over\n"
-                "  halt              - Halt execution\n"
-                "  reset             - Reset target\n\n"
-                "[bold]Breakpoints:[/bold]\n"
-                "  b, break <loc>    - Set breakpoint\n"
-                "  del <num>         - Delete breakpoint\n\n"
-                "[bold]Analysis:[/bold]\n"
-                "  bt                - Backtrace\n"
-                "  p, print <expr>   - Evaluate expression\n"
-                "  fault             - Show fault registers\n\n"
-                "[bold]Snapshots:[/bold]\n"
-                "  snap <name>       - Save snapshot\n"
-                "  restore <name>    - Load snapshot",
-                title="Commands",
-            ))
+            console.print(_shell_help_panel())
 
         elif command == "regs":
             regs = await session.read_registers()
@@ -357,8 +691,8 @@ async def _handle_shell_command(cmd: str, session) -> bool:
                 addr_str = mem_args[0]
                 length = int(mem_args[1], 0) if len(mem_args) > 1 else 64
 
-                if addr_str.startswith("0x") or addr_str.startswith("0X"):
-                    addr = int(addr_str, 16)
+                if addr_str[:2] in ("0x", "0X"):
+                    addr = int(addr_str, 0)
                 else:
                     result = await session.evaluate(f"&{addr_str}")
                     addr = int(result.split()[0], 0)
@@ -430,11 +764,7 @@ async def _handle_shell_command(cmd: str, session) -> bool:
 
         elif command == "bt":
             frames = await session.get_backtrace(20)
-            for frame in frames:
-                level = frame.get("level", 0)
-                addr = frame.get("addr", 0)
-                func = frame.get("func", "??")
-                console.print(f"  #{level:<2} 0x{addr:08x} in {func}")
+            _print_frames(frames)
 
         elif command in ("p", "print"):
             if not args_str:
@@ -498,6 +828,7 @@ async def _run_shell_session(
     gdb_path: str,
 ) -> None:
     """Run a headless interactive shell session."""
+    from rich.panel import Panel
     from unconcealer.core.session import DebugSession
     from unconcealer.tools.qemu_control import QEMUConfig
 
@@ -522,10 +853,11 @@ async def _run_shell_session(
             gdb_path=gdb_path,
         ) as session:
             console.print("[green]Session started. Type 'help' for commands.[/green]\n")
+            read_line = _make_line_reader("unc>")
 
             while True:
                 try:
-                    user_input = Prompt.ask("[bold cyan]unc>[/bold cyan]")
+                    user_input = await read_line()
                 except (KeyboardInterrupt, EOFError):
                     console.print("\n[yellow]Exiting...[/yellow]")
                     break
@@ -549,6 +881,8 @@ def shell(
     gdb_path: str = typer.Option("gdb-multiarch", help="Path to GDB executable"),
 ) -> None:
     """Start a headless interactive debugging shell (no LLM required)."""
+    import asyncio
+
     if not elf.exists():
         console.print(f"[red]Error: ELF file not found: {elf}[/red]")
         raise typer.Exit(1)
@@ -577,6 +911,7 @@ async def _run_test_session(
     verbose: bool,
 ) -> bool:
     """Run automated test session. Returns True if all tests pass."""
+    from rich.panel import Panel
     from unconcealer.core.session import DebugSession
     from unconcealer.tools.qemu_control import QEMUConfig
     from unconcealer.arch import get_architecture, detect_architecture
@@ -647,11 +982,7 @@ async def _run_test_session(
             bt = await session.get_backtrace(5)
             if bt:
                 console.print("\n[bold]Backtrace:[/bold]")
-                for frame in bt:
-                    level = frame.get("level", 0)
-                    addr = frame.get("addr", 0)
-                    func = frame.get("func", "??")
-                    console.print(f"  #{level} 0x{addr:08x} in {func}")
+                _print_frames(bt)
         except Exception:
             pass
 
@@ -818,6 +1149,9 @@ def test(
         unconcealer test firmware.elf --quick
         unconcealer test firmware.elf --verbose
     """
+    import asyncio
+    from rich.panel import Panel
+
     if not elf.exists():
         console.print(f"[red]Error: ELF file not found: {elf}[/red]")
         raise typer.Exit(1)
@@ -854,14 +1188,20 @@ def debug(
     model: Optional[str] = typer.Option(None, help="Model name"),
     base_url: Optional[str] = typer.Option(None, envvar="OPENAI_BASE_URL", help="API base URL (for openai provider)"),
     api_key: Optional[str] = typer.Option(None, envvar="OPENAI_API_KEY", help="API key (for openai provider)"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Do not reuse cached LLM responses"),
 ) -> None:
     """Start an interactive debugging session with AI assistance."""
+    import asyncio
+
     if not elf.exists():
         console.print(f"[red]Error: ELF file not found: {elf}[/red]")
         raise typer.Exit(1)
 
+    elf_digest = _elf_digest(elf)
     llm_provider = _get_provider(provider, base_url, model, api_key)
 
+    _install_fast_loop()
+
     asyncio.run(_run_debug_session(
         elf_path=elf,
         machine=machine,
@@ -869,17 +1209,63 @@ def debug(
         gdb_port=gdb_port,
         provider=llm_provider,
         model=model,
+        use_cache=not no_cache,
+        elf_digest=elf_digest,
+        provider_name=provider,
     ))
 
 
+def _fault_prompt(fault: str) -> str:
+    """Get the analysis prompt for a fault type.
+
+    Args:
+        fault: Fault type name (case-insensitive)
+
+    Returns:
+        Prompt text for the LLM
+    """
+    match fault.lower():
+        case "hardfault":
+            return (
+                "Analyze this firmware for a HardFault. Check the fault status registers "
+                "(CFSR, HFSR, MMFAR, BFAR) and determine the cause."
+            )
+        case "busfault":
+            return (
+                "Analyze this firmware for a BusFault. Check memory access patterns "
+                "and the BFAR register."
+            )
+        case "memfault":
+            return (
+                "Analyze this firmware for a MemManage fault. Check the MPU configuration "
+                "and MMFAR."
+            )
+        case "usagefault":
+            return (
+                "Analyze this firmware for a UsageFault. Check for undefined instructions, "
+                "unaligned access, or division by zero."
+            )
+        case "stackoverflow":
+            return (
+                "Analyze this firmware for stack overflow. Check SP against stack boundaries "
+                "and look for deep recursion."
+            )
+        case _:
+            return f"Analyze this firmware for: {fault}"
+
+
 @app.command()
 def analyze(
     elf: Path = typer.Argument(..., help="Path to ELF binary"),
     fault: str = typer.Option("hardfault", help="Fault type to analyze"),
     provider: str = typer.Option("claude", help="LLM provider (claude, openai)"),
     model: Optional[str] = typer.Option(None, help="Model name"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Do not reuse cached LLM responses"),
 ) -> None:
     """Analyze a crash dump or fault condition."""
+    import asyncio
+    from rich.panel import Panel
+
     if not elf.exists():
         console.print(f"[red]Error: ELF file not found: {elf}[/red]")
         raise typer.Exit(1)
@@ -891,20 +1277,14 @@ def analyze(
     ))
 
     # Build the analysis prompt
-    prompts = {
-        "hardfault": "Analyze this firmware for a HardFault. Check the fault status registers (CFSR, HFSR, MMFAR, BFAR) and determine the cause.",
-        "busfault": "Analyze this firmware for a BusFault. Check memory access patterns and the BFAR register.",
-        "memfault": "Analyze this firmware for a MemManage fault. Check the MPU configuration and MMFAR.",
-        "usagefault": "Analyze this firmware for a UsageFault. Check for undefined instructions, unaligned access, or division by zero.",
-        "stackoverflow": "Analyze this firmware for stack overflow. Check SP against stack boundaries and look for deep recursion.",
-    }
-
-    prompt = prompts.get(fault.lower(), f"Analyze this firmware for: {fault}")
+    prompt = _fault_prompt(fault)
 
     async def run_analysis():
         from unconcealer.core.session import DebugSession
+        from unconcealer.agent.cache import ResponseCache
         from unconcealer.agent.orchestrator import AgentOrchestrator
 
+        _configure_executor()
         llm_provider = _get_provider(provider, None, model, None)
 
         async with DebugSession(elf_path=str(elf)) as session:
@@ -915,15 +1295,34 @@ def analyze(
             )
 
             console.print("[bold]Analysis:[/bold]\n")
-            async for chunk in orchestrator.query_stream(prompt):
-                console.print(chunk, end="")
+            findings = None
+            if no_cache:
+                await _stream_response(orchestrator.query_stream(prompt))
+            else:
+                cache = ResponseCache()
+                key = cache.make_key(
+                    _elf_digest(elf), prompt, model=model, fault=fault.lower(),
+                    provider=provider,
+                )
+                await _stream_response(cache.stream(
+                    key,
+                    lambda: orchestrator.query_stream(prompt),
+                    extras=lambda: (
+                        {"findings": orchestrator.render_findings()}
+                        if orchestrator.findings else {}
+                    ),
+                ))
+                # A hit never runs the orchestrator; replay its findings
+                findings = cache.get_extras(key).get("findings")
             console.print("\n")
 
             if orchestrator.findings:
+                findings = orchestrator.render_findings()
+            if findings:
                 console.print("[bold]Findings:[/bold]")
-                for f in orchestrator.findings:
-                    console.print(f"  [{f.severity}] {f.description}")
+                console.print(findings, markup=False, highlight=False)
 
+    _install_fast_loop()
     try:
         asyncio.run(run_analysis())
     except Exception as e:
@@ -931,9 +1330,78 @@ def analyze(
         raise typer.Exit(1)
 
 
+# ============================================================================
+# Doctor Command
+# ============================================================================
+
+DOCTOR_CACHE_PATH = Path(
+    os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+) / "unconcealer" / "doctor.json"
+
+_version_cache: Optional[Dict[str, Dict[str, object]]] = None
+
+
+def _load_version_cache() -> Dict[str, Dict[str, object]]:
+    """Load the on-disk ``--version`` cache, registering the atexit writer once."""
+    global _version_cache
+    if _version_cache is None:
+        try:
+            with open(DOCTOR_CACHE_PATH) as f:
+                data = json.load(f)
+            _version_cache = data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            _version_cache = {}
+        atexit.register(_save_version_cache)
+    return _version_cache
+
+
+def _save_version_cache() -> None:
+    """Persist the ``--version`` cache (best effort)."""
+    if not _version_cache:
+        return
+    try:
+        DOCTOR_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(DOCTOR_CACHE_PATH, "w") as f:
+            json.dump(_version_cache, f, indent=2)
+    except OSError:
+        pass
+
+
+def _cached_version(exe: str) -> str:
+    """Get the first line of ``exe --version``, cached by path and mtime.
+
+    The executable is only spawned when it is not in the cache or its
+    modification time changed since the last probe.
+
+    Args:
+        exe: Path to the executable
+
+    Returns:
+        First line of the version output, or "unknown"
+
+    Raises:
+        OSError: If the executable cannot be stat'ed or run
+        subprocess.SubprocessError: If the version probe fails
+    """
+    mtime = os.path.getmtime(exe)
+    cache = _load_version_cache()
+    entry = cache.get(exe)
+    if entry is not None and entry.get("mtime") == mtime:
+        return str(entry.get("version", "unknown"))
+
+    result = subprocess.run(
+        [exe, "--version"],
+        capture_output=True, text=True, timeout=5
+    )
+    version_line = result.stdout.split("\n")[0] if result.stdout else "unknown"
+    cache[exe] = {"mtime": mtime, "version": version_line}
+    return version_line
+
+
 @app.command()
 def doctor() -> None:
     """Check system dependencies and installation health."""
+    from rich.panel import Panel
     from unconcealer import __version__
 
     console.print(Panel(
@@ -955,11 +1423,7 @@ def doctor() -> None:
     qemu_arm = shutil.which("qemu-system-arm")
     if qemu_arm:
         try:
-            result = subprocess.run(
-                [qemu_arm, "--version"],
-                capture_output=True, text=True, timeout=5
-            )
-            version_line = result.stdout.split("\n")[0] if result.stdout else "unknown"
+            version_line = _cached_version(qemu_arm)
             console.print(f"[green]✓[/green] qemu-system-arm ({version_line})")
         except Exception:
             console.print(f"[green]✓[/green] qemu-system-arm (at {qemu_arm})")
@@ -977,19 +1441,16 @@ def doctor() -> None:
     # GDB
     gdb_options = ["gdb-multiarch", "arm-none-eabi-gdb", "riscv64-unknown-elf-gdb", "gdb"]
     gdb_found = None
+    gdb_path = None
     for gdb_name in gdb_options:
         gdb_path = shutil.which(gdb_name)
         if gdb_path:
             gdb_found = gdb_name
             break
 
-    if gdb_found:
+    if gdb_found and gdb_path:
         try:
-            result = subprocess.run(
-                [gdb_found, "--version"],
-                capture_output=True, text=True, timeout=5
-            )
-            version_line = result.stdout.split("\n")[0] if result.stdout else "unknown"
+            version_line = _cached_version(gdb_path)
             console.print(f"[green]✓[/green] GDB: {gdb_found} ({version_line})")
         except Exception:
             console.print(f"[green]✓[/green] GDB: {gdb_found}")
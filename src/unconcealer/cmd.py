@@ -14,22 +14,65 @@ Usage:
     unconcealer-cmd stop_session
 
 Session state is stored in /tmp/unconcealer-cmd/sessions/
+
+For scripted use, start a daemon once and point clients at it so each
+command is a socket round-trip instead of a fresh Python process:
+    unconcealer-cmd --daemon &
+    export UNCONCEALER_DAEMON_SOCK=/tmp/unconcealer-cmd/daemon.sock
 """
 
 import argparse
 import asyncio
-import json
+import functools
 import os
 import signal
+import socket
+import subprocess
 import sys
-from dataclasses import asdict, dataclass
+import time
+import zlib
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import (
+    TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple,
+)
+
+from unconcealer import jsoncodec
+from unconcealer.arch.base import fmt32
+from unconcealer.toolutil import hex_dump, resolve_address
+
+if TYPE_CHECKING:
+    from unconcealer.tools.gdb_bridge import GDBBridge
 
 # Session state directory
 SESSION_DIR = Path(os.environ.get("UNCONCEALER_SESSION_DIR", "/tmp/unconcealer-cmd/sessions"))
 
+# String form of SESSION_DIR for the per-command path helpers, which skip Path
+_SESSION_DIR_STR = str(SESSION_DIR)
+
+# How long start_session waits for the session's GDB server to come up
+GDB_SERVER_READY_TIMEOUT = 30.0
+
+# How long a client waits for the GDB server to answer one request
+GDB_SERVER_REPLY_TIMEOUT = 60.0
+
+# How long a client waits to connect to the daemon before running in-process,
+# and for the daemon's reply (longer than the GDB server waits above, so
+# those report their own errors first)
+DAEMON_CONNECT_TIMEOUT = 5.0
+DAEMON_REPLY_TIMEOUT = GDB_SERVER_READY_TIMEOUT + GDB_SERVER_REPLY_TIMEOUT
+
+
+@functools.lru_cache(maxsize=16)
+def _load_state_file(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a session state file (cache key includes mtime and size)."""
+    with open(path, "rb") as f:
+        data = jsoncodec.loads(f.read())
+    if not isinstance(data, dict):
+        raise ValueError(f"Session state file {path} does not hold an object")
+    return data
+
 
 @dataclass
 class SessionState:
@@ -43,35 +86,94 @@ class SessionState:
     qemu_pid: int
     architecture: str
     created_at: str
-
-    def to_file(self, path: Path) -> None:
-        """Save state to JSON file."""
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w") as f:
-            json.dump(asdict(self), f, indent=2)
+    # Persistent GDB server (0 / "" when tools attach a fresh GDB per call)
+    gdb_pid: int = 0
+    gdb_socket: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert state to a JSON-serializable dict."""
+        return {
+            "name": self.name,
+            "elf_path": self.elf_path,
+            "machine": self.machine,
+            "cpu": self.cpu,
+            "gdb_port": self.gdb_port,
+            "qmp_port": self.qmp_port,
+            "qemu_pid": self.qemu_pid,
+            "architecture": self.architecture,
+            "created_at": self.created_at,
+            "gdb_pid": self.gdb_pid,
+            "gdb_socket": self.gdb_socket,
+        }
+
+    def to_file(self, path: str) -> None:
+        """Save state to JSON file, creating its directory if it is missing."""
+        text = jsoncodec.dumps_pretty(self.to_dict())
+        try:
+            f = open(path, "w")
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            f = open(path, "w")
+        with f:
+            f.write(text)
 
     @classmethod
-    def from_file(cls, path: Path) -> "SessionState":
-        """Load state from JSON file."""
-        with open(path) as f:
-            data = json.load(f)
-        return cls(**data)
+    def from_file(cls, path: str) -> "SessionState":
+        """Load state from JSON file.
+
+        Parsed contents are cached per (path, mtime, size), so repeated loads
+        of an unchanged file skip the read and parse.
+        """
+        st = os.stat(path)
+        return cls(**_load_state_file(path, st.st_mtime_ns, st.st_size))
 
 
-def get_session_file(name: str = "default") -> Path:
-    """Get path to session state file."""
-    return SESSION_DIR / f"{name}.json"
+@functools.lru_cache(maxsize=32)
+def get_session_file(name: str = "default") -> str:
+    """Get path to session state file (memoized per process)."""
+    return f"{_SESSION_DIR_STR}/{name}.json"
+
+
+def get_qemu_log(name: str = "default") -> str:
+    """Get path to a session's QEMU output log."""
+    return f"{_SESSION_DIR_STR}/{name}.qemu.log"
+
+
+def get_gdb_socket(name: str = "default") -> str:
+    """Get path to a session's GDB server socket."""
+    return f"{_SESSION_DIR_STR}/{name}.gdb.sock"
+
+
+def _unlink(path: str) -> None:
+    """Remove a file if it exists."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
 
 
 def list_sessions() -> List[str]:
     """List available session names."""
-    if not SESSION_DIR.exists():
+    try:
+        with os.scandir(_SESSION_DIR_STR) as entries:
+            return [e.name[:-5] for e in entries if e.name.endswith(".json") and e.is_file()]
+    except FileNotFoundError:
         return []
-    return [f.stem for f in SESSION_DIR.glob("*.json")]
 
 
 def is_process_running(pid: int) -> bool:
-    """Check if a process is running."""
+    """Check if a process is running.
+
+    Exited children of this process (QEMU and GDB servers started by the
+    daemon) are reaped here; as zombies they would still pass kill(pid, 0).
+    """
+    if pid <= 0:
+        return False
+    try:
+        if os.waitpid(pid, os.WNOHANG)[0] == pid:
+            return False
+    except ChildProcessError:
+        pass  # Not our child; its parent reaps it
     try:
         os.kill(pid, 0)
         return True
@@ -79,6 +181,85 @@ def is_process_running(pid: int) -> bool:
         return False
 
 
+async def _wait_for_exit(pid: int, timeout: float) -> bool:
+    """Poll until a process has exited (reaping it if it is our child).
+
+    Returns:
+        True if the process exited within the timeout
+    """
+    deadline = time.monotonic() + timeout
+    while is_process_running(pid):
+        if time.monotonic() >= deadline:
+            return False
+        await asyncio.sleep(0.05)
+    return True
+
+
+class SessionProxy:
+    """Minimal session-like wrapper around a GDBBridge for the arch tools.
+
+    Values fetched with read_registers_and_memory() are served from memory
+    by later reads, so arch code can be handed a prefetched batch.
+    """
+
+    def __init__(self, gdb_bridge: "GDBBridge") -> None:
+        self.gdb = gdb_bridge
+        self._registers: Dict[str, int] = {}
+        self._memory: Dict[Tuple[int, int], bytes] = {}
+
+    async def read_registers_and_memory(
+        self, registers: List[str], regions: Sequence[Tuple[int, int]]
+    ) -> Tuple[Dict[str, int], List[bytes]]:
+        regs, memory = await self.gdb.read_registers_and_memory(registers, regions)
+        self._registers.update(regs)
+        self._memory.update(zip(regions, memory))
+        return regs, memory
+
+    async def read_memory(self, addr: int, length: int) -> bytes:
+        cached = self._memory.get((addr, length))
+        if cached is not None:
+            return cached
+        return await self.gdb.read_memory(addr, length)
+
+    async def read_memory_word(self, addr: int) -> int:
+        return int.from_bytes(await self.read_memory(addr, 4), "little")
+
+    async def read_registers(self, names: Optional[List[str]] = None) -> Dict[str, int]:
+        if names and all(n in self._registers for n in names):
+            return {n: self._registers[n] for n in names}
+        return await self.gdb.read_registers(names)
+
+    async def read_register(self, name: str) -> int:
+        if name in self._registers:
+            return self._registers[name]
+        return await self.gdb.read_register(name)
+
+
+@functools.lru_cache(maxsize=32)
+def _ports_for(session_name: str) -> Tuple[int, int]:
+    """Derive (gdb_port, qmp_port) from the session name.
+
+    Uses CRC32 rather than hash(), which is randomized per interpreter run,
+    so a session name always maps to the same ports.
+    """
+    base_port = 1234 + (zlib.crc32(session_name.encode()) % 1000)
+    return base_port, base_port + 1000
+
+
+async def _probe_port(port: int, timeout: float = 2.0) -> None:
+    """Open and close a TCP connection to localhost:port.
+
+    Raises:
+        OSError: If nothing accepts the connection
+        asyncio.TimeoutError: If the connection doesn't complete in time
+    """
+    _, writer = await asyncio.wait_for(
+        asyncio.open_connection("localhost", port), timeout
+    )
+    writer.close()
+    await writer.wait_closed()
+
+
 async def start_session(
     elf_path: str,
     machine: str = "lm3s6965evb",
@@ -87,12 +268,11 @@ async def start_session(
 ) -> Dict[str, Any]:
     """Start a new debug session."""
     from unconcealer.tools.qemu_control import QEMUConfig, QEMUController
-    from unconcealer.tools.gdb_bridge import GDBBridge
     from unconcealer.arch import detect_architecture
 
     # Check for existing session
     session_file = get_session_file(session_name)
-    if session_file.exists():
+    if os.path.exists(session_file):
         state = SessionState.from_file(session_file)
         if is_process_running(state.qemu_pid):
             return {
@@ -100,17 +280,14 @@ async def start_session(
                          f"Use stop_session first or choose a different session name."
             }
         # Clean up stale session file
-        session_file.unlink()
+        os.unlink(session_file)
 
     # Validate ELF
     elf = Path(elf_path).expanduser().resolve()
     if not elf.exists():
         return {"error": f"ELF file not found: {elf}"}
 
-    # Allocate ports (simple strategy: use session hash)
-    base_port = 1234 + (hash(session_name) % 1000)
-    gdb_port = base_port
-    qmp_port = base_port + 1000
+    gdb_port, qmp_port = _ports_for(session_name)
 
     # Determine QEMU path
     cpu_lower = cpu.lower()
@@ -122,13 +299,17 @@ async def start_session(
     else:
         qemu_path = os.environ.get("DEBUGGER_QEMU_ARM_PATH", "qemu-system-arm")
 
-    # Start QEMU
+    # Start QEMU. It outlives this process (and runs unattended under the
+    # daemon), so its output goes to a log file rather than pipes nobody
+    # would read
+    os.makedirs(_SESSION_DIR_STR, exist_ok=True)
     config = QEMUConfig(
         qemu_path=qemu_path,
         machine=machine,
         cpu=cpu,
         gdb_port=gdb_port,
         qmp_port=qmp_port,
+        log_path=get_qemu_log(session_name),
     )
 
     qemu = QEMUController(config)
@@ -140,19 +321,13 @@ async def start_session(
     # Get QEMU PID
     qemu_pid = qemu.process.pid if qemu.process else 0
 
-    # Connect GDB to verify it works
-    gdb_path = os.environ.get("DEBUGGER_GDB_PATH", "gdb-multiarch")
-    gdb = GDBBridge(gdb_path)
+    # Check the GDB stub is listening before handing it to the GDB server
     try:
-        await gdb.start()
-        await gdb.load_symbols(str(elf))
-        await gdb.connect(port=gdb_port)
-        await gdb.close()
-    except Exception as e:
-        # Kill QEMU if GDB fails
-        if qemu.process:
-            qemu.process.terminate()
-        return {"error": f"Failed to connect GDB: {e}"}
+        await _probe_port(gdb_port)
+    except (OSError, asyncio.TimeoutError) as e:
+        # Stop (and reap) QEMU if the stub isn't reachable
+        await qemu.stop()
+        return {"error": f"GDB stub not reachable on port {gdb_port}: {e}"}
 
     # Detect architecture
     arch_name = detect_architecture(cpu, machine)
@@ -171,6 +346,15 @@ async def start_session(
     )
     state.to_file(session_file)
 
+    # Keep one GDB attached for the session's lifetime so tool calls don't
+    # pay GDB startup and symbol loading every time. If it doesn't come up,
+    # tools fall back to attaching their own GDB per call.
+    gdb_pid = await _spawn_gdb_server(session_name)
+    if gdb_pid:
+        state.gdb_pid = gdb_pid
+        state.gdb_socket = get_gdb_socket(session_name)
+        state.to_file(session_file)
+
     # Don't close QEMU - leave it running!
     # Just disconnect our references so the process continues
     qemu.process = None
@@ -191,60 +375,423 @@ async def start_session(
 async def stop_session(session_name: str = "default") -> Dict[str, Any]:
     """Stop a debug session."""
     session_file = get_session_file(session_name)
-    if not session_file.exists():
+    if not os.path.exists(session_file):
         return {"error": f"Session '{session_name}' not found"}
 
     state = SessionState.from_file(session_file)
 
+    # Stop the GDB server first so it detaches cleanly
+    if state.gdb_pid and is_process_running(state.gdb_pid):
+        try:
+            os.kill(state.gdb_pid, signal.SIGTERM)
+            await _wait_for_exit(state.gdb_pid, 0.5)
+        except OSError:
+            pass
+    _unlink(get_gdb_socket(session_name))
+
     # Kill QEMU
     if is_process_running(state.qemu_pid):
         try:
             os.kill(state.qemu_pid, signal.SIGTERM)
             # Wait a bit for graceful shutdown
-            await asyncio.sleep(0.5)
-            if is_process_running(state.qemu_pid):
+            if not await _wait_for_exit(state.qemu_pid, 0.5):
                 os.kill(state.qemu_pid, signal.SIGKILL)
+                await _wait_for_exit(state.qemu_pid, 0.5)
         except Exception as e:
             pass  # Process may have already exited
 
     # Remove session file
-    session_file.unlink()
+    os.unlink(session_file)
 
     return {"status": "stopped", "session": session_name}
 
 
-async def get_session_context(session_name: str = "default"):
-    """Get session state and reconnect GDB.
+def load_session_state(session_name: str = "default") -> SessionState:
+    """Load state for a live session.
 
-    Returns (state, gdb) tuple. Caller must close gdb when done.
+    Raises:
+        ValueError: If the session doesn't exist or its QEMU has exited
     """
-    from unconcealer.tools.gdb_bridge import GDBBridge
-
     session_file = get_session_file(session_name)
-    if not session_file.exists():
+    if not os.path.exists(session_file):
         raise ValueError(f"Session '{session_name}' not found. Use start_session first.")
 
     state = SessionState.from_file(session_file)
 
     if not is_process_running(state.qemu_pid):
         # Clean up stale session
-        session_file.unlink()
+        os.unlink(session_file)
         raise ValueError(f"Session '{session_name}' QEMU process not running. Session cleaned up.")
 
-    # Connect GDB
+    return state
+
+
+async def _attach_gdb(state: SessionState) -> Any:
+    """Start GDB, load the session's symbols and connect to its stub."""
+    from unconcealer.tools.gdb_bridge import GDBBridge
+
     gdb_path = os.environ.get("DEBUGGER_GDB_PATH", "gdb-multiarch")
     gdb = GDBBridge(gdb_path)
     await gdb.start()
     await gdb.load_symbols(state.elf_path)
     await gdb.connect(port=state.gdb_port)
+    return gdb
 
-    return state, gdb
 
+async def get_session_context(session_name: str = "default"):
+    """Get session state and reconnect GDB.
 
-async def execute_tool(tool_name: str, args: Dict[str, Any], session_name: str = "default") -> Dict[str, Any]:
-    """Execute a debugging tool."""
-    from unconcealer.arch import get_architecture
+    Returns (state, gdb) tuple. Caller must close gdb when done.
+    """
+    state = load_session_state(session_name)
+    return state, await _attach_gdb(state)
+
+
+# === Persistent GDB server ===
+#
+# start_session launches `unconcealer-cmd --serve-gdb` in the background.
+# It keeps one GDB attached to the session's QEMU and runs tools sent to it
+# as newline-delimited JSON ({"tool": ..., "args": ...}) over a Unix socket,
+# replying with one JSON result line per request.
+
+
+async def _spawn_gdb_server(session_name: str) -> int:
+    """Launch the GDB server for a session and wait until it accepts clients.
+
+    Returns:
+        Server PID, or 0 if it failed to start
+    """
+    sock_path = get_gdb_socket(session_name)
+    _unlink(sock_path)
+
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "unconcealer.cmd", "--session", session_name, "--serve-gdb"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+    deadline = time.monotonic() + GDB_SERVER_READY_TIMEOUT
+    while time.monotonic() < deadline and proc.poll() is None:
+        try:
+            _, writer = await asyncio.open_unix_connection(sock_path)
+        except OSError:
+            await asyncio.sleep(0.05)
+            continue
+        writer.close()
+        await writer.wait_closed()
+        return proc.pid
+
+    if proc.poll() is None:
+        proc.kill()
+        proc.wait()
+    return 0
+
+
+RequestRunner = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+
+def _json_line_handler(
+    run: RequestRunner
+) -> Callable[[asyncio.StreamReader, asyncio.StreamWriter], Awaitable[None]]:
+    """Build a stream handler answering each JSON request line with a JSON result line."""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while line := await reader.readline():
+                try:
+                    result = await run(jsoncodec.loads(line))
+                except Exception as e:
+                    result = {"error": str(e)}
+                writer.write(jsoncodec.dumps_line(result))
+                await writer.drain()
+        finally:
+            writer.close()
+
+    return handle
+
+
+async def _serve_unix(sock_path: str, run: RequestRunner, alive: Callable[[], bool]) -> None:
+    """Serve JSON line requests on a Unix socket until SIGTERM/SIGINT or alive() is False."""
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    loop.add_signal_handler(signal.SIGTERM, stop.set)
+    loop.add_signal_handler(signal.SIGINT, stop.set)
+
+    _unlink(sock_path)
+    server = await asyncio.start_unix_server(_json_line_handler(run), path=sock_path)
+    try:
+        while not stop.is_set() and alive():
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=1.0)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        server.close()
+        _unlink(sock_path)
+
+
+async def serve_gdb(session_name: str) -> None:
+    """Run the GDB server for a session until stopped or QEMU exits."""
+    state = load_session_state(session_name)
+    gdb = await _attach_gdb(state)
+    lock = asyncio.Lock()
+
+    async def run(request: Dict[str, Any]) -> Dict[str, Any]:
+        # A halt has to reach GDB while a continue_execution holds the lock
+        if request["tool"] == "halt" and lock.locked():
+            await gdb.interrupt()
+            return {"status": "interrupted"}
+        # One GDB, so other requests from concurrent clients run in turn
+        async with lock:
+            return await _run_tool(gdb, state, request["tool"], request.get("args", {}))
+
+    try:
+        await _serve_unix(
+            get_gdb_socket(session_name), run, lambda: is_process_running(state.qemu_pid)
+        )
+    finally:
+        await gdb.close()
+
+
+async def _call_gdb_server(
+    sock_path: str, tool_name: str, args: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """Run a tool through a session's GDB server.
+
+    Returns:
+        Tool result, or None if the server isn't accepting connections
+    """
+    try:
+        reader, writer = await asyncio.open_unix_connection(sock_path)
+    except OSError:
+        return None
+
+    try:
+        writer.write(jsoncodec.dumps_line({"tool": tool_name, "args": args}))
+        await writer.drain()
+        line = await asyncio.wait_for(reader.readline(), GDB_SERVER_REPLY_TIMEOUT)
+    except asyncio.TimeoutError:
+        return {"error": f"GDB server did not reply within {GDB_SERVER_REPLY_TIMEOUT:g}s"}
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+    if not line:
+        return {"error": "GDB server closed the connection"}
+    result = jsoncodec.loads(line)
+    if not isinstance(result, dict):
+        return {"error": "GDB server sent a malformed reply"}
+    return result
+
+
+async def _describe_session(name: str) -> Dict[str, Any]:
+    """Load a session's state file off the event loop and summarize it."""
+    state = await asyncio.to_thread(SessionState.from_file, get_session_file(name))
+    return {
+        "name": name,
+        "elf_path": state.elf_path,
+        "machine": state.machine,
+        "cpu": state.cpu,
+        "running": is_process_running(state.qemu_pid),
+    }
 
+
+
+# === Tool handlers ===
+#
+# Session tools take (gdb, state, args); architecture tools take
+# (arch, proxy, args). Both return the result dict.
+
+ToolHandler = Callable[[Any, SessionState, Dict[str, Any]], Awaitable[Dict[str, Any]]]
+ArchToolHandler = Callable[[Any, SessionProxy, Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+
+async def _tool_read_registers(
+    gdb: Any, state: SessionState, args: Dict[str, Any]
+) -> Dict[str, Any]:
+    regs_list = args.get("registers")
+    if regs_list is not None and len(regs_list) == 0:
+        regs_list = None
+    regs = await gdb.read_registers(regs_list)
+    # The JSON object keeps regs' insertion order (request order, or GDB's
+    # register numbering when all registers are read)
+    return {"registers": {name: fmt32(val) for name, val in regs.items()}}
+
+
+async def _tool_read_memory(gdb: Any, state: SessionState, args: Dict[str, Any]) -> Dict[str, Any]:
+    address = await resolve_address(gdb, args.get("address", "0"))
+    length = args.get("length", 64)
+
+    data = await gdb.read_memory(address, length)
+    return {"memory": hex_dump(data, address)}
+
+
+async def _tool_write_memory(gdb: Any, state: SessionState, args: Dict[str, Any]) -> Dict[str, Any]:
+    address = await resolve_address(gdb, args.get("address", "0"))
+    hex_data = args.get("data", "").replace(" ", "")
+
+    data = bytes.fromhex(hex_data)
+    success = await gdb.write_memory(address, data)
+    return {
+        "status": "written" if success else "failed",
+        "bytes": len(data),
+        "address": f"0x{address:08x}",
+    }
+
+
+async def _tool_continue_execution(
+    gdb: Any, state: SessionState, args: Dict[str, Any]
+) -> Dict[str, Any]:
+    stop = await gdb.continue_execution()
+    return {
+        "status": "stopped",
+        "reason": stop.reason.value,
+        "address": f"0x{stop.address:08x}",
+        "signal": stop.signal_name,
+    }
+
+
+async def _tool_step(gdb: Any, state: SessionState, args: Dict[str, Any]) -> Dict[str, Any]:
+    stop = await gdb.step(instruction=args.get("instruction", False))
+    return {"status": "stepped", "address": f"0x{stop.address:08x}"}
+
+
+async def _tool_step_over(gdb: Any, state: SessionState, args: Dict[str, Any]) -> Dict[str, Any]:
+    stop = await gdb.step_over(instruction=args.get("instruction", False))
+    return {"status": "stepped", "address": f"0x{stop.address:08x}"}
+
+
+async def _tool_halt(gdb: Any, state: SessionState, args: Dict[str, Any]) -> Dict[str, Any]:
+    await gdb.halt()
+    return {"status": "halted"}
+
+
+async def _tool_set_breakpoint(
+    gdb: Any, state: SessionState, args: Dict[str, Any]
+) -> Dict[str, Any]:
+    location = args.get("location", "main")
+    condition = args.get("condition")
+    temporary = args.get("temporary", False)
+    bp = await gdb.set_breakpoint(location, condition, temporary)
+    return {
+        "status": "set",
+        "number": bp.number,
+        "address": f"0x{bp.address:08x}",
+        "location": bp.location,
+    }
+
+
+async def _tool_delete_breakpoint(
+    gdb: Any, state: SessionState, args: Dict[str, Any]
+) -> Dict[str, Any]:
+    number = args.get("number", 1)
+    success = await gdb.delete_breakpoint(number)
+    return {"status": "deleted" if success else "failed", "number": number}
+
+
+async def _tool_backtrace(gdb: Any, state: SessionState, args: Dict[str, Any]) -> Dict[str, Any]:
+    frames = await gdb.get_backtrace(args.get("max_frames", 20))
+    lines = []
+    for frame in frames:
+        level = frame.get("level", 0)
+        addr = frame.get("addr", 0)
+        func = frame.get("func", "??")
+        file = frame.get("file")
+        line_no = frame.get("line")
+        loc = f"{file}:{line_no}" if file and line_no else ""
+        lines.append(f"#{level:<2} 0x{addr:08x} in {func} {loc}".strip())
+    return {"backtrace": "\n".join(lines)}
+
+
+async def _tool_evaluate(gdb: Any, state: SessionState, args: Dict[str, Any]) -> Dict[str, Any]:
+    expr = args.get("expression", "0")
+    result = await gdb.evaluate(expr)
+    return {"expression": expr, "value": result.value}
+
+
+async def _tool_read_fault_registers(
+    arch: Any, proxy: SessionProxy, args: Dict[str, Any]
+) -> Dict[str, Any]:
+    await proxy.read_registers_and_memory([], arch.crash_regions)
+    fault = await arch.read_fault_state(proxy)
+    return {
+        "fault_type": fault.fault_type,
+        "fault_address": f"0x{fault.fault_address:08x}" if fault.fault_address else None,
+        "is_valid": fault.is_valid,
+        "raw_registers": {k: fmt32(v) for k, v in fault.raw_registers.items()},
+        "decoded": fault.decoded,
+    }
+
+
+async def _tool_analyze_crash(
+    arch: Any, proxy: SessionProxy, args: Dict[str, Any]
+) -> Dict[str, Any]:
+    await proxy.read_registers_and_memory(["sp"], arch.crash_regions)
+    analysis: Dict[str, Any] = await arch.analyze_crash(proxy)
+    return analysis
+
+
+async def _tool_read_exception_frame(
+    arch: Any, proxy: SessionProxy, args: Dict[str, Any]
+) -> Dict[str, Any]:
+    sp_str = args.get("stack_pointer")
+    sp = int(sp_str, 0) if sp_str else None
+    frame = await arch.decode_exception_frame(proxy, sp)
+    return {
+        "frame_type": frame.frame_type,
+        "return_address": f"0x{frame.return_address:08x}",
+        "stack_pointer": f"0x{frame.stack_pointer:08x}",
+        "registers": {k: fmt32(v) for k, v in frame.registers.items()},
+    }
+
+
+async def _tool_check_interrupt_priorities(
+    arch: Any, proxy: SessionProxy, args: Dict[str, Any]
+) -> Dict[str, Any]:
+    await proxy.read_registers_and_memory([], arch.crash_regions)
+    analysis = await arch.check_interrupt_config(proxy)
+    return {
+        "priorities": analysis.priorities,
+        "enabled_count": len(analysis.enabled),
+        "pending_count": len(analysis.pending),
+        "warnings": analysis.warnings,
+    }
+
+
+TOOL_DISPATCH: Dict[str, ToolHandler] = {
+    # Registers
+    "read_registers": _tool_read_registers,
+    # Memory
+    "read_memory": _tool_read_memory,
+    "write_memory": _tool_write_memory,
+    # Execution control
+    "continue_execution": _tool_continue_execution,
+    "step": _tool_step,
+    "step_over": _tool_step_over,
+    "halt": _tool_halt,
+    # Breakpoints
+    "set_breakpoint": _tool_set_breakpoint,
+    "delete_breakpoint": _tool_delete_breakpoint,
+    # Analysis
+    "backtrace": _tool_backtrace,
+    "evaluate": _tool_evaluate,
+}
+
+# Tools that need the session's TargetArchitecture
+ARCH_TOOL_DISPATCH: Dict[str, ArchToolHandler] = {
+    "read_fault_registers": _tool_read_fault_registers,
+    "analyze_crash": _tool_analyze_crash,
+    "read_exception_frame": _tool_read_exception_frame,
+    "check_interrupt_priorities": _tool_check_interrupt_priorities,
+}
+
+
+async def execute_tool(
+    tool_name: str, args: Dict[str, Any], session_name: str = "default"
+) -> Dict[str, Any]:
+    """Execute a debugging tool."""
     # Session management tools
     if tool_name == "start_session":
         return await start_session(
@@ -261,249 +808,124 @@ async def execute_tool(tool_name: str, args: Dict[str, Any], session_name: str =
         sessions = list_sessions()
         if not sessions:
             return {"sessions": [], "message": "No active sessions"}
-        result = []
-        for name in sessions:
-            try:
-                state = SessionState.from_file(get_session_file(name))
-                running = is_process_running(state.qemu_pid)
-                result.append({
-                    "name": name,
-                    "elf_path": state.elf_path,
-                    "machine": state.machine,
-                    "cpu": state.cpu,
-                    "running": running,
-                })
-            except Exception:
-                pass
-        return {"sessions": result}
+        entries = await asyncio.gather(
+            *(_describe_session(name) for name in sessions),
+            return_exceptions=True,
+        )
+        # Unreadable session files are skipped
+        return {"sessions": [e for e in entries if isinstance(e, dict)]}
+
+    if tool_name not in TOOL_DISPATCH and tool_name not in ARCH_TOOL_DISPATCH:
+        return {"error": f"Unknown tool: {tool_name}"}
 
     # Tools that need an active session
     try:
-        state, gdb = await get_session_context(session_name)
+        state = load_session_state(session_name)
     except ValueError as e:
         return {"error": str(e)}
 
-    try:
-        # Register operations
-        if tool_name == "read_registers":
-            regs_list = args.get("registers")
-            if regs_list is not None and len(regs_list) == 0:
-                regs_list = None
-            regs = await gdb.read_registers(regs_list)
-            return {"registers": {name: f"0x{val:08x}" for name, val in sorted(regs.items())}}
-
-        # Memory operations
-        elif tool_name == "read_memory":
-            addr_str = args.get("address", "0")
-            length = args.get("length", 64)
-
-            if addr_str.startswith("0x") or addr_str.startswith("0X"):
-                address = int(addr_str, 16)
-            else:
-                result = await gdb.evaluate(f"&{addr_str}")
-                address = int(result.value.split()[0], 0)
-
-            data = await gdb.read_memory(address, length)
-
-            # Format as hex dump
-            lines = []
-            for i in range(0, len(data), 16):
-                chunk = data[i:i + 16]
-                hex_part = " ".join(f"{b:02x}" for b in chunk)
-                ascii_part = "".join(chr(b) if 32 <= b < 127 else "." for b in chunk)
-                lines.append(f"0x{address + i:08x}: {hex_part:<48} {ascii_part}")
-            return {"memory": "\n".join(lines)}
-
-        elif tool_name == "write_memory":
-            addr_str = args.get("address", "0")
-            hex_data = args.get("data", "").replace(" ", "")
-
-            if addr_str.startswith("0x") or addr_str.startswith("0X"):
-                address = int(addr_str, 16)
-            else:
-                result = await gdb.evaluate(f"&{addr_str}")
-                address = int(result.value.split()[0], 0)
-
-            data = bytes.fromhex(hex_data)
-            success = await gdb.write_memory(address, data)
-            return {"status": "written" if success else "failed", "bytes": len(data), "address": f"0x{address:08x}"}
-
-        # Execution control
-        elif tool_name == "continue_execution":
-            stop = await gdb.continue_execution()
+    if state.gdb_socket:
+        result = await _call_gdb_server(state.gdb_socket, tool_name, args)
+        if result is not None:
+            return result
+        # QEMU's gdbstub takes a single client, so only attach a GDB of our
+        # own once the server (and its connection) is gone
+        if is_process_running(state.gdb_pid):
             return {
-                "status": "stopped",
-                "reason": stop.reason.value,
-                "address": f"0x{stop.address:08x}",
-                "signal": stop.signal_name,
+                "error": f"GDB server for session '{session_name}' is not accepting connections"
             }
 
-        elif tool_name == "step":
-            instruction = args.get("instruction", False)
-            stop = await gdb.step(instruction=instruction)
-            return {"status": "stepped", "address": f"0x{stop.address:08x}"}
-
-        elif tool_name == "step_over":
-            instruction = args.get("instruction", False)
-            stop = await gdb.step_over(instruction=instruction)
-            return {"status": "stepped", "address": f"0x{stop.address:08x}"}
-
-        elif tool_name == "halt":
-            await gdb.halt()
-            return {"status": "halted"}
-
-        # Breakpoints
-        elif tool_name == "set_breakpoint":
-            location = args.get("location", "main")
-            condition = args.get("condition")
-            temporary = args.get("temporary", False)
-            bp = await gdb.set_breakpoint(location, condition, temporary)
-            return {
-                "status": "set",
-                "number": bp.number,
-                "address": f"0x{bp.address:08x}",
-                "location": bp.location,
-            }
+    gdb = await _attach_gdb(state)
+    try:
+        return await _run_tool(gdb, state, tool_name, args)
+    finally:
+        # Always close GDB connection
+        await gdb.close()
 
-        elif tool_name == "delete_breakpoint":
-            number = args.get("number", 1)
-            success = await gdb.delete_breakpoint(number)
-            return {"status": "deleted" if success else "failed", "number": number}
-
-        # Analysis
-        elif tool_name == "backtrace":
-            max_frames = args.get("max_frames", 20)
-            frames = await gdb.get_backtrace(max_frames)
-            lines = []
-            for frame in frames:
-                level = frame.get("level", 0)
-                addr = frame.get("addr", 0)
-                func = frame.get("func", "??")
-                file = frame.get("file")
-                line_no = frame.get("line")
-                loc = f"{file}:{line_no}" if file and line_no else ""
-                lines.append(f"#{level:<2} 0x{addr:08x} in {func} {loc}".strip())
-            return {"backtrace": "\n".join(lines)}
-
-        elif tool_name == "evaluate":
-            expr = args.get("expression", "0")
-            result = await gdb.evaluate(expr)
-            return {"expression": expr, "value": result.value}
-
-        # Architecture-specific tools
-        elif tool_name == "read_fault_registers":
-            arch = get_architecture(state.architecture)
-            if not arch:
-                return {"error": f"Unknown architecture: {state.architecture}"}
-
-            # Create a minimal session-like object for the arch tools
-            class SessionProxy:
-                def __init__(self, gdb_bridge):
-                    self.gdb = gdb_bridge
-                async def read_memory(self, addr, length):
-                    return await self.gdb.read_memory(addr, length)
-                async def read_memory_word(self, addr):
-                    return await self.gdb.read_memory_word(addr)
-                async def read_registers(self, names=None):
-                    return await self.gdb.read_registers(names)
-                async def read_register(self, name):
-                    return await self.gdb.read_register(name)
-
-            proxy = SessionProxy(gdb)
-            fault = await arch.read_fault_state(proxy)
-
-            result = {
-                "fault_type": fault.fault_type,
-                "fault_address": f"0x{fault.fault_address:08x}" if fault.fault_address else None,
-                "is_valid": fault.is_valid,
-                "raw_registers": {k: f"0x{v:08x}" for k, v in fault.raw_registers.items()},
-                "decoded": fault.decoded,
-            }
-            return result
 
-        elif tool_name == "analyze_crash":
-            arch = get_architecture(state.architecture)
-            if not arch:
-                return {"error": f"Unknown architecture: {state.architecture}"}
-
-            class SessionProxy:
-                def __init__(self, gdb_bridge):
-                    self.gdb = gdb_bridge
-                async def read_memory(self, addr, length):
-                    return await self.gdb.read_memory(addr, length)
-                async def read_memory_word(self, addr):
-                    return await self.gdb.read_memory_word(addr)
-                async def read_registers(self, names=None):
-                    return await self.gdb.read_registers(names)
-                async def read_register(self, name):
-                    return await self.gdb.read_register(name)
-
-            proxy = SessionProxy(gdb)
-            analysis = await arch.analyze_crash(proxy)
-            return analysis
-
-        elif tool_name == "read_exception_frame":
-            arch = get_architecture(state.architecture)
-            if not arch:
-                return {"error": f"Unknown architecture: {state.architecture}"}
-
-            class SessionProxy:
-                def __init__(self, gdb_bridge):
-                    self.gdb = gdb_bridge
-                async def read_memory(self, addr, length):
-                    return await self.gdb.read_memory(addr, length)
-                async def read_memory_word(self, addr):
-                    return await self.gdb.read_memory_word(addr)
-                async def read_registers(self, names=None):
-                    return await self.gdb.read_registers(names)
-                async def read_register(self, name):
-                    return await self.gdb.read_register(name)
-
-            proxy = SessionProxy(gdb)
-            sp_str = args.get("stack_pointer")
-            sp = int(sp_str, 0) if sp_str else None
-            frame = await arch.decode_exception_frame(proxy, sp)
+async def _run_tool(
+    gdb: Any, state: SessionState, tool_name: str, args: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Run a session tool against an attached GDB."""
+    handler = TOOL_DISPATCH.get(tool_name)
+    if handler is not None:
+        return await handler(gdb, state, args)
 
-            return {
-                "frame_type": frame.frame_type,
-                "return_address": f"0x{frame.return_address:08x}",
-                "stack_pointer": f"0x{frame.stack_pointer:08x}",
-                "registers": {k: f"0x{v:08x}" for k, v in frame.registers.items()},
-            }
+    arch_handler = ARCH_TOOL_DISPATCH.get(tool_name)
+    if arch_handler is None:
+        return {"error": f"Unknown tool: {tool_name}"}
 
-        elif tool_name == "check_interrupt_priorities":
-            arch = get_architecture(state.architecture)
-            if not arch:
-                return {"error": f"Unknown architecture: {state.architecture}"}
-
-            class SessionProxy:
-                def __init__(self, gdb_bridge):
-                    self.gdb = gdb_bridge
-                async def read_memory(self, addr, length):
-                    return await self.gdb.read_memory(addr, length)
-                async def read_memory_word(self, addr):
-                    return await self.gdb.read_memory_word(addr)
-                async def read_registers(self, names=None):
-                    return await self.gdb.read_registers(names)
-                async def read_register(self, name):
-                    return await self.gdb.read_register(name)
-
-            proxy = SessionProxy(gdb)
-            analysis = await arch.check_interrupt_config(proxy)
+    # Only the architecture tools need the arch package
+    from unconcealer.arch import get_architecture
+
+    try:
+        arch = get_architecture(state.architecture)
+    except ValueError:
+        return {"error": f"Unknown architecture: {state.architecture}"}
+    return await arch_handler(arch, SessionProxy(gdb), args)
+
+
+# === Daemon mode ===
+#
+# `unconcealer-cmd --daemon` serves {"tool", "args", "session"} requests on
+# a Unix socket from one long-running process, so imports and event loop
+# setup are paid once. Clients use it when UNCONCEALER_DAEMON_SOCK is set.
+
+
+def get_daemon_socket() -> Path:
+    """Get path to the daemon socket."""
+    return Path(os.environ.get("UNCONCEALER_DAEMON_SOCK") or SESSION_DIR.parent / "daemon.sock")
 
-            return {
-                "priorities": analysis.priorities,
-                "enabled_count": len(analysis.enabled),
-                "pending_count": len(analysis.pending),
-                "warnings": analysis.warnings,
-            }
 
-        else:
-            return {"error": f"Unknown tool: {tool_name}"}
+async def serve_daemon(sock_path: Path) -> None:
+    """Run the command daemon until SIGTERM/SIGINT."""
+    # Pay for the heavy imports up front rather than on the first request
+    import unconcealer.arch  # noqa: F401
+    import unconcealer.tools.gdb_bridge  # noqa: F401
+    import unconcealer.tools.qemu_control  # noqa: F401
 
+    async def run(request: Dict[str, Any]) -> Dict[str, Any]:
+        return await execute_tool(
+            request["tool"], request.get("args", {}), request.get("session", "default")
+        )
+
+    sock_path.parent.mkdir(parents=True, exist_ok=True)
+    await _serve_unix(str(sock_path), run, lambda: True)
+
+
+def _call_daemon(
+    sock_path: str, tool_name: str, args: Dict[str, Any], session_name: str
+) -> Optional[Dict[str, Any]]:
+    """Run a tool through the daemon.
+
+    Returns:
+        Tool result, or None if the daemon isn't accepting connections
+    """
+    request = {"tool": tool_name, "args": args, "session": session_name}
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(DAEMON_CONNECT_TIMEOUT)
+        try:
+            sock.connect(sock_path)
+        except OSError:
+            return None
+        # The request may already be running, so a timeout from here on is
+        # an error rather than a reason to run it again in-process
+        sock.settimeout(DAEMON_REPLY_TIMEOUT)
+        try:
+            sock.sendall(jsoncodec.dumps_line(request))
+            line = sock.makefile("rb").readline()
+        except socket.timeout:
+            return {"error": f"Daemon did not reply within {DAEMON_REPLY_TIMEOUT:g}s"}
     finally:
-        # Always close GDB connection
-        await gdb.close()
+        sock.close()
+
+    if not line:
+        return {"error": "Daemon closed the connection"}
+    result = jsoncodec.loads(line)
+    if not isinstance(result, dict):
+        return {"error": "Daemon sent a malformed reply"}
+    return result
 
 
 def format_output(result: Dict[str, Any]) -> str:
@@ -517,13 +939,13 @@ def format_output(result: Dict[str, Any]) -> str:
         return "\n".join(lines)
 
     if "memory" in result:
-        return result["memory"]
+        return str(result["memory"])
 
     if "backtrace" in result:
-        return result["backtrace"]
+        return str(result["backtrace"])
 
     # Default: pretty-print JSON
-    return json.dumps(result, indent=2)
+    return jsoncodec.dumps_pretty(result)
 
 
 def parse_args():
@@ -565,6 +987,7 @@ Available tools:
     )
     parser.add_argument(
         "tool",
+        nargs="?",
         help="Tool to execute"
     )
     parser.add_argument(
@@ -589,7 +1012,19 @@ Available tools:
     parser.add_argument("--stack-pointer", help="Stack pointer for exception frame")
     parser.add_argument("--registers", nargs="*", help="Register names to read")
 
-    return parser.parse_args()
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Serve commands on $UNCONCEALER_DAEMON_SOCK (or the default socket) "
+             "in a long-running process"
+    )
+    # Internal: run the persistent GDB server for --session (see start_session)
+    parser.add_argument("--serve-gdb", action="store_true", help=argparse.SUPPRESS)
+
+    parsed = parser.parse_args()
+    if parsed.tool is None and not (parsed.serve_gdb or parsed.daemon):
+        parser.error("the following arguments are required: tool")
+    return parsed
 
 
 def build_tool_args(parsed_args, positional: List[str]) -> Dict[str, Any]:
@@ -651,14 +1086,31 @@ def build_tool_args(parsed_args, positional: List[str]) -> Dict[str, Any]:
 def main():
     """Main entry point."""
     parsed = parse_args()
+
+    if parsed.serve_gdb:
+        asyncio.run(serve_gdb(parsed.session))
+        return
+
+    if parsed.daemon:
+        asyncio.run(serve_daemon(get_daemon_socket()))
+        return
+
     tool_args = build_tool_args(parsed, parsed.args)
 
-    # Run the tool
-    result = asyncio.run(execute_tool(parsed.tool, tool_args, parsed.session))
+    # Run the tool, through the daemon if one is configured and listening
+    result = None
+    daemon_sock = os.environ.get("UNCONCEALER_DAEMON_SOCK")
+    if daemon_sock:
+        if "elf_path" in tool_args:
+            # The daemon has its own working directory
+            tool_args["elf_path"] = str(Path(tool_args["elf_path"]).expanduser().resolve())
+        result = _call_daemon(daemon_sock, parsed.tool, tool_args, parsed.session)
+    if result is None:
+        result = asyncio.run(execute_tool(parsed.tool, tool_args, parsed.session))
 
     # Output
     if parsed.json:
-        print(json.dumps(result, indent=2))
+        print(jsoncodec.dumps_pretty(result))
     else:
         print(format_output(result))
 
@@ -1,6 +1,6 @@
 """Core components: agent orchestration, planning, execution, and memory."""
 
-from unconcealer.core.types import DebugConfig, DebugContext
+from unconcealer.core.types import DebugConfig, DebugContext, RegisterSnapshot
 from unconcealer.core.session import DebugSession
 
-__all__ = ["DebugConfig", "DebugContext", "DebugSession"]
+__all__ = ["DebugConfig", "DebugContext", "DebugSession", "RegisterSnapshot"]
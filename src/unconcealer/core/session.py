@@ -1,17 +1,30 @@
 """Debug session combining QEMU and GDB."""
 
+import asyncio
+import struct
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Optional, Dict, List, Any
+from typing import AsyncIterator, Optional, Dict, List, Any, Tuple
 
 from unconcealer.tools.gdb_bridge import (
     GDBBridge,
     StopInfo,
+    StopReason,
     BreakpointInfo,
 )
 from unconcealer.tools.qemu_control import QEMUController, QEMUConfig
+from unconcealer.core.types import RegisterSnapshot
 
 
 @dataclass
+class _PendingRead:
+    """A read_memory call waiting to be merged with its neighbours."""
+    address: int
+    length: int
+    future: "asyncio.Future[bytes]"
+
+
+@dataclass(slots=True)
 class DebugSession:
     """Combined QEMU + GDB debug session.
 
@@ -27,6 +40,16 @@ class DebugSession:
             await session.continue_execution()
     """
 
+    # Concurrent reads separated by at most COALESCE_GAP bytes are merged
+    # into one GDB request of up to MAX_COALESCED_READ bytes. Only touching
+    # or overlapping ranges are merged by default: reading a gap could hit
+    # MMIO registers with read side effects (read-to-clear, FIFO pops)
+    COALESCE_GAP = 0
+    MAX_COALESCED_READ = 4096
+
+    # Most memory ranges kept by the read cache
+    MEMORY_CACHE_SIZE = 256
+
     elf_path: str
     qemu_config: QEMUConfig = field(default_factory=QEMUConfig)
     gdb_path: str = "gdb-multiarch"
@@ -36,6 +59,31 @@ class DebugSession:
     gdb: Optional[GDBBridge] = field(default=None, init=False)
     _started: bool = field(default=False, init=False)
 
+    # Bumped whenever target state may have changed (run, step, write, ...),
+    # so callers can cache reads taken while the target sits still.
+    run_generation: int = field(default=0, init=False)
+
+    # Set when continue_execution returned before the target stopped; reads
+    # are not cached until a step or halt brings it to a known stop
+    _target_running: bool = field(default=False, init=False, repr=False)
+
+    # Register order seen from GDB and its sorted display order
+    _reg_keys: Tuple[str, ...] = field(default=(), init=False, repr=False)
+    _reg_names: Tuple[str, ...] = field(default=(), init=False, repr=False)
+
+    # read_memory calls queued for the next coalesced flush
+    _pending_reads: List[_PendingRead] = field(default_factory=list, init=False, repr=False)
+    _flush_task: Optional["asyncio.Task[None]"] = field(default=None, init=False, repr=False)
+
+    # Reads served without GDB while run_generation equals _cache_generation
+    _cache_generation: int = field(default=0, init=False, repr=False)
+    _mem_cache: "OrderedDict[Tuple[int, int], bytes]" = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _reg_cache: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _reg_file_cached: bool = field(default=False, init=False, repr=False)
+    _all_regs_cache: Optional[Dict[str, int]] = field(default=None, init=False, repr=False)
+
     # === Lifecycle ===
 
     async def start(self) -> bool:
@@ -49,19 +97,33 @@ class DebugSession:
         Raises:
             RuntimeError: If QEMU or GDB fails to start
         """
-        # Start QEMU
         self.qemu = QEMUController(self.qemu_config)
-        await self.qemu.start(self.elf_path)
-
-        # Connect GDB
         self.gdb = GDBBridge(self.gdb_path)
-        await self.gdb.start()
-        await self.gdb.load_symbols(self.elf_path)
-        await self.gdb.connect(port=self.qemu_config.gdb_port)
+
+        # GDB startup and symbol loading don't need QEMU, so they run
+        # while QEMU boots; only connecting waits for both
+        try:
+            results = await asyncio.gather(
+                self.qemu.start(self.elf_path), self._boot_gdb(), return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            await self.gdb.connect(port=self.qemu_config.gdb_port)
+        except BaseException:
+            # Don't leave whichever side did start running
+            await self.stop()
+            raise
 
         self._started = True
         return True
 
+    async def _boot_gdb(self) -> None:
+        """Start GDB and load the firmware's symbols."""
+        assert self.gdb is not None
+        await self.gdb.start()
+        await self.gdb.load_symbols(self.elf_path)
+
     async def stop(self) -> None:
         """Stop debug session.
 
@@ -82,6 +144,8 @@ class DebugSession:
             self.qemu = None
 
         self._started = False
+        self._target_running = False
+        self._clear_caches()
 
     @property
     def started(self) -> bool:
@@ -96,9 +160,17 @@ class DebugSession:
         Returns:
             StopInfo describing why execution stopped
         """
-        self._ensure_started()
-        assert self.gdb is not None
-        return await self.gdb.continue_execution()
+        gdb = self._started_gdb()
+        self._target_running = True
+        try:
+            stop = await gdb.continue_execution()
+        finally:
+            self.run_generation += 1
+        # GDB answers StopInfo(SIGNAL, 0) when no *stopped record arrived
+        self._target_running = (
+            stop.reason is StopReason.SIGNAL and stop.address == 0 and stop.signal_name is None
+        )
+        return stop
 
     async def step(self, instruction: bool = False) -> StopInfo:
         """Single step execution.
@@ -109,9 +181,12 @@ class DebugSession:
         Returns:
             StopInfo describing where we stopped
         """
-        self._ensure_started()
-        assert self.gdb is not None
-        return await self.gdb.step(instruction=instruction)
+        gdb = self._started_gdb()
+        try:
+            return await gdb.step(instruction=instruction)
+        finally:
+            self.run_generation += 1
+            self._target_running = False
 
     async def step_over(self, instruction: bool = False) -> StopInfo:
         """Step over function calls.
@@ -122,15 +197,21 @@ class DebugSession:
         Returns:
             StopInfo describing where we stopped
         """
-        self._ensure_started()
-        assert self.gdb is not None
-        return await self.gdb.step_over(instruction=instruction)
+        gdb = self._started_gdb()
+        try:
+            return await gdb.step_over(instruction=instruction)
+        finally:
+            self.run_generation += 1
+            self._target_running = False
 
     async def halt(self) -> None:
         """Halt execution."""
-        self._ensure_started()
-        assert self.gdb is not None
-        await self.gdb.halt()
+        gdb = self._started_gdb()
+        try:
+            await gdb.halt()
+        finally:
+            self.run_generation += 1
+            self._target_running = False
 
     # === Register Operations ===
 
@@ -139,15 +220,62 @@ class DebugSession:
     ) -> Dict[str, int]:
         """Read CPU registers.
 
+        Named registers are served from one read of the whole register
+        file, so asking for several costs a single GDB request. Names GDB
+        doesn't list (aliases) are read individually. Nothing is cached
+        while the target may still be running, and an empty register file
+        (GDB has none to give while running) is never cached.
+
         Args:
             registers: List of register names, or None for all
 
         Returns:
             Dict mapping register name to value
         """
-        self._ensure_started()
-        assert self.gdb is not None
-        return await self.gdb.read_registers(registers)
+        gdb = self._started_gdb()
+        self._check_cache_generation()
+
+        if self._target_running:
+            regs = await gdb.read_registers(registers)
+            if not registers:
+                return regs
+            return {name: regs[name] for name in registers if name in regs}
+
+        if not registers:
+            if self._all_regs_cache is None:
+                regs = await gdb.read_registers(registers)
+                if not regs:
+                    return regs
+                self._all_regs_cache = regs
+            return dict(self._all_regs_cache)
+
+        cache = self._reg_cache
+        missing = [name for name in registers if name not in cache]
+        if missing and not self._reg_file_cached:
+            reg_file = await gdb.read_all_registers()
+            if reg_file:
+                cache.update(reg_file)
+                self._reg_file_cached = True
+            missing = [name for name in missing if name not in cache]
+        if missing:
+            cache.update(await gdb.evaluate_registers(missing))
+        return {name: cache[name] for name in registers if name in cache}
+
+    async def read_register_snapshot(self) -> RegisterSnapshot:
+        """Read all registers in sorted name order.
+
+        The target's register set doesn't change, so the sorted name order
+        is computed once and reused while GDB reports the same registers.
+
+        Returns:
+            RegisterSnapshot with names sorted and values in matching order
+        """
+        regs = await self.read_registers()
+        keys = tuple(regs)
+        if keys != self._reg_keys:
+            self._reg_keys = keys
+            self._reg_names = tuple(sorted(keys))
+        return RegisterSnapshot.from_dict(self._reg_names, regs)
 
     async def read_register(self, name: str) -> int:
         """Read a single register.
@@ -157,16 +285,24 @@ class DebugSession:
 
         Returns:
             Register value
+
+        Raises:
+            ValueError: If GDB has no value for the register
         """
-        self._ensure_started()
-        assert self.gdb is not None
-        return await self.gdb.read_register(name)
+        regs = await self.read_registers([name])
+        if name not in regs:
+            raise ValueError(f"Unknown or unreadable register: {name}")
+        return regs[name]
 
     # === Memory Operations ===
 
     async def read_memory(self, address: int, length: int) -> bytes:
         """Read memory bytes.
 
+        Reads issued concurrently (e.g. under asyncio.gather) are queued
+        and merged into as few GDB requests as possible; a lone read is
+        sent on the next event loop iteration.
+
         Args:
             address: Start address
             length: Number of bytes to read
@@ -175,8 +311,30 @@ class DebugSession:
             Memory contents as bytes
         """
         self._ensure_started()
-        assert self.gdb is not None
-        return await self.gdb.read_memory(address, length)
+        self._check_cache_generation()
+        cached = self._cached_memory(address, length)
+        if cached is not None:
+            return cached
+
+        generation = self.run_generation
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[bytes]" = loop.create_future()
+        self._pending_reads.append(_PendingRead(address, length, future))
+        if self._flush_task is None:
+            self._flush_task = loop.create_task(self._flush_reads())
+        data = await future
+
+        # Don't cache a read that raced with something changing the target
+        # or was taken while it may still be running
+        if (
+            len(data) == length
+            and generation == self.run_generation
+            and not self._target_running
+        ):
+            self._mem_cache[(address, length)] = data
+            if len(self._mem_cache) > self.MEMORY_CACHE_SIZE:
+                self._mem_cache.popitem(last=False)
+        return data
 
     async def write_memory(self, address: int, data: bytes) -> bool:
         """Write memory bytes.
@@ -188,9 +346,11 @@ class DebugSession:
         Returns:
             True if write succeeded
         """
-        self._ensure_started()
-        assert self.gdb is not None
-        return await self.gdb.write_memory(address, data)
+        gdb = self._started_gdb()
+        try:
+            return await gdb.write_memory(address, data)
+        finally:
+            self.run_generation += 1
 
     async def read_memory_word(self, address: int) -> int:
         """Read a 32-bit word from memory.
@@ -201,9 +361,22 @@ class DebugSession:
         Returns:
             32-bit value (little-endian)
         """
-        self._ensure_started()
-        assert self.gdb is not None
-        return await self.gdb.read_memory_word(address)
+        data = await self.read_memory(address, 4)
+        return int.from_bytes(data, byteorder="little")
+
+    async def read_memory_words(self, address: int, count: int) -> List[int]:
+        """Read consecutive 32-bit words with a single memory read.
+
+        Args:
+            address: Address of the first word (should be 4-byte aligned)
+            count: Number of words
+
+        Returns:
+            32-bit values (little-endian); fewer than count if the read
+            came back short
+        """
+        data = await self.read_memory(address, 4 * count)
+        return list(struct.unpack_from(f"<{len(data) // 4}I", data))
 
     # === Breakpoints ===
 
@@ -223,9 +396,23 @@ class DebugSession:
         Returns:
             BreakpointInfo for the created breakpoint
         """
-        self._ensure_started()
-        assert self.gdb is not None
-        return await self.gdb.set_breakpoint(location, condition, temporary)
+        gdb = self._started_gdb()
+        return await gdb.set_breakpoint(location, condition, temporary)
+
+    async def set_breakpoints(self, locations: List[str]) -> List[BreakpointInfo]:
+        """Set several breakpoints in one GDB round-trip.
+
+        Useful ahead of continue_execution() when running to the first of
+        several locations.
+
+        Args:
+            locations: Function names, file:line, or *address
+
+        Returns:
+            BreakpointInfo per location, in the same order
+        """
+        gdb = self._started_gdb()
+        return await gdb.set_breakpoints(locations)
 
     async def delete_breakpoint(self, number: int) -> bool:
         """Delete a breakpoint.
@@ -236,9 +423,8 @@ class DebugSession:
         Returns:
             True if deleted successfully
         """
-        self._ensure_started()
-        assert self.gdb is not None
-        return await self.gdb.delete_breakpoint(number)
+        gdb = self._started_gdb()
+        return await gdb.delete_breakpoint(number)
 
     # === Analysis ===
 
@@ -251,9 +437,12 @@ class DebugSession:
         Returns:
             Result as string
         """
-        self._ensure_started()
-        assert self.gdb is not None
-        result = await self.gdb.evaluate(expression)
+        gdb = self._started_gdb()
+        try:
+            result = await gdb.evaluate(expression)
+        finally:
+            # Expressions may assign to variables or call functions
+            self.run_generation += 1
         return result.value
 
     async def get_backtrace(self, max_frames: int = 20) -> List[Dict[str, Any]]:
@@ -265,9 +454,36 @@ class DebugSession:
         Returns:
             List of frame dicts with addr, func, file, line
         """
-        self._ensure_started()
-        assert self.gdb is not None
-        return await self.gdb.get_backtrace(max_frames)
+        gdb = self._started_gdb()
+        return await gdb.get_backtrace(max_frames)
+
+    async def iter_backtrace(
+        self, batch_size: int = 4, max_frames: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield stack frames innermost first, fetching them in small batches.
+
+        Callers that only need the top frame(s) can stop early without GDB
+        unwinding the rest of the stack.
+
+        Args:
+            batch_size: Frames requested from GDB per round-trip
+            max_frames: Stop after this many frames (None for the whole stack)
+
+        Yields:
+            Frame dicts with level, addr, func, file, line
+        """
+        gdb = self._started_gdb()
+        low = 0
+        while max_frames is None or low < max_frames:
+            high = low + batch_size - 1
+            if max_frames is not None:
+                high = min(high, max_frames - 1)
+            frames = await gdb.get_backtrace_range(low, high)
+            for frame in frames:
+                yield frame
+            if len(frames) < high - low + 1:
+                return
+            low = high + 1
 
     # === Snapshots (via QEMU) ===
 
@@ -282,9 +498,8 @@ class DebugSession:
         Returns:
             True if saved successfully
         """
-        self._ensure_started()
-        assert self.qemu is not None
-        return await self.qemu.save_snapshot(name)
+        qemu = self._started_qemu()
+        return await qemu.save_snapshot(name)
 
     async def load_snapshot(self, name: str) -> bool:
         """Load VM snapshot.
@@ -295,9 +510,11 @@ class DebugSession:
         Returns:
             True if loaded successfully
         """
-        self._ensure_started()
-        assert self.qemu is not None
-        return await self.qemu.load_snapshot(name)
+        qemu = self._started_qemu()
+        try:
+            return await qemu.load_snapshot(name)
+        finally:
+            self.run_generation += 1
 
     # === VM Control (via QEMU) ===
 
@@ -307,9 +524,11 @@ class DebugSession:
         Returns:
             True if reset successfully
         """
-        self._ensure_started()
-        assert self.qemu is not None
-        return await self.qemu.reset()
+        qemu = self._started_qemu()
+        try:
+            return await qemu.reset()
+        finally:
+            self.run_generation += 1
 
     # === Internal ===
 
@@ -318,6 +537,118 @@ class DebugSession:
         if not self._started:
             raise RuntimeError("Debug session not started")
 
+    def _started_gdb(self) -> GDBBridge:
+        """Return the GDB bridge, raising if the session isn't started."""
+        gdb = self.gdb
+        if not self._started or gdb is None:
+            raise RuntimeError("Debug session not started")
+        return gdb
+
+    def _started_qemu(self) -> QEMUController:
+        """Return the QEMU controller, raising if the session isn't started."""
+        qemu = self.qemu
+        if not self._started or qemu is None:
+            raise RuntimeError("Debug session not started")
+        return qemu
+
+    def _check_cache_generation(self) -> None:
+        """Drop cached reads if the target may have changed since they were taken."""
+        if self._cache_generation != self.run_generation:
+            self._clear_caches()
+            self._cache_generation = self.run_generation
+
+    def _clear_caches(self) -> None:
+        """Drop all cached register and memory values."""
+        self._mem_cache.clear()
+        self._reg_cache.clear()
+        self._reg_file_cached = False
+        self._all_regs_cache = None
+
+    def _cached_memory(self, address: int, length: int) -> Optional[bytes]:
+        """Look up a cached range equal to or enclosing [address, address + length)."""
+        cache = self._mem_cache
+        key = (address, length)
+        data = cache.get(key)
+        if data is not None:
+            cache.move_to_end(key)
+            return data
+        end = address + length
+        for (start, size), data in cache.items():
+            if start <= address and end <= start + size:
+                cache.move_to_end((start, size))
+                return data[address - start:end - start]
+        return None
+
+    async def _flush_reads(self) -> None:
+        """Serve all queued reads, merging adjacent or overlapping ranges.
+
+        Every queued read is resolved, with an exception if the flush
+        fails partway (e.g. the session was stopped while reads waited).
+        """
+        pending, self._pending_reads = self._pending_reads, []
+        self._flush_task = None
+        pending.sort(key=lambda p: p.address)
+
+        error: BaseException = RuntimeError("Memory read was not served")
+        try:
+            group = [pending[0]]
+            start = pending[0].address
+            end = start + pending[0].length
+            for read in pending[1:]:
+                read_end = max(end, read.address + read.length)
+                if (
+                    read.address - end <= self.COALESCE_GAP
+                    and read_end - start <= self.MAX_COALESCED_READ
+                ):
+                    group.append(read)
+                    end = read_end
+                    continue
+                await self._read_group(start, end, group)
+                group = [read]
+                start = read.address
+                end = start + read.length
+            await self._read_group(start, end, group)
+        except Exception as e:
+            error = e
+        finally:
+            # Anything still unresolved would leave its caller waiting forever
+            for read in pending:
+                if not read.future.done():
+                    read.future.set_exception(error)
+
+    async def _read_group(self, start: int, end: int, group: List[_PendingRead]) -> None:
+        """Read [start, end) in one request and hand each read its slice.
+
+        If the merged read fails or comes back short (e.g. the gap between
+        two reads isn't readable), each read is retried on its own.
+        """
+        gdb = self._started_gdb()
+        try:
+            data = await gdb.read_memory(start, end - start)
+        except Exception as e:
+            if len(group) == 1:
+                if not group[0].future.done():
+                    group[0].future.set_exception(e)
+                return
+            data = b""
+
+        if len(data) < end - start and len(group) > 1:
+            for read in group:
+                await self._read_group(read.address, read.address + read.length, [read])
+            return
+
+        if len(group) == 1:
+            if not group[0].future.done():
+                group[0].future.set_result(data)
+            return
+
+        # Each read gets its own bytes, so neither callers nor the cache keep
+        # the whole merged buffer alive
+        for read in group:
+            if not read.future.done():
+                offset = read.address - start
+                read.future.set_result(data[offset:offset + read.length])
+
     # === Context Manager ===
 
     async def __aenter__(self) -> "DebugSession":
@@ -1,11 +1,12 @@
 """Shared data types for the unconcealer debugger."""
 
+from array import array
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Sequence, Tuple
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True)
 class DebugConfig:
     """Configuration for a debug session."""
     elf_path: Path
@@ -18,7 +19,7 @@ class DebugConfig:
     extra_qemu_args: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class DebugContext:
     """Current debugging context."""
     pc: int = 0
@@ -27,3 +28,35 @@ class DebugContext:
     current_function: Optional[str] = None
     source_file: Optional[str] = None
     source_line: Optional[int] = None
+
+
+@dataclass
+class RegisterSnapshot:
+    """Register values in a fixed name order.
+
+    Names and values are kept as parallel sequences so the register set can
+    be iterated in display order without sorting or building tuples.
+    """
+    names: Tuple[str, ...]
+    values: Sequence[int]
+
+    @classmethod
+    def from_dict(cls, names: Tuple[str, ...], regs: Dict[str, int]) -> "RegisterSnapshot":
+        """Build a snapshot from a register dict, ordered by ``names``."""
+        ordered = [regs[name] for name in names]
+        try:
+            values: Sequence[int] = array("Q", ordered)
+        except OverflowError:
+            # Wide (vector) or negative values don't fit a machine word
+            values = ordered
+        return cls(names=names, values=values)
+
+    def __iter__(self) -> Iterator[Tuple[str, int]]:
+        return zip(self.names, self.values)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def to_dict(self) -> Dict[str, int]:
+        """Get registers as a name -> value dict."""
+        return dict(zip(self.names, self.values))
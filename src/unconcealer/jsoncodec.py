@@ -0,0 +1,43 @@
+"""JSON encoding shared by the MCP server and the command interface.
+
+Uses orjson when it is installed (pip install unconcealer[fast]) and falls
+back to the standard library otherwise. Both paths produce the same JSON.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # optional: pip install unconcealer[fast]
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def dumps_line(obj: Any) -> bytes:
+    """Serialize to one newline-terminated JSON line without a concatenation copy."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        )
+    return (json.dumps(obj, ensure_ascii=False, separators=(",", ":")) + "\n").encode()
+
+
+def dumps_pretty(obj: Any) -> str:
+    """Serialize to JSON indented by two spaces, for files and terminal output."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, indent=2)
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """Parse JSON text or UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -5,12 +5,15 @@ with multiple targets concurrently.
 """
 
 import asyncio
+import heapq
 import logging
 import os
+import re
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Pattern, Set, Tuple
 
 from unconcealer.core.session import DebugSession
 from unconcealer.tools.qemu_control import QEMUConfig
@@ -19,7 +22,7 @@ from unconcealer.arch import detect_architecture, get_architecture, TargetArchit
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionInfo:
     """Information about a debug session."""
 
@@ -29,9 +32,52 @@ class SessionInfo:
     cpu: str
     gdb_port: int
     architecture: str = "cortex-m"
-    created_at: datetime = field(default_factory=datetime.now)
+    # time.monotonic_ns() at creation, for ordering and age; unaffected by
+    # clock steps, unlike created_wall_ns which is only for display
+    created_at_ns: int = field(default_factory=time.monotonic_ns)
+    created_wall_ns: int = field(default_factory=time.time_ns)
     session: Optional[DebugSession] = None
     is_active: bool = False
+    # Handler for `architecture`, resolved once when the session starts
+    arch: Optional[TargetArchitecture] = field(default=None, repr=False)
+    # Serializes starting/stopping this session without blocking the others
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False, compare=False)
+    # Serialized form from to_dict(); rebuilt when is_active changes
+    _cached_dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def created_at(self) -> datetime:
+        """Wall-clock creation time."""
+        return datetime.fromtimestamp(self.created_wall_ns / 1e9)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize session details.
+
+        The result is cached and shared between calls, so treat it as
+        read-only. Only is_active changes after a session is created.
+
+        Returns:
+            Dictionary with session details
+        """
+        cached = self._cached_dict
+        if cached is not None:
+            if cached["is_active"] != self.is_active:
+                # Copy so earlier results stay as they were; created_at is kept
+                cached = self._cached_dict = {**cached, "is_active": self.is_active}
+            return cached
+        cached = self._cached_dict = {
+            "name": self.name,
+            "elf_path": self.elf_path,
+            "machine": self.machine,
+            "cpu": self.cpu,
+            "gdb_port": self.gdb_port,
+            "architecture": self.architecture,
+            "created_at": self.created_at.isoformat(),
+            "is_active": self.is_active,
+        }
+        return cached
 
 
 class SessionManager:
@@ -82,7 +128,17 @@ class SessionManager:
         self._sessions: Dict[str, SessionInfo] = {}
         self._current_name: Optional[str] = None
         self._next_port = 1234
-        self._lock = asyncio.Lock()
+        # Auto-allocated ports in use, and freed ones (a min-heap) to reuse
+        self._allocated_ports: Set[int] = set()
+        self._free_ports: List[int] = []
+        # Guards _sessions, _current_name and name/port allocation only;
+        # per-session work is serialized by SessionInfo.lock
+        self._dict_lock = asyncio.Lock()
+        # Bumped whenever the name -> session mapping or the current session
+        # changes, so callers can cache lookups while it holds still
+        self.generation = 0
+        # Next suffix for auto-generated names, per ELF stem
+        self._stem_counters: Dict[str, int] = {}
 
         # Configuration from environment or parameters
         self.gdb_path = gdb_path or os.environ.get(
@@ -101,25 +157,36 @@ class SessionManager:
             or os.environ.get("DEBUGGER_SNAPSHOT_DIR", "/tmp/unconcealer")
         )
         self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        # (pattern, qemu_paths key) pairs tried in order; ARM is the fallback
+        self._qemu_dispatch: List[Tuple[Pattern[str], str]] = [
+            (re.compile(r"rv64|riscv64"), "riscv64"),
+            (re.compile(r"rv32|riscv32|sifive"), "riscv32"),
+        ]
 
     def _get_qemu_path(self, machine: str, cpu: str) -> str:
         """Get QEMU executable path based on target."""
-        cpu_lower = cpu.lower()
-        machine_lower = machine.lower()
-
-        if "rv64" in cpu_lower or "riscv64" in machine_lower:
-            return self.qemu_paths["riscv64"]
-        elif "rv32" in cpu_lower or "riscv32" in machine_lower or "sifive" in machine_lower:
-            return self.qemu_paths["riscv32"]
-        else:
-            return self.qemu_paths["arm"]
+        target = f"{machine} {cpu}".lower()
+        for pattern, key in self._qemu_dispatch:
+            if pattern.search(target):
+                return self.qemu_paths[key]
+        return self.qemu_paths["arm"]
 
     def _allocate_port(self) -> int:
-        """Allocate a unique GDB port."""
-        port = self._next_port
-        self._next_port += 1
+        """Allocate a unique GDB port, reusing the lowest freed one first."""
+        if self._free_ports:
+            port = heapq.heappop(self._free_ports)
+        else:
+            port = self._next_port
+            self._next_port += 1
+        self._allocated_ports.add(port)
         return port
 
+    def _release_port(self, port: int) -> None:
+        """Return an auto-allocated port to the pool (caller-chosen ports are ignored)."""
+        if port in self._allocated_ports:
+            self._allocated_ports.remove(port)
+            heapq.heappush(self._free_ports, port)
+
     async def start_session(
         self,
         elf_path: str,
@@ -144,21 +211,28 @@ class SessionManager:
             FileNotFoundError: If ELF file doesn't exist
             RuntimeError: If session start fails
         """
-        async with self._lock:
-            # Validate ELF exists
-            elf = Path(elf_path).expanduser().resolve()
-            if not elf.exists():
-                raise FileNotFoundError(f"ELF file not found: {elf}")
-
+        # Validate ELF exists
+        elf = Path(elf_path).expanduser().resolve()
+        if not elf.exists():
+            raise FileNotFoundError(f"ELF file not found: {elf}")
+
+        arch_name = detect_architecture(cpu, machine)
+        # Resolved before a port is reserved, so a failure here can't leak one
+        arch = get_architecture(arch_name)
+
+        # Reserve the name and port under the dict lock; booting QEMU/GDB
+        # happens under the session's own lock so several can start at once
+        async with self._dict_lock:
             # Generate name if needed
             if name is None:
-                name = elf.stem
-                # Ensure unique name
-                base_name = name
-                counter = 1
+                stem = elf.stem
+                counter = self._stem_counters.get(stem, 0)
+                name = f"{stem}_{counter}" if counter else stem
+                # Only loops past names the caller picked explicitly
                 while name in self._sessions:
-                    name = f"{base_name}_{counter}"
                     counter += 1
+                    name = f"{stem}_{counter}"
+                self._stem_counters[stem] = counter + 1
 
             if name in self._sessions:
                 raise ValueError(f"Session '{name}' already exists")
@@ -166,32 +240,7 @@ class SessionManager:
             # Allocate port
             port = gdb_port or self._allocate_port()
 
-            # Create QEMU config
-            qemu_path = self._get_qemu_path(machine, cpu)
-            config = QEMUConfig(
-                machine=machine,
-                cpu=cpu,
-                gdb_port=port,
-                qemu_path=qemu_path,
-            )
-
-            # Create and start session
-            session = DebugSession(
-                elf_path=str(elf),
-                qemu_config=config,
-                gdb_path=self.gdb_path,
-            )
-
-            try:
-                await session.start()
-            except Exception as e:
-                logger.error(f"Failed to start session '{name}': {e}")
-                raise RuntimeError(f"Failed to start session: {e}")
-
-            # Detect architecture
-            arch_name = detect_architecture(cpu, machine)
-
-            # Register session
+            # Inactive placeholder until the session is up
             info = SessionInfo(
                 name=name,
                 elf_path=str(elf),
@@ -199,17 +248,68 @@ class SessionManager:
                 cpu=cpu,
                 gdb_port=port,
                 architecture=arch_name,
-                session=session,
-                is_active=True,
+                arch=arch,
             )
             self._sessions[name] = info
+            await info.lock.acquire()
+
+        try:
+            return await self._boot_session(info, elf)
+        finally:
+            info.lock.release()
+
+    async def _boot_session(self, info: SessionInfo, elf: Path) -> SessionInfo:
+        """Start QEMU/GDB for a registered placeholder (caller holds info.lock)."""
+        name, machine, cpu, port = info.name, info.machine, info.cpu, info.gdb_port
+
+        # Create QEMU config
+        qemu_path = self._get_qemu_path(machine, cpu)
+        config = QEMUConfig(
+            machine=machine,
+            cpu=cpu,
+            gdb_port=port,
+            qemu_path=qemu_path,
+        )
 
-            # Set as current if first session
-            if self._current_name is None:
-                self._current_name = name
+        # Create and start session
+        session = DebugSession(
+            elf_path=str(elf),
+            qemu_config=config,
+            gdb_path=self.gdb_path,
+        )
 
-            logger.info(f"Started session '{name}' for {elf}")
-            return info
+        try:
+            await session.start()
+        except Exception as e:
+            async with self._dict_lock:
+                owned = self._sessions.get(name) is info
+                if owned:
+                    del self._sessions[name]
+                    self.generation += 1
+            # Otherwise stop_session() popped it and releases the port itself
+            if owned:
+                self._release_port(port)
+            logger.error(f"Failed to start session '{name}': {e}")
+            raise RuntimeError(f"Failed to start session: {e}")
+
+        async with self._dict_lock:
+            registered = self._sessions.get(name) is info
+            if registered:
+                info.session = session
+                info.is_active = True
+                self.generation += 1
+
+                # Set as current if first session
+                if self._current_name is None:
+                    self._current_name = name
+
+        if not registered:
+            # stop_session() removed the placeholder while we were booting
+            await session.stop()
+            raise RuntimeError(f"Session '{name}' was stopped while starting")
+
+        logger.info(f"Started session '{name}' for {elf}")
+        return info
 
     async def stop_session(self, name: str) -> bool:
         """Stop a debug session.
@@ -220,18 +320,13 @@ class SessionManager:
         Returns:
             True if session was stopped
         """
-        async with self._lock:
-            if name not in self._sessions:
+        # Only the bookkeeping takes the dict lock, so several sessions can
+        # shut down at once (see stop_all)
+        async with self._dict_lock:
+            info = self._sessions.pop(name, None)
+            if info is None:
                 return False
-
-            info = self._sessions[name]
-            if info.session:
-                try:
-                    await info.session.stop()
-                except Exception as e:
-                    logger.warning(f"Error stopping session '{name}': {e}")
-
-            del self._sessions[name]
+            self.generation += 1
 
             # Update current if needed
             if self._current_name == name:
@@ -239,14 +334,29 @@ class SessionManager:
                     next(iter(self._sessions.keys())) if self._sessions else None
                 )
 
-            logger.info(f"Stopped session '{name}'")
-            return True
+        # Waits for an in-flight start of this session to finish
+        async with info.lock:
+            if info.session:
+                try:
+                    await info.session.stop()
+                except Exception as e:
+                    logger.warning(f"Error stopping session '{name}': {e}")
+
+        # Only reuse the port once QEMU has let go of it
+        self._release_port(info.gdb_port)
+        logger.info(f"Stopped session '{name}'")
+        return True
 
     async def stop_all(self) -> None:
-        """Stop all sessions."""
+        """Stop all sessions concurrently."""
         names = list(self._sessions.keys())
-        for name in names:
-            await self.stop_session(name)
+        results = await asyncio.gather(
+            *(self.stop_session(name) for name in names),
+            return_exceptions=True,
+        )
+        for name, result in zip(names, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Error stopping session '{name}': {result}")
 
     def get_session(self, name: str) -> Optional[DebugSession]:
         """Get a session by name.
@@ -284,7 +394,9 @@ class SessionManager:
             True if session exists and was set as current
         """
         if name in self._sessions:
-            self._current_name = name
+            if name != self._current_name:
+                self._current_name = name
+                self.generation += 1
             return True
         return False
 
@@ -325,7 +437,9 @@ class SessionManager:
         if info is None:
             return None
 
-        return get_architecture(info.architecture)
+        if info.arch is None:
+            info.arch = get_architecture(info.architecture)
+        return info.arch
 
     def get_current_architecture(self) -> Optional[TargetArchitecture]:
         """Get architecture handler for current session.
@@ -343,17 +457,5 @@ class SessionManager:
         """
         return {
             "current": self._current_name,
-            "sessions": [
-                {
-                    "name": info.name,
-                    "elf_path": info.elf_path,
-                    "machine": info.machine,
-                    "cpu": info.cpu,
-                    "gdb_port": info.gdb_port,
-                    "architecture": info.architecture,
-                    "created_at": info.created_at.isoformat(),
-                    "is_active": info.is_active,
-                }
-                for info in self._sessions.values()
-            ],
+            "sessions": [info.to_dict() for info in self._sessions.values()],
         }
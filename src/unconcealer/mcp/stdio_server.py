@@ -5,16 +5,41 @@ over stdin/stdout, which is the transport Claude Desktop uses.
 """
 
 import asyncio
-import json
 import logging
 import os
 import sys
-from typing import Any, Dict, List, Optional
-
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from unconcealer import jsoncodec
+from unconcealer.arch import TargetArchitecture
+from unconcealer.core.session import DebugSession
 from unconcealer.mcp.session_manager import SessionManager
+from unconcealer.toolutil import hex_dump, resolve_address
 
 logger = logging.getLogger(__name__)
 
+# asyncio.eager_task_factory (Python 3.12+) runs a task's first step
+# immediately; older versions schedule it on the loop instead
+_eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+
+
+# %-templates for (name, value) register lines; map()ing a template's
+# __mod__ over dict items formats every line without a Python-level loop
+_REGISTER_LINE = "%4s: 0x%08x"
+_RAW_REGISTER_LINE = "  %s: 0x%08x"
+_STACKED_REGISTER_LINE = "  %6s: 0x%08x"
+
 
 def _text_response(text: str, is_error: bool = False) -> Dict[str, Any]:
     """Create a standard text response."""
@@ -24,424 +49,528 @@ def _text_response(text: str, is_error: bool = False) -> Dict[str, Any]:
     return result
 
 
-class StdioMcpServer:
-    """MCP server that communicates over stdio.
-
-    This server handles the MCP JSON-RPC protocol over stdin/stdout,
-    providing debug tools to Claude Desktop.
-    """
-
-    def __init__(
-        self,
-        session_manager: SessionManager,
-        server_name: str = "unconcealer",
-        server_version: str = "0.1.0",
-    ):
-        """Initialize the stdio server.
-
-        Args:
-            session_manager: Session manager for debug sessions
-            server_name: Server name for MCP protocol
-            server_version: Server version
-        """
-        self.session_manager = session_manager
-        self.server_name = server_name
-        self.server_version = server_version
-        self._running = False
-
-        # Define available tools
-        self._tools = self._build_tool_definitions()
-
-    def _build_tool_definitions(self) -> List[Dict[str, Any]]:
-        """Build the list of tool definitions for MCP."""
-        return [
-            # Session management
-            {
-                "name": "start_session",
-                "description": "Start a new debug session with QEMU and GDB.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "elf_path": {
-                            "type": "string",
-                            "description": "Path to ELF binary file",
-                        },
-                        "machine": {
-                            "type": "string",
-                            "description": "QEMU machine type (e.g., lm3s6965evb, mps2-an385)",
-                            "default": "lm3s6965evb",
-                        },
-                        "cpu": {
-                            "type": "string",
-                            "description": "CPU type (e.g., cortex-m3, cortex-m4)",
-                            "default": "cortex-m3",
-                        },
-                        "name": {
-                            "type": "string",
-                            "description": "Session name (auto-generated if not specified)",
-                        },
-                    },
-                    "required": ["elf_path"],
+def _build_tool_definitions() -> List[Dict[str, Any]]:
+    """Build the list of tool definitions for MCP."""
+    return [
+        # Session management
+        {
+            "name": "start_session",
+            "description": "Start a new debug session with QEMU and GDB.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "elf_path": {
+                        "type": "string",
+                        "description": "Path to ELF binary file",
+                    },
+                    "machine": {
+                        "type": "string",
+                        "description": "QEMU machine type (e.g., lm3s6965evb, mps2-an385)",
+                        "default": "lm3s6965evb",
+                    },
+                    "cpu": {
+                        "type": "string",
+                        "description": "CPU type (e.g., cortex-m3, cortex-m4)",
+                        "default": "cortex-m3",
+                    },
+                    "name": {
+                        "type": "string",
+                        "description": "Session name (auto-generated if not specified)",
+                    },
                 },
+                "required": ["elf_path"],
             },
-            {
-                "name": "stop_session",
-                "description": "Stop a debug session and cleanup resources.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "name": {
-                            "type": "string",
-                            "description": "Session name to stop",
-                        },
-                    },
-                    "required": ["name"],
+        },
+        {
+            "name": "stop_session",
+            "description": "Stop a debug session and cleanup resources.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "name": {
+                        "type": "string",
+                        "description": "Session name to stop",
+                    },
                 },
+                "required": ["name"],
             },
-            {
-                "name": "list_sessions",
-                "description": "List all active debug sessions.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {},
-                },
+        },
+        {
+            "name": "list_sessions",
+            "description": "List all active debug sessions.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {},
             },
-            # Register operations
-            {
-                "name": "read_registers",
-                "description": "Read CPU registers. Returns all registers if none specified.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "registers": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "List of register names (optional)",
-                        },
-                        "session": {
-                            "type": "string",
-                            "description": "Session name (uses current if not specified)",
-                        },
+        },
+        # Register operations
+        {
+            "name": "read_registers",
+            "description": "Read CPU registers. Returns all registers if none specified.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "registers": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "List of register names (optional)",
+                    },
+                    "session": {
+                        "type": "string",
+                        "description": "Session name (uses current if not specified)",
                     },
                 },
             },
-            # Memory operations
-            {
-                "name": "read_memory",
-                "description": "Read memory at address. Address can be hex (0x...) or symbol name.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "address": {
-                            "type": "string",
-                            "description": "Memory address (hex) or symbol name",
-                        },
-                        "length": {
-                            "type": "integer",
-                            "description": "Number of bytes to read",
-                            "default": 64,
-                        },
-                        "session": {
-                            "type": "string",
-                            "description": "Session name",
-                        },
-                    },
-                    "required": ["address"],
+        },
+        # Memory operations
+        {
+            "name": "read_memory",
+            "description": "Read memory at address. Address can be hex (0x...) or symbol name.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "address": {
+                        "type": "string",
+                        "description": "Memory address (hex) or symbol name",
+                    },
+                    "length": {
+                        "type": "integer",
+                        "description": "Number of bytes to read",
+                        "default": 64,
+                    },
+                    "session": {
+                        "type": "string",
+                        "description": "Session name",
+                    },
                 },
+                "required": ["address"],
             },
-            {
-                "name": "write_memory",
-                "description": "Write bytes to memory. Data as hex string (e.g., 'deadbeef').",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "address": {
-                            "type": "string",
-                            "description": "Memory address (hex) or symbol name",
-                        },
-                        "data": {
-                            "type": "string",
-                            "description": "Hex string of bytes to write",
-                        },
-                        "session": {
-                            "type": "string",
-                            "description": "Session name",
-                        },
-                    },
-                    "required": ["address", "data"],
+        },
+        {
+            "name": "write_memory",
+            "description": "Write bytes to memory. Data as hex string (e.g., 'deadbeef').",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "address": {
+                        "type": "string",
+                        "description": "Memory address (hex) or symbol name",
+                    },
+                    "data": {
+                        "type": "string",
+                        "description": "Hex string of bytes to write",
+                    },
+                    "session": {
+                        "type": "string",
+                        "description": "Session name",
+                    },
                 },
+                "required": ["address", "data"],
             },
-            # Execution control
-            {
-                "name": "continue_execution",
-                "description": "Continue execution until breakpoint, watchpoint, or exception.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "session": {
-                            "type": "string",
-                            "description": "Session name",
-                        },
+        },
+        # Execution control
+        {
+            "name": "continue_execution",
+            "description": "Continue execution until breakpoint, watchpoint, or exception.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "session": {
+                        "type": "string",
+                        "description": "Session name",
                     },
                 },
             },
-            {
-                "name": "step",
-                "description": "Single-step execution. Use instruction=true for assembly-level step.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "instruction": {
-                            "type": "boolean",
-                            "description": "Step by instruction (vs source line)",
-                            "default": False,
-                        },
-                        "session": {
-                            "type": "string",
-                            "description": "Session name",
-                        },
+        },
+        {
+            "name": "step",
+            "description": "Single-step execution. Use instruction=true for assembly-level step.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "instruction": {
+                        "type": "boolean",
+                        "description": "Step by instruction (vs source line)",
+                        "default": False,
+                    },
+                    "session": {
+                        "type": "string",
+                        "description": "Session name",
                     },
                 },
             },
-            {
-                "name": "step_over",
-                "description": "Step over function calls.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "instruction": {
-                            "type": "boolean",
-                            "description": "Step by instruction",
-                            "default": False,
-                        },
-                        "session": {
-                            "type": "string",
-                            "description": "Session name",
-                        },
+        },
+        {
+            "name": "step_over",
+            "description": "Step over function calls.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "instruction": {
+                        "type": "boolean",
+                        "description": "Step by instruction",
+                        "default": False,
+                    },
+                    "session": {
+                        "type": "string",
+                        "description": "Session name",
                     },
                 },
             },
-            {
-                "name": "halt",
-                "description": "Halt execution immediately.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "session": {
-                            "type": "string",
-                            "description": "Session name",
-                        },
+        },
+        {
+            "name": "halt",
+            "description": "Halt execution immediately.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "session": {
+                        "type": "string",
+                        "description": "Session name",
                     },
                 },
             },
-            {
-                "name": "reset",
-                "description": "Reset the target to initial state.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "session": {
-                            "type": "string",
-                            "description": "Session name",
-                        },
+        },
+        {
+            "name": "reset",
+            "description": "Reset the target to initial state.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "session": {
+                        "type": "string",
+                        "description": "Session name",
                     },
                 },
             },
-            # Breakpoints
-            {
-                "name": "set_breakpoint",
-                "description": "Set breakpoint at function name, file:line, or *address.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "location": {
-                            "type": "string",
-                            "description": "Breakpoint location (function, file:line, *address)",
-                        },
-                        "condition": {
-                            "type": "string",
-                            "description": "Breakpoint condition expression",
-                        },
-                        "temporary": {
-                            "type": "boolean",
-                            "description": "Delete after first hit",
-                            "default": False,
-                        },
-                        "session": {
-                            "type": "string",
-                            "description": "Session name",
-                        },
-                    },
-                    "required": ["location"],
+        },
+        # Breakpoints
+        {
+            "name": "set_breakpoint",
+            "description": "Set breakpoint at function name, file:line, or *address.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "location": {
+                        "type": "string",
+                        "description": "Breakpoint location (function, file:line, *address)",
+                    },
+                    "condition": {
+                        "type": "string",
+                        "description": "Breakpoint condition expression",
+                    },
+                    "temporary": {
+                        "type": "boolean",
+                        "description": "Delete after first hit",
+                        "default": False,
+                    },
+                    "session": {
+                        "type": "string",
+                        "description": "Session name",
+                    },
                 },
+                "required": ["location"],
             },
-            {
-                "name": "delete_breakpoint",
-                "description": "Delete a breakpoint by number.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "number": {
-                            "type": "integer",
-                            "description": "Breakpoint number",
-                        },
-                        "session": {
-                            "type": "string",
-                            "description": "Session name",
-                        },
-                    },
-                    "required": ["number"],
+        },
+        {
+            "name": "delete_breakpoint",
+            "description": "Delete a breakpoint by number.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "number": {
+                        "type": "integer",
+                        "description": "Breakpoint number",
+                    },
+                    "session": {
+                        "type": "string",
+                        "description": "Session name",
+                    },
                 },
+                "required": ["number"],
             },
-            # Stack & Analysis
-            {
-                "name": "backtrace",
-                "description": "Get call stack backtrace.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "max_frames": {
-                            "type": "integer",
-                            "description": "Maximum number of frames",
-                            "default": 20,
-                        },
-                        "session": {
-                            "type": "string",
-                            "description": "Session name",
-                        },
+        },
+        # Stack & Analysis
+        {
+            "name": "backtrace",
+            "description": "Get call stack backtrace.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "max_frames": {
+                        "type": "integer",
+                        "description": "Maximum number of frames",
+                        "default": 20,
+                    },
+                    "session": {
+                        "type": "string",
+                        "description": "Session name",
                     },
                 },
             },
-            {
-                "name": "evaluate",
-                "description": "Evaluate a C expression in current context.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "expression": {
-                            "type": "string",
-                            "description": "C expression to evaluate",
-                        },
-                        "session": {
-                            "type": "string",
-                            "description": "Session name",
-                        },
-                    },
-                    "required": ["expression"],
+        },
+        {
+            "name": "evaluate",
+            "description": "Evaluate a C expression in current context.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "expression": {
+                        "type": "string",
+                        "description": "C expression to evaluate",
+                    },
+                    "session": {
+                        "type": "string",
+                        "description": "Session name",
+                    },
                 },
+                "required": ["expression"],
             },
-            # Snapshots
-            {
-                "name": "save_snapshot",
-                "description": "Save VM state snapshot for later restoration.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "name": {
-                            "type": "string",
-                            "description": "Snapshot name",
-                        },
-                        "session": {
-                            "type": "string",
-                            "description": "Session name",
-                        },
-                    },
-                    "required": ["name"],
+        },
+        # Snapshots
+        {
+            "name": "save_snapshot",
+            "description": "Save VM state snapshot for later restoration.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "name": {
+                        "type": "string",
+                        "description": "Snapshot name",
+                    },
+                    "session": {
+                        "type": "string",
+                        "description": "Session name",
+                    },
                 },
+                "required": ["name"],
             },
-            {
-                "name": "load_snapshot",
-                "description": "Restore VM to a previous snapshot.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "name": {
-                            "type": "string",
-                            "description": "Snapshot name",
-                        },
-                        "session": {
-                            "type": "string",
-                            "description": "Session name",
-                        },
-                    },
-                    "required": ["name"],
+        },
+        {
+            "name": "load_snapshot",
+            "description": "Restore VM to a previous snapshot.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "name": {
+                        "type": "string",
+                        "description": "Snapshot name",
+                    },
+                    "session": {
+                        "type": "string",
+                        "description": "Session name",
+                    },
                 },
+                "required": ["name"],
             },
-            # Architecture-specific tools
-            {
-                "name": "read_fault_registers",
-                "description": "Read and decode fault/exception registers. For ARM Cortex-M: CFSR, HFSR, MMFAR, BFAR. For RISC-V: mcause, mtval, mepc.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "session": {
-                            "type": "string",
-                            "description": "Session name",
-                        },
+        },
+        # Architecture-specific tools
+        {
+            "name": "read_fault_registers",
+            "description": "Read and decode fault/exception registers. For ARM Cortex-M: CFSR, HFSR, MMFAR, BFAR. For RISC-V: mcause, mtval, mepc.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "session": {
+                        "type": "string",
+                        "description": "Session name",
                     },
                 },
             },
-            {
-                "name": "read_exception_frame",
-                "description": "Parse the stacked exception/trap frame from the stack. Returns registers saved during exception entry.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "stack_pointer": {
-                            "type": "string",
-                            "description": "Stack pointer address (hex). Uses current SP if not specified.",
-                        },
-                        "session": {
-                            "type": "string",
-                            "description": "Session name",
-                        },
+        },
+        {
+            "name": "read_exception_frame",
+            "description": "Parse the stacked exception/trap frame from the stack. Returns registers saved during exception entry.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "stack_pointer": {
+                        "type": "string",
+                        "description": "Stack pointer address (hex). Uses current SP if not specified.",
+                    },
+                    "session": {
+                        "type": "string",
+                        "description": "Session name",
                     },
                 },
             },
-            {
-                "name": "check_interrupt_priorities",
-                "description": "Check interrupt controller configuration and detect issues. For ARM: checks NVIC priorities (e.g., PendSV vs SVCall). For RISC-V: checks PLIC/MIE configuration.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "session": {
-                            "type": "string",
-                            "description": "Session name",
-                        },
+        },
+        {
+            "name": "check_interrupt_priorities",
+            "description": "Check interrupt controller configuration and detect issues. For ARM: checks NVIC priorities (e.g., PendSV vs SVCall). For RISC-V: checks PLIC/MIE configuration.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "session": {
+                        "type": "string",
+                        "description": "Session name",
                     },
                 },
             },
-            {
-                "name": "show_memory_protection",
-                "description": "Display memory protection configuration. For ARM: shows MPU regions. For RISC-V: shows PMP entries.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "session": {
-                            "type": "string",
-                            "description": "Session name",
-                        },
+        },
+        {
+            "name": "show_memory_protection",
+            "description": "Display memory protection configuration. For ARM: shows MPU regions. For RISC-V: shows PMP entries.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "session": {
+                        "type": "string",
+                        "description": "Session name",
                     },
                 },
             },
-            {
-                "name": "analyze_crash",
-                "description": "Perform comprehensive crash analysis. Reads fault state, exception frame, and interrupt configuration to diagnose the crash cause.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "session": {
-                            "type": "string",
-                            "description": "Session name",
-                        },
+        },
+        {
+            "name": "analyze_crash",
+            "description": "Perform comprehensive crash analysis. Reads fault state, exception frame, and interrupt configuration to diagnose the crash cause.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "session": {
+                        "type": "string",
+                        "description": "Session name",
                     },
                 },
             },
-        ]
+        },
+    ]
+
+
+# Tool definitions never change, so they are built and serialized once;
+# tools/list responses splice in the JSON rather than re-encoding it
+_TOOL_DEFINITIONS = _build_tool_definitions()
+_TOOLS_LIST_RESULT = {"tools": _TOOL_DEFINITIONS}
+_TOOLS_LIST_RESULT_JSON = jsoncodec.dumps(_TOOLS_LIST_RESULT)
+
+# Required arguments per tool, taken from the input schemas once
+_REQUIRED_ARGS: Dict[str, Tuple[str, ...]] = {
+    tool["name"]: tuple(tool["inputSchema"].get("required", ()))
+    for tool in _TOOL_DEFINITIONS
+}
+
+
+class StdioMcpServer:
+    """MCP server that communicates over stdio.
+
+    This server handles the MCP JSON-RPC protocol over stdin/stdout,
+    providing debug tools to Claude Desktop.
+    """
+
+    # Longest request line accepted (write_memory payloads can be large)
+    MAX_MESSAGE_SIZE = 16 * 1024 * 1024
+
+    # Bytes requested from stdin per read
+    READ_CHUNK_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        session_manager: SessionManager,
+        server_name: str = "unconcealer",
+        server_version: str = "0.1.0",
+    ):
+        """Initialize the stdio server.
+
+        Args:
+            session_manager: Session manager for debug sessions
+            server_name: Server name for MCP protocol
+            server_version: Server version
+        """
+        self.session_manager = session_manager
+        self.server_name = server_name
+        self.server_version = server_version
+        self._running = False
+
+        # Shared, read-only tool definitions
+        self._tools = _TOOL_DEFINITIONS
+
+        # Invariant results, encoded once; _encode_response splices them in
+        # by identity, so they must not be mutated
+        self._initialize_result: Dict[str, Any] = {
+            "protocolVersion": "2024-11-05",
+            "serverInfo": {
+                "name": self.server_name,
+                "version": self.server_version,
+            },
+            "capabilities": {
+                "tools": {},
+            },
+        }
+        self._static_results: Tuple[Tuple[Dict[str, Any], bytes], ...] = (
+            (_TOOLS_LIST_RESULT, _TOOLS_LIST_RESULT_JSON),
+            (self._initialize_result, jsoncodec.dumps(self._initialize_result)),
+        )
+
+        # (session manager generation, requested name, session) of the
+        # last _get_session lookup
+        self._session_cache: Tuple[int, Optional[str], Optional[DebugSession]] = (
+            -1, None, None
+        )
+
+        # Requests run as tasks so the loop keeps reading and answering;
+        # tool calls still run one at a time so GDB commands never interleave
+        self._tool_lock = asyncio.Lock()
+        self._pending: Set["asyncio.Task[None]"] = set()
+
+        # Response lines finished during the current loop iteration; one
+        # scheduled _flush_out hands them to stdout in a single write and
+        # resolves _flushed, after which each request task drains stdout
+        self._out_queue: List[bytes] = []
+        self._flushed: Optional["asyncio.Future[None]"] = None
 
-    def _get_session(self, args: Dict[str, Any]):
-        """Get session from args or current session."""
+        # Tool name -> handler, so calls dispatch with one dict lookup
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]] = {
+            # Session management
+            "start_session": self._tool_start_session,
+            "stop_session": self._tool_stop_session,
+            "list_sessions": self._tool_list_sessions,
+            # Registers and memory
+            "read_registers": self._tool_read_registers,
+            "read_memory": self._tool_read_memory,
+            "write_memory": self._tool_write_memory,
+            # Execution control
+            "continue_execution": self._tool_continue_execution,
+            "step": self._tool_step,
+            "step_over": self._tool_step_over,
+            "halt": self._tool_halt,
+            "reset": self._tool_reset,
+            # Breakpoints
+            "set_breakpoint": self._tool_set_breakpoint,
+            "delete_breakpoint": self._tool_delete_breakpoint,
+            # Analysis
+            "backtrace": self._tool_backtrace,
+            "evaluate": self._tool_evaluate,
+            # Snapshots
+            "save_snapshot": self._tool_save_snapshot,
+            "load_snapshot": self._tool_load_snapshot,
+            # Architecture-specific tools
+            "read_fault_registers": self._tool_read_fault_registers,
+            "read_exception_frame": self._tool_read_exception_frame,
+            "check_interrupt_priorities": self._tool_check_interrupt_priorities,
+            "show_memory_protection": self._tool_show_memory_protection,
+            "analyze_crash": self._tool_analyze_crash,
+        }
+
+    def _get_session(self, args: Dict[str, Any]) -> DebugSession:
+        """Get session from args or current session.
+
+        The last lookup is reused while the session manager's generation
+        is unchanged, which covers repeated calls on the same session.
+        """
         session_name = args.get("session")
+        generation, cached_name, cached = self._session_cache
+        if (
+            cached is not None
+            and generation == self.session_manager.generation
+            and cached_name == session_name
+        ):
+            return cached
+        session = self._lookup_session(session_name)
+        self._session_cache = (self.session_manager.generation, session_name, session)
+        return session
+
+    def _lookup_session(self, session_name: Optional[str]) -> DebugSession:
+        """Look up a session by name, or the current session if None."""
         if session_name:
             session = self.session_manager.get_session(session_name)
             if not session:
@@ -453,7 +582,7 @@ class StdioMcpServer:
                 raise ValueError("No active session. Use start_session first.")
             return session
 
-    def _get_architecture(self, args: Dict[str, Any]):
+    def _get_architecture(self, args: Dict[str, Any]) -> TargetArchitecture:
         """Get architecture handler for session."""
         session_name = args.get("session")
         arch = self.session_manager.get_architecture(session_name)
@@ -473,323 +602,340 @@ class StdioMcpServer:
         Returns:
             Tool result
         """
+        handler = self._handlers.get(name)
+        if handler is None:
+            return _text_response(f"Unknown tool: {name}", is_error=True)
+        missing = [arg for arg in _REQUIRED_ARGS.get(name, ()) if arg not in args]
+        if missing:
+            return _text_response(
+                f"Missing required argument(s) for {name}: {', '.join(missing)}",
+                is_error=True,
+            )
         try:
-            # Session management tools
-            if name == "start_session":
-                info = await self.session_manager.start_session(
-                    elf_path=args["elf_path"],
-                    machine=args.get("machine", "lm3s6965evb"),
-                    cpu=args.get("cpu", "cortex-m3"),
-                    name=args.get("name"),
-                )
-                return _text_response(
-                    f"Started session '{info.name}'\n"
-                    f"  ELF: {info.elf_path}\n"
-                    f"  Machine: {info.machine}\n"
-                    f"  CPU: {info.cpu}\n"
-                    f"  GDB Port: {info.gdb_port}"
-                )
-
-            elif name == "stop_session":
-                success = await self.session_manager.stop_session(args["name"])
-                if success:
-                    return _text_response(f"Stopped session '{args['name']}'")
-                else:
-                    return _text_response(
-                        f"Session '{args['name']}' not found", is_error=True
-                    )
-
-            elif name == "list_sessions":
-                sessions = self.session_manager.list_sessions()
-                if not sessions:
-                    return _text_response("No active sessions")
-                current = self.session_manager.get_current_name()
-                lines = ["Active sessions:"]
-                for info in sessions:
-                    marker = "*" if info.name == current else " "
-                    lines.append(
-                        f"  {marker} {info.name}: {info.elf_path} "
-                        f"({info.machine}/{info.cpu})"
-                    )
-                return _text_response("\n".join(lines))
-
-            # Debug tools - need an active session
-            session = self._get_session(args)
-
-            if name == "read_registers":
-                regs_list = args.get("registers")
-                if regs_list is not None and len(regs_list) == 0:
-                    regs_list = None
-                regs = await session.read_registers(regs_list)
-                lines = [f"{name:>4}: 0x{value:08x}" for name, value in sorted(regs.items())]
-                return _text_response("\n".join(lines))
-
-            elif name == "read_memory":
-                addr_str = args["address"]
-                length = args.get("length", 64)
-
-                if addr_str.startswith("0x") or addr_str.startswith("0X"):
-                    address = int(addr_str, 16)
-                else:
-                    result = await session.evaluate(f"&{addr_str}")
-                    address = int(result.split()[0], 0)
-
-                data = await session.read_memory(address, length)
-
-                # Format as hex dump
-                lines = []
-                for i in range(0, len(data), 16):
-                    chunk = data[i : i + 16]
-                    hex_part = " ".join(f"{b:02x}" for b in chunk)
-                    ascii_part = "".join(
-                        chr(b) if 32 <= b < 127 else "." for b in chunk
-                    )
-                    lines.append(
-                        f"0x{address + i:08x}: {hex_part:<48} {ascii_part}"
-                    )
-                return _text_response("\n".join(lines))
-
-            elif name == "write_memory":
-                addr_str = args["address"]
-                hex_data = args["data"].replace(" ", "")
-
-                if addr_str.startswith("0x") or addr_str.startswith("0X"):
-                    address = int(addr_str, 16)
-                else:
-                    result = await session.evaluate(f"&{addr_str}")
-                    address = int(result.split()[0], 0)
-
-                data = bytes.fromhex(hex_data)
-                success = await session.write_memory(address, data)
-
-                if success:
-                    return _text_response(
-                        f"Wrote {len(data)} bytes to 0x{address:08x}"
-                    )
-                else:
-                    return _text_response("Write failed", is_error=True)
-
-            elif name == "continue_execution":
-                stop = await session.continue_execution()
-                msg = f"Stopped: {stop.reason.value} at 0x{stop.address:08x}"
-                if stop.signal_name:
-                    msg += f" (signal: {stop.signal_name})"
-                return _text_response(msg)
-
-            elif name == "step":
-                instruction = args.get("instruction", False)
-                stop = await session.step(instruction=instruction)
-                return _text_response(f"Stepped to 0x{stop.address:08x}")
-
-            elif name == "step_over":
-                instruction = args.get("instruction", False)
-                stop = await session.step_over(instruction=instruction)
-                return _text_response(f"Stepped to 0x{stop.address:08x}")
-
-            elif name == "halt":
-                await session.halt()
-                return _text_response("Execution halted")
-
-            elif name == "reset":
-                success = await session.reset()
-                if success:
-                    return _text_response("Target reset")
-                else:
-                    return _text_response("Reset failed", is_error=True)
-
-            elif name == "set_breakpoint":
-                location = args["location"]
-                condition = args.get("condition")
-                temporary = args.get("temporary", False)
-                bp = await session.set_breakpoint(location, condition, temporary)
-                return _text_response(
-                    f"Breakpoint {bp.number} at 0x{bp.address:08x} ({bp.location})"
-                )
-
-            elif name == "delete_breakpoint":
-                number = args["number"]
-                success = await session.delete_breakpoint(number)
-                if success:
-                    return _text_response(f"Deleted breakpoint {number}")
-                else:
-                    return _text_response(
-                        f"Failed to delete breakpoint {number}", is_error=True
-                    )
-
-            elif name == "backtrace":
-                max_frames = args.get("max_frames", 20)
-                frames = await session.get_backtrace(max_frames)
-                lines = []
-                for frame in frames:
-                    level = frame.get("level", 0)
-                    addr = frame.get("addr", 0)
-                    func = frame.get("func", "??")
-                    file = frame.get("file")
-                    line = frame.get("line")
-                    loc = f"{file}:{line}" if file and line else ""
-                    lines.append(f"#{level:<2} 0x{addr:08x} in {func} {loc}".strip())
-                return _text_response("\n".join(lines))
-
-            elif name == "evaluate":
-                expr = args["expression"]
-                result = await session.evaluate(expr)
-                return _text_response(f"{expr} = {result}")
-
-            elif name == "save_snapshot":
-                snapshot_name = args["name"]
-                success = await session.save_snapshot(snapshot_name)
-                if success:
-                    return _text_response(f"Saved snapshot '{snapshot_name}'")
-                else:
-                    return _text_response(
-                        "Failed to save snapshot (requires QEMU snapshot support)",
-                        is_error=True,
-                    )
-
-            elif name == "load_snapshot":
-                snapshot_name = args["name"]
-                success = await session.load_snapshot(snapshot_name)
-                if success:
-                    return _text_response(f"Restored snapshot '{snapshot_name}'")
-                else:
-                    return _text_response(
-                        f"Failed to load snapshot '{snapshot_name}'", is_error=True
-                    )
-
-            # Architecture-specific tools
-            elif name == "read_fault_registers":
-                arch = self._get_architecture(args)
-                fault = await arch.read_fault_state(session)
-                lines = [f"Fault Type: {fault.fault_type}"]
-                if fault.fault_address is not None:
-                    lines.append(
-                        f"Fault Address: 0x{fault.fault_address:08x}"
-                        f" {'(valid)' if fault.is_valid else '(invalid)'}"
-                    )
-                lines.append("\nRaw Registers:")
-                for reg, val in fault.raw_registers.items():
-                    lines.append(f"  {reg}: 0x{val:08x}")
-                if fault.decoded:
-                    lines.append("\nDecoded:")
-                    for bit, msg in fault.decoded.items():
-                        lines.append(f"  {bit}: {msg}")
-                return _text_response("\n".join(lines))
-
-            elif name == "read_exception_frame":
-                arch = self._get_architecture(args)
-                sp_str = args.get("stack_pointer")
-                sp = int(sp_str, 0) if sp_str else None
-                frame = await arch.decode_exception_frame(session, sp)
-                lines = [f"Exception Frame ({frame.frame_type}):"]
-                lines.append(f"  Return Address: 0x{frame.return_address:08x}")
-                lines.append(f"  Stack Pointer: 0x{frame.stack_pointer:08x}")
-                lines.append("\nStacked Registers:")
-                for reg, val in sorted(frame.registers.items()):
-                    lines.append(f"  {reg:>6}: 0x{val:08x}")
-                return _text_response("\n".join(lines))
-
-            elif name == "check_interrupt_priorities":
-                arch = self._get_architecture(args)
-                analysis = await arch.check_interrupt_config(session)
-                lines = ["Interrupt Configuration:"]
-                if analysis.priorities:
-                    lines.append("\nPriorities:")
-                    for name_p, pri in sorted(analysis.priorities.items()):
-                        lines.append(f"  {name_p}: {pri}")
-                if analysis.enabled:
-                    lines.append(f"\nEnabled: {len(analysis.enabled)} interrupts")
-                    for info in analysis.enabled[:10]:  # Show first 10
-                        lines.append(f"  {info.name}")
-                if analysis.pending:
-                    lines.append(f"\nPending: {len(analysis.pending)} interrupts")
-                    for info in analysis.pending:
-                        lines.append(f"  {info.name}")
-                if analysis.warnings:
-                    lines.append("\n⚠️  Warnings:")
-                    for warn in analysis.warnings:
-                        lines.append(f"  - {warn}")
-                return _text_response("\n".join(lines))
-
-            elif name == "show_memory_protection":
-                arch = self._get_architecture(args)
-                config = await arch.get_memory_protection(session)
-                lines = [f"Memory Protection: {'Enabled' if config.enabled else 'Disabled'}"]
-                lines.append(f"Default permissions: {config.default_permissions}")
-                if config.regions:
-                    lines.append(f"\nRegions ({len(config.regions)}):")
-                    for region in config.regions:
-                        lines.append(
-                            f"  [{region.number}] 0x{region.base_address:08x} "
-                            f"size={region.size:#x} {region.permissions}"
-                        )
-                else:
-                    lines.append("\nNo regions configured")
-                return _text_response("\n".join(lines))
-
-            elif name == "analyze_crash":
-                arch = self._get_architecture(args)
-                analysis = await arch.analyze_crash(session)
-                lines = [f"Crash Analysis ({analysis['architecture']})", "=" * 40]
-
-                # Fault info
-                fault = analysis["fault"]
-                lines.append(f"\nFault: {fault['fault_type']}")
-                if fault["fault_address"]:
-                    lines.append(f"Address: {fault['fault_address']}")
-                if fault["decoded"]:
-                    for bit, msg in fault["decoded"].items():
-                        lines.append(f"  {bit}: {msg}")
-
-                # Exception frame
-                frame = analysis["exception_frame"]
-                lines.append(f"\nReturn Address: {frame['return_address']}")
-
-                # Warnings
-                interrupts = analysis["interrupts"]
-                if interrupts["warnings"]:
-                    lines.append("\n⚠️  Issues Detected:")
-                    for warn in interrupts["warnings"]:
-                        lines.append(f"  - {warn}")
-
-                return _text_response("\n".join(lines))
-
-            else:
-                return _text_response(f"Unknown tool: {name}", is_error=True)
-
+            return await handler(args)
         except Exception as e:
             logger.exception(f"Error in tool {name}")
             return _text_response(f"Error: {e}", is_error=True)
 
-    async def _handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+    # === Tool handlers ===
+
+    async def _tool_start_session(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Start a debug session."""
+        info = await self.session_manager.start_session(
+            elf_path=args["elf_path"],
+            machine=args.get("machine", "lm3s6965evb"),
+            cpu=args.get("cpu", "cortex-m3"),
+            name=args.get("name"),
+        )
+        return _text_response(
+            f"Started session '{info.name}'\n"
+            f"  ELF: {info.elf_path}\n"
+            f"  Machine: {info.machine}\n"
+            f"  CPU: {info.cpu}\n"
+            f"  GDB Port: {info.gdb_port}"
+        )
+
+    async def _tool_stop_session(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Stop a debug session."""
+        success = await self.session_manager.stop_session(args["name"])
+        if success:
+            return _text_response(f"Stopped session '{args['name']}'")
+        else:
+            return _text_response(
+                f"Session '{args['name']}' not found", is_error=True
+            )
+
+    async def _tool_list_sessions(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """List debug sessions, marking the current one."""
+        sessions = self.session_manager.list_sessions()
+        if not sessions:
+            return _text_response("No active sessions")
+        current = self.session_manager.get_current_name()
+        return _text_response("\n".join([
+            "Active sessions:",
+            *(
+                f"  {'*' if info.name == current else ' '} {info.name}: "
+                f"{info.elf_path} ({info.machine}/{info.cpu})"
+                for info in sessions
+            ),
+        ]))
+
+    async def _tool_read_registers(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Read CPU registers."""
+        session = self._get_session(args)
+        regs_list = args.get("registers")
+        if regs_list is not None and len(regs_list) == 0:
+            regs_list = None
+        regs = await session.read_registers(regs_list)
+        # One "name: value" line per register, in the order regs came back in
+        return _text_response("\n".join(map(_REGISTER_LINE.__mod__, regs.items())))
+
+    async def _tool_read_memory(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Read memory as a hex dump."""
+        session = self._get_session(args)
+        addr_str = args["address"]
+        length = args.get("length", 64)
+
+        address = await resolve_address(session, addr_str)
+
+        data = await session.read_memory(address, length)
+        return _text_response(hex_dump(data, address))
+
+    async def _tool_write_memory(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Write hex bytes to memory."""
+        session = self._get_session(args)
+        address = await resolve_address(session, args["address"])
+
+        # fromhex() skips ASCII whitespace itself, so no scrub pass is needed
+        data = bytes.fromhex(args["data"])
+        success = await session.write_memory(address, data)
+
+        if success:
+            return _text_response(
+                f"Wrote {len(data)} bytes to 0x{address:08x}"
+            )
+        else:
+            return _text_response("Write failed", is_error=True)
+
+    async def _tool_continue_execution(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Continue until the target stops."""
+        session = self._get_session(args)
+        stop = await session.continue_execution()
+        msg = f"Stopped: {stop.reason.value} at 0x{stop.address:08x}"
+        if stop.signal_name:
+            msg += f" (signal: {stop.signal_name})"
+        return _text_response(msg)
+
+    async def _tool_step(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Step one line or instruction."""
+        session = self._get_session(args)
+        instruction = args.get("instruction", False)
+        stop = await session.step(instruction=instruction)
+        return _text_response(f"Stepped to 0x{stop.address:08x}")
+
+    async def _tool_step_over(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Step over a function call."""
+        session = self._get_session(args)
+        instruction = args.get("instruction", False)
+        stop = await session.step_over(instruction=instruction)
+        return _text_response(f"Stepped to 0x{stop.address:08x}")
+
+    async def _tool_halt(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Halt execution."""
+        session = self._get_session(args)
+        await session.halt()
+        return _text_response("Execution halted")
+
+    async def _tool_reset(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Reset the target."""
+        session = self._get_session(args)
+        success = await session.reset()
+        if success:
+            return _text_response("Target reset")
+        else:
+            return _text_response("Reset failed", is_error=True)
+
+    async def _tool_set_breakpoint(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Set a breakpoint."""
+        session = self._get_session(args)
+        location = args["location"]
+        condition = args.get("condition")
+        temporary = args.get("temporary", False)
+        bp = await session.set_breakpoint(location, condition, temporary)
+        return _text_response(
+            f"Breakpoint {bp.number} at 0x{bp.address:08x} ({bp.location})"
+        )
+
+    async def _tool_delete_breakpoint(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Delete a breakpoint."""
+        session = self._get_session(args)
+        number = args["number"]
+        success = await session.delete_breakpoint(number)
+        if success:
+            return _text_response(f"Deleted breakpoint {number}")
+        else:
+            return _text_response(
+                f"Failed to delete breakpoint {number}", is_error=True
+            )
+
+    async def _tool_backtrace(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Show the call stack."""
+        session = self._get_session(args)
+        max_frames = args.get("max_frames", 20)
+        frames = await session.get_backtrace(max_frames)
+        lines = []
+        for frame in frames:
+            level = frame.get("level", 0)
+            addr = frame.get("addr", 0)
+            func = frame.get("func", "??")
+            file = frame.get("file")
+            line = frame.get("line")
+            loc = f"{file}:{line}" if file and line else ""
+            lines.append(f"#{level:<2} 0x{addr:08x} in {func} {loc}".strip())
+        return _text_response("\n".join(lines))
+
+    async def _tool_evaluate(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Evaluate an expression."""
+        session = self._get_session(args)
+        expr = args["expression"]
+        result = await session.evaluate(expr)
+        return _text_response(f"{expr} = {result}")
+
+    async def _tool_save_snapshot(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Save a VM snapshot."""
+        session = self._get_session(args)
+        snapshot_name = args["name"]
+        success = await session.save_snapshot(snapshot_name)
+        if success:
+            return _text_response(f"Saved snapshot '{snapshot_name}'")
+        else:
+            return _text_response(
+                "Failed to save snapshot (requires QEMU snapshot support)",
+                is_error=True,
+            )
+
+    async def _tool_load_snapshot(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Restore a VM snapshot."""
+        session = self._get_session(args)
+        snapshot_name = args["name"]
+        success = await session.load_snapshot(snapshot_name)
+        if success:
+            return _text_response(f"Restored snapshot '{snapshot_name}'")
+        else:
+            return _text_response(
+                f"Failed to load snapshot '{snapshot_name}'", is_error=True
+            )
+
+    async def _tool_read_fault_registers(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Read and decode the fault registers."""
+        session = self._get_session(args)
+        arch = self._get_architecture(args)
+        fault = await arch.read_fault_state(session)
+        lines = [f"Fault Type: {fault.fault_type}"]
+        if fault.fault_address is not None:
+            lines.append(
+                f"Fault Address: 0x{fault.fault_address:08x}"
+                f" {'(valid)' if fault.is_valid else '(invalid)'}"
+            )
+        lines.append("\nRaw Registers:")
+        lines.extend(map(_RAW_REGISTER_LINE.__mod__, fault.raw_registers.items()))
+        if fault.decoded:
+            lines.append("\nDecoded:")
+            for bit, msg in fault.decoded.items():
+                lines.append(f"  {bit}: {msg}")
+        return _text_response("\n".join(lines))
+
+    async def _tool_read_exception_frame(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Decode the stacked exception frame."""
+        session = self._get_session(args)
+        arch = self._get_architecture(args)
+        sp_str = args.get("stack_pointer")
+        sp = int(sp_str, 0) if sp_str else None
+        frame = await arch.decode_exception_frame(session, sp)
+        lines = [f"Exception Frame ({frame.frame_type}):"]
+        lines.append(f"  Return Address: 0x{frame.return_address:08x}")
+        lines.append(f"  Stack Pointer: 0x{frame.stack_pointer:08x}")
+        lines.append("\nStacked Registers:")
+        lines.extend(map(_STACKED_REGISTER_LINE.__mod__, sorted(frame.registers.items())))
+        return _text_response("\n".join(lines))
+
+    async def _tool_check_interrupt_priorities(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Check the interrupt controller configuration."""
+        session = self._get_session(args)
+        arch = self._get_architecture(args)
+        analysis = await arch.check_interrupt_config(session)
+        lines = ["Interrupt Configuration:"]
+        if analysis.priorities:
+            lines.append("\nPriorities:")
+            for name_p, pri in sorted(analysis.priorities.items()):
+                lines.append(f"  {name_p}: {pri}")
+        if analysis.enabled:
+            lines.append(f"\nEnabled: {len(analysis.enabled)} interrupts")
+            for info in analysis.enabled[:10]:  # Show first 10
+                lines.append(f"  {info.name}")
+        if analysis.pending:
+            lines.append(f"\nPending: {len(analysis.pending)} interrupts")
+            for info in analysis.pending:
+                lines.append(f"  {info.name}")
+        if analysis.warnings:
+            lines.append("\n⚠️  Warnings:")
+            for warn in analysis.warnings:
+                lines.append(f"  - {warn}")
+        return _text_response("\n".join(lines))
+
+    async def _tool_show_memory_protection(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Show the MPU/PMP configuration."""
+        session = self._get_session(args)
+        arch = self._get_architecture(args)
+        config = await arch.get_memory_protection(session)
+        lines = [f"Memory Protection: {'Enabled' if config.enabled else 'Disabled'}"]
+        lines.append(f"Default permissions: {config.default_permissions}")
+        if config.regions:
+            lines.append(f"\nRegions ({len(config.regions)}):")
+            for region in config.regions:
+                lines.append(
+                    f"  [{region.number}] 0x{region.base_address:08x} "
+                    f"size={region.size:#x} {region.permissions}"
+                )
+        else:
+            lines.append("\nNo regions configured")
+        return _text_response("\n".join(lines))
+
+    async def _tool_analyze_crash(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Summarize the fault, exception frame and interrupt issues."""
+        session = self._get_session(args)
+        arch = self._get_architecture(args)
+        analysis = await arch.analyze_crash(session)
+        lines = [f"Crash Analysis ({analysis['architecture']})", "=" * 40]
+
+        # Fault info
+        fault = analysis["fault"]
+        lines.append(f"\nFault: {fault['fault_type']}")
+        if fault["fault_address"]:
+            lines.append(f"Address: {fault['fault_address']}")
+        if fault["decoded"]:
+            for bit, msg in fault["decoded"].items():
+                lines.append(f"  {bit}: {msg}")
+
+        # Exception frame
+        frame = analysis["exception_frame"]
+        lines.append(f"\nReturn Address: {frame['return_address']}")
+
+        # Warnings
+        interrupts = analysis["interrupts"]
+        if interrupts["warnings"]:
+            lines.append("\n⚠️  Issues Detected:")
+            for warn in interrupts["warnings"]:
+                lines.append(f"  - {warn}")
+
+        return _text_response("\n".join(lines))
+
+    async def _handle_request(
+        self, request: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
         """Handle an MCP request.
 
         Args:
             request: JSON-RPC request
 
         Returns:
-            JSON-RPC response
+            JSON-RPC response, or None for notifications
         """
         method = request.get("method", "")
         request_id = request.get("id")
         params = request.get("params", {})
 
-        logger.debug(f"Request: {method} {params}")
+        # Skip formatting params (which can hold large write_memory
+        # payloads) unless debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Request: {method} {params}")
 
         try:
             if method == "initialize":
                 return {
                     "jsonrpc": "2.0",
                     "id": request_id,
-                    "result": {
-                        "protocolVersion": "2024-11-05",
-                        "serverInfo": {
-                            "name": self.server_name,
-                            "version": self.server_version,
-                        },
-                        "capabilities": {
-                            "tools": {},
-                        },
-                    },
+                    "result": self._initialize_result,
                 }
 
             elif method == "notifications/initialized":
@@ -800,15 +946,14 @@ class StdioMcpServer:
                 return {
                     "jsonrpc": "2.0",
                     "id": request_id,
-                    "result": {
-                        "tools": self._tools,
-                    },
+                    "result": _TOOLS_LIST_RESULT,
                 }
 
             elif method == "tools/call":
                 tool_name = params.get("name", "")
                 tool_args = params.get("arguments", {})
-                result = await self._handle_tool_call(tool_name, tool_args)
+                async with self._tool_lock:
+                    result = await self._handle_tool_call(tool_name, tool_args)
                 return {
                     "jsonrpc": "2.0",
                     "id": request_id,
@@ -836,56 +981,189 @@ class StdioMcpServer:
                 },
             }
 
+    def _encode_response(self, response: Dict[str, Any]) -> bytes:
+        """Serialize a JSON-RPC response as one newline-terminated line."""
+        result = response.get("result")
+        for static_result, encoded in self._static_results:
+            if result is static_result:
+                # Only the id varies; splice it into the pre-encoded result
+                return b"".join((
+                    b'{"jsonrpc":"2.0","id":',
+                    jsoncodec.dumps(response["id"]),
+                    b',"result":',
+                    encoded,
+                    b"}\n",
+                ))
+        return jsoncodec.dumps_line(response)
+
     async def run(self) -> None:
         """Run the server, reading from stdin and writing to stdout."""
         self._running = True
         logger.info(f"MCP server starting ({self.server_name} v{self.server_version})")
 
-        # Read from stdin, write to stdout
-        reader = asyncio.StreamReader()
+        # Raw bytes in and out: no text-mode decoding on either side
+        reader = asyncio.StreamReader(limit=self.MAX_MESSAGE_SIZE)
         protocol = asyncio.StreamReaderProtocol(reader)
 
         loop = asyncio.get_event_loop()
-        await loop.connect_read_pipe(lambda: protocol, sys.stdin)
-
-        # Get stdout write transport
-        write_transport, _ = await loop.connect_write_pipe(
-            asyncio.Protocol, sys.stdout
+        await loop.connect_read_pipe(lambda: protocol, sys.stdin.buffer)
+
+        # Wrap stdout in a StreamWriter so drain() applies backpressure. A
+        # StreamReaderProtocol is used only for its pause/resume_writing
+        # handling; its reader never receives data on a write pipe
+        write_transport, write_protocol = await loop.connect_write_pipe(
+            lambda: asyncio.StreamReaderProtocol(asyncio.StreamReader()),
+            sys.stdout.buffer,
         )
-
+        writer = asyncio.StreamWriter(write_transport, write_protocol, None, loop)
+
+        # The next line is read while the current one is parsed and
+        # dispatched (anext() gives None at EOF). Each request runs as its
+        # own task: tool calls queue on _tool_lock in arrival order, while
+        # initialize/tools/list answer at once (JSON-RPC matches by id)
+        lines = self._read_lines(reader)
+        next_line = asyncio.ensure_future(anext(lines, None))
         try:
             while self._running:
                 # Read a line (JSON-RPC uses newline-delimited JSON)
                 try:
-                    line = await reader.readline()
+                    line = await next_line
                 except asyncio.CancelledError:
                     break
 
-                if not line:
+                if line is None:
                     break
+                next_line = asyncio.ensure_future(anext(lines, None))
 
-                line = line.decode("utf-8").strip()
-                if not line:
+                # Surrounding whitespace is valid JSON, so only blank lines
+                # need skipping; no stripped copy of the buffer is made
+                if not line or line.isspace():
                     continue
 
                 try:
-                    request = json.loads(line)
-                except json.JSONDecodeError as e:
+                    request = jsoncodec.loads(line)
+                except ValueError as e:  # bad JSON or bad UTF-8
                     logger.error(f"Invalid JSON: {e}")
                     continue
 
-                response = await self._handle_request(request)
+                self._start_task(self._serve_request(request, writer))
+                await writer.drain()
 
-                if response is not None:
-                    response_line = json.dumps(response) + "\n"
-                    write_transport.write(response_line.encode("utf-8"))
+            # Let in-flight requests answer before sessions are torn down
+            if self._pending:
+                await asyncio.gather(*self._pending, return_exceptions=True)
+            self._flush_out(writer)
+            await writer.drain()
 
         finally:
             # Cleanup
+            next_line.cancel()
             await self.session_manager.stop_all()
-            write_transport.close()
+            self._flush_out(writer)
+            writer.close()
             logger.info("MCP server stopped")
 
+    def _start_task(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Run a request coroutine as a tracked task, eagerly where supported.
+
+        With an eager task (Python 3.12+) a request that never suspends,
+        such as initialize or tools/list, completes inside this call with no
+        trip through the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        if _eager_task_factory is not None:
+            task = _eager_task_factory(loop, coro)
+        else:
+            task = loop.create_task(coro)
+        if not task.done():
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+
+    async def _serve_request(
+        self, request: Dict[str, Any], writer: asyncio.StreamWriter
+    ) -> None:
+        """Handle one request and queue its response line, if any.
+
+        Anything that escapes _handle_request, or a response that fails to
+        encode, is answered with an internal error so the client isn't left
+        waiting on the request id.
+        """
+        try:
+            response = await self._handle_request(request)
+            if response is None:
+                return
+            line = self._encode_response(response)
+        except Exception as e:
+            logger.exception("Error serving request")
+            line = jsoncodec.dumps_line({
+                "jsonrpc": "2.0",
+                "id": request.get("id") if isinstance(request, dict) else None,
+                "error": {
+                    "code": -32603,
+                    "message": str(e),
+                },
+            })
+        if not self._out_queue:
+            loop = asyncio.get_running_loop()
+            self._flushed = loop.create_future()
+            loop.call_soon(self._flush_out, writer)
+        self._out_queue.append(line)
+
+        # Once the batch is written, apply stdout backpressure to this task
+        assert self._flushed is not None
+        await self._flushed
+        await writer.drain()
+
+    def _flush_out(self, writer: asyncio.StreamWriter) -> None:
+        """Write all queued response lines to stdout at once.
+
+        Pipelined requests often finish in the same loop iteration; joining
+        their responses turns one write() syscall per response into one per
+        iteration.
+
+        Args:
+            writer: Stdout stream writer
+        """
+        try:
+            if self._out_queue:
+                writer.writelines(self._out_queue)
+                self._out_queue = []
+        finally:
+            if self._flushed is not None and not self._flushed.done():
+                self._flushed.set_result(None)
+
+    async def _read_lines(self, reader: asyncio.StreamReader) -> AsyncIterator[bytearray]:
+        """Yield request lines (without the newline) from stdin.
+
+        Reads large chunks and splits them with bytearray.find(), which is
+        much cheaper than readline()'s per-call bookkeeping when several
+        requests arrive together. A line longer than MAX_MESSAGE_SIZE is
+        dropped; a final line without a newline is still yielded at EOF.
+        """
+        buf = bytearray()
+        discarding = False
+        while True:
+            chunk = await reader.read(self.READ_CHUNK_SIZE)
+            if not chunk:
+                if buf and not discarding:
+                    yield buf
+                return
+            buf += chunk
+            start = 0
+            while (end := buf.find(b"\n", start)) >= 0:
+                if discarding:
+                    # Tail of a dropped oversized line
+                    discarding = False
+                else:
+                    yield buf[start:end]
+                start = end + 1
+            # Drop consumed lines once per chunk rather than once per line
+            del buf[:start]
+            if len(buf) > self.MAX_MESSAGE_SIZE:
+                logger.error("Dropped request larger than MAX_MESSAGE_SIZE")
+                buf.clear()
+                discarding = True
+
     def stop(self) -> None:
         """Signal the server to stop."""
         self._running = False
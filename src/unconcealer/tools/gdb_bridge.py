@@ -1,10 +1,16 @@
 """GDB Machine Interface bridge for communicating with GDB."""
 
+import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Sequence, Tuple, TypeVar
 from pygdbmi.gdbcontroller import GdbController
 
+T = TypeVar("T")
+
 
 class StopReason(Enum):
     """Reasons why execution stopped."""
@@ -16,7 +22,7 @@ class StopReason(Enum):
     EXITED_NORMALLY = "exited-normally"
 
 
-@dataclass
+@dataclass(slots=True)
 class StopInfo:
     """Information about why execution stopped."""
     reason: StopReason
@@ -25,7 +31,7 @@ class StopInfo:
     breakpoint_number: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BreakpointInfo:
     """Information about a breakpoint."""
     number: int
@@ -35,7 +41,7 @@ class BreakpointInfo:
     hits: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class EvalResult:
     """Result of expression evaluation."""
     value: str
@@ -59,6 +65,13 @@ class GDBBridge:
         self.gdb: Optional[GdbController] = None
         self.connected = False
         self._breakpoints: Dict[int, BreakpointInfo] = {}
+        self._next_token = 1
+        # Register names by GDB register number, fetched on first use
+        self._register_names: Optional[List[str]] = None
+        # pygdbmi blocks while it waits for GDB, so controller calls run on
+        # one worker thread: the event loop stays free and commands still
+        # reach GDB one at a time, in order
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     # === Lifecycle Methods ===
 
@@ -94,7 +107,7 @@ class GDBBridge:
         """
         if not self.gdb:
             await self.start()
-        response = self._write(f"-target-select remote {host}:{port}")
+        response = await self._write(f"-target-select remote {host}:{port}")
         self.connected = self._check_success(response)
         if not self.connected:
             raise RuntimeError(
@@ -116,7 +129,7 @@ class GDBBridge:
         Raises:
             RuntimeError: If ELF file cannot be loaded
         """
-        response = self._write(f"-file-exec-and-symbols {elf_path}")
+        response = await self._write(f"-file-exec-and-symbols {elf_path}")
         if not self._check_success(response):
             raise RuntimeError(
                 f"Failed to load ELF file: {elf_path}\n"
@@ -129,12 +142,16 @@ class GDBBridge:
         """Close GDB connection and exit."""
         if self.gdb:
             try:
-                self.gdb.exit()
+                await self._run_blocking(self.gdb.exit)
             except Exception:
                 pass
             self.gdb = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
         self.connected = False
         self._breakpoints.clear()
+        self._register_names = None
 
     # === Execution Control ===
 
@@ -144,12 +161,24 @@ class GDBBridge:
         Returns:
             StopInfo describing why execution stopped
         """
-        response = self._write("-exec-continue")
+        response = await self._write("-exec-continue")
         return self._parse_stop(response)
 
     async def halt(self) -> None:
         """Halt execution (send interrupt)."""
-        self._write("-exec-interrupt")
+        await self._write("-exec-interrupt")
+
+    async def interrupt(self) -> None:
+        """Send an interrupt without queueing behind a running command.
+
+        halt() waits its turn on the GDB worker thread, so it can't stop a
+        continue_execution() that is still waiting for the target. This
+        writes -exec-interrupt straight to GDB's stdin instead; the running
+        command's response then reports the stop.
+        """
+        if not self.gdb:
+            raise RuntimeError("GDB not started")
+        self.gdb.write("-exec-interrupt", read_response=False)
 
     async def step(self, instruction: bool = False) -> StopInfo:
         """Single step execution.
@@ -161,7 +190,7 @@ class GDBBridge:
             StopInfo describing where we stopped
         """
         cmd = "-exec-step-instruction" if instruction else "-exec-step"
-        response = self._write(cmd)
+        response = await self._write(cmd)
         return self._parse_stop(response)
 
     async def step_over(self, instruction: bool = False) -> StopInfo:
@@ -174,7 +203,7 @@ class GDBBridge:
             StopInfo describing where we stopped
         """
         cmd = "-exec-next-instruction" if instruction else "-exec-next"
-        response = self._write(cmd)
+        response = await self._write(cmd)
         return self._parse_stop(response)
 
     async def finish(self) -> StopInfo:
@@ -183,32 +212,185 @@ class GDBBridge:
         Returns:
             StopInfo describing where we stopped
         """
-        response = self._write("-exec-finish")
+        response = await self._write("-exec-finish")
         return self._parse_stop(response)
 
+    async def batch(
+        self, commands: Sequence[str], timeout_sec: int = 10
+    ) -> List[List[Dict[str, Any]]]:
+        """Send several MI commands in one write and collect their responses.
+
+        Each command is tagged with a unique MI token so its result record
+        can be matched up, which saves the per-command wait for GDB to go
+        quiet that single writes pay.
+
+        Args:
+            commands: MI commands (without tokens)
+            timeout_sec: Maximum time to wait for all results
+
+        Returns:
+            One response list per command, in the same order
+
+        Raises:
+            RuntimeError: If GDB isn't started or results don't arrive in time
+        """
+        if not self.gdb:
+            raise RuntimeError("GDB not started")
+        if not commands:
+            return []
+
+        first = self._next_token
+        self._next_token += len(commands)
+        tokens = range(first, first + len(commands))
+        return await self._run_blocking(
+            self._batch_blocking, self.gdb, commands, tokens, timeout_sec
+        )
+
+    @staticmethod
+    def _batch_blocking(
+        gdb: GdbController, commands: Sequence[str], tokens: range, timeout_sec: int
+    ) -> List[List[Dict[str, Any]]]:
+        """Write tokenized commands and wait for their results (worker thread)."""
+        responses: Dict[int, List[Dict[str, Any]]] = {t: [] for t in tokens}
+        pending = set(tokens)
+
+        gdb.write(
+            [f"{t}{cmd}" for t, cmd in zip(tokens, commands)],
+            timeout_sec=timeout_sec,
+            read_response=False,
+        )
+
+        deadline = time.monotonic() + timeout_sec
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise RuntimeError(
+                    f"Timed out waiting for {len(pending)} of {len(commands)} GDB results"
+                )
+            for r in gdb.get_gdb_response(
+                timeout_sec=remaining, raise_error_on_timeout=False
+            ):
+                token = r.get("token")
+                if token in responses:
+                    responses[token].append(r)
+                    if r.get("type") == "result":
+                        pending.discard(token)
+
+        return [responses[t] for t in tokens]
+
     # === Register Operations ===
 
     async def read_registers(self, registers: Optional[List[str]] = None) -> Dict[str, int]:
         """Read CPU registers.
 
+        Named registers are picked out of one read of the whole register
+        file; names it doesn't provide (aliases such as r13, or registers
+        with non-integer values) are evaluated together in a single batch.
+
         Args:
             registers: List of register names to read, or None for all
 
         Returns:
             Dict mapping register name to value
+
+        Raises:
+            ValueError: If a requested register has no integer value
         """
         if registers:
-            result = {}
-            for reg in registers:
-                response = self._write(f"-data-evaluate-expression ${reg}")
-                value = self._parse_eval_result(response)
-                if value:
-                    result[reg] = self._parse_int(value.value)
-            return result
+            regs = await self.read_all_registers()
+            missing = [reg for reg in registers if reg not in regs]
+            if missing:
+                regs.update(await self.evaluate_registers(missing))
+            return {reg: regs[reg] for reg in registers if reg in regs}
         else:
-            response = self._write("-data-list-register-values x")
+            response = await self._write("-data-list-register-values x")
             return self._parse_register_values(response)
 
+    async def list_register_names(self) -> List[str]:
+        """Get register names indexed by GDB register number.
+
+        The register set is fixed for a target, so names are fetched once.
+
+        Returns:
+            Register names ("" for unnamed numbers), empty if GDB can't list them
+        """
+        if self._register_names is None:
+            response = await self._write("-data-list-register-names")
+            names = self._parse_register_names(response)
+            if not names:
+                return []
+            self._register_names = names
+        return self._register_names
+
+    async def read_all_registers(self) -> Dict[str, int]:
+        """Read the whole register file in one request.
+
+        Returns:
+            Dict mapping register name to value
+        """
+        names = await self.list_register_names()
+        response = await self._write("-data-list-register-values x")
+        result = {}
+        for number, value in self._parse_register_values(response).items():
+            index = int(number[1:])
+            if index < len(names) and names[index]:
+                result[names[index]] = value
+        return result
+
+    async def evaluate_registers(self, registers: Sequence[str]) -> Dict[str, int]:
+        """Evaluate $name for each register in a single batch.
+
+        Works for any name GDB accepts, including aliases that
+        read_all_registers() doesn't report.
+
+        Args:
+            registers: Register names (without $)
+
+        Returns:
+            Dict mapping register name to value, for names GDB could evaluate
+
+        Raises:
+            ValueError: If a register has no integer value (e.g. an FPU union)
+        """
+        responses = await self.batch([f"-data-evaluate-expression ${reg}" for reg in registers])
+        result = {}
+        for reg, response in zip(registers, responses):
+            value = self._parse_eval_result(response)
+            if value:
+                try:
+                    result[reg] = self._parse_int(value.value)
+                except ValueError:
+                    raise ValueError(
+                        f"Register {reg} has no integer value: {value.value}"
+                    ) from None
+        return result
+
+    async def read_registers_and_memory(
+        self,
+        registers: Sequence[str],
+        regions: Sequence[Tuple[int, int]],
+    ) -> Tuple[Dict[str, int], List[bytes]]:
+        """Read named registers and memory regions in a single batch.
+
+        Args:
+            registers: Register names (without $)
+            regions: (address, length) pairs
+
+        Returns:
+            Tuple of (register name -> value, bytes per region in order)
+        """
+        commands = [f"-data-evaluate-expression ${reg}" for reg in registers]
+        commands += [f"-data-read-memory-bytes 0x{addr:x} {length}" for addr, length in regions]
+        responses = await self.batch(commands)
+
+        regs = {}
+        for reg, response in zip(registers, responses):
+            value = self._parse_eval_result(response)
+            if value:
+                regs[reg] = self._parse_int(value.value)
+        memory = [self._parse_memory_bytes(r) for r in responses[len(registers):]]
+        return regs, memory
+
     async def read_register(self, name: str) -> int:
         """Read a single register.
 
@@ -217,9 +399,14 @@ class GDBBridge:
 
         Returns:
             Register value
+
+        Raises:
+            ValueError: If GDB has no value for the register
         """
         regs = await self.read_registers([name])
-        return regs.get(name, 0)
+        if name not in regs:
+            raise ValueError(f"Unknown or unreadable register: {name}")
+        return regs[name]
 
     # === Memory Operations ===
 
@@ -233,7 +420,7 @@ class GDBBridge:
         Returns:
             Memory contents as bytes
         """
-        response = self._write(f"-data-read-memory-bytes 0x{address:x} {length}")
+        response = await self._write(f"-data-read-memory-bytes 0x{address:x} {length}")
         return self._parse_memory_bytes(response)
 
     async def write_memory(self, address: int, data: bytes) -> bool:
@@ -247,7 +434,7 @@ class GDBBridge:
             True if write succeeded
         """
         hex_data = data.hex()
-        response = self._write(f"-data-write-memory-bytes 0x{address:x} {hex_data}")
+        response = await self._write(f"-data-write-memory-bytes 0x{address:x} {hex_data}")
         return self._check_success(response)
 
     async def read_memory_word(self, address: int) -> int:
@@ -280,20 +467,41 @@ class GDBBridge:
         Returns:
             BreakpointInfo for the created breakpoint
         """
-        cmd = "-break-insert"
-        if temporary:
-            cmd += " -t"
-        if condition:
-            cmd += f' -c "{condition}"'
-        cmd += f" {location}"
-
-        response = self._write(cmd)
+        response = await self._write(self._break_insert_command(location, condition, temporary))
         bp = self._parse_breakpoint(response)
         if bp is None:
             raise RuntimeError(f"Failed to set breakpoint at {location}")
         self._breakpoints[bp.number] = bp
         return bp
 
+    async def set_breakpoints(self, locations: Sequence[str]) -> List[BreakpointInfo]:
+        """Set several breakpoints with one batched write.
+
+        Args:
+            locations: Function names, file:line, or *address
+
+        Returns:
+            BreakpointInfo per location, in the same order
+
+        Raises:
+            RuntimeError: If any breakpoint couldn't be set (the others stay set)
+        """
+        responses = await self.batch(
+            [self._break_insert_command(location) for location in locations]
+        )
+        result = []
+        failed = []
+        for location, response in zip(locations, responses):
+            bp = self._parse_breakpoint(response)
+            if bp is None:
+                failed.append(location)
+                continue
+            self._breakpoints[bp.number] = bp
+            result.append(bp)
+        if failed:
+            raise RuntimeError(f"Failed to set breakpoint at {', '.join(failed)}")
+        return result
+
     async def delete_breakpoint(self, number: int) -> bool:
         """Delete a breakpoint.
 
@@ -303,7 +511,7 @@ class GDBBridge:
         Returns:
             True if deleted successfully
         """
-        response = self._write(f"-break-delete {number}")
+        response = await self._write(f"-break-delete {number}")
         if self._check_success(response):
             self._breakpoints.pop(number, None)
             return True
@@ -311,12 +519,12 @@ class GDBBridge:
 
     async def disable_breakpoint(self, number: int) -> bool:
         """Disable a breakpoint."""
-        response = self._write(f"-break-disable {number}")
+        response = await self._write(f"-break-disable {number}")
         return self._check_success(response)
 
     async def enable_breakpoint(self, number: int) -> bool:
         """Enable a breakpoint."""
-        response = self._write(f"-break-enable {number}")
+        response = await self._write(f"-break-enable {number}")
         return self._check_success(response)
 
     # === Expression Evaluation ===
@@ -330,7 +538,7 @@ class GDBBridge:
         Returns:
             EvalResult with the value
         """
-        response = self._write(f'-data-evaluate-expression "{expression}"')
+        response = await self._write(f'-data-evaluate-expression "{expression}"')
         result = self._parse_eval_result(response)
         return result or EvalResult(value="<error>")
 
@@ -345,16 +553,48 @@ class GDBBridge:
         Returns:
             List of frame dictionaries with addr, func, file, line
         """
-        response = self._write(f"-stack-list-frames 0 {max_frames - 1}")
+        return await self.get_backtrace_range(0, max_frames - 1)
+
+    async def get_backtrace_range(self, low: int, high: int) -> List[Dict[str, Any]]:
+        """Get the stack frames between two levels.
+
+        Args:
+            low: Innermost frame level to return
+            high: Outermost frame level to return (inclusive)
+
+        Returns:
+            List of frame dictionaries; empty once low is past the outermost frame
+        """
+        response = await self._write(f"-stack-list-frames {low} {high}")
         return self._parse_backtrace(response)
 
     # === Internal Methods ===
 
-    def _write(self, command: str, timeout_sec: int = 10) -> List[Dict[str, Any]]:
+    async def _write(self, command: str, timeout_sec: int = 10) -> List[Dict[str, Any]]:
         """Send command to GDB and return response."""
         if not self.gdb:
             raise RuntimeError("GDB not started")
-        return self.gdb.write(command, timeout_sec=timeout_sec)
+        return await self._run_blocking(self.gdb.write, command, timeout_sec=timeout_sec)
+
+    async def _run_blocking(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking controller call on the GDB worker thread."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gdb-mi")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    def _break_insert_command(
+        self, location: str, condition: Optional[str] = None, temporary: bool = False
+    ) -> str:
+        """Build the -break-insert command for a breakpoint."""
+        cmd = "-break-insert"
+        if temporary:
+            cmd += " -t"
+        if condition:
+            cmd += f' -c "{condition}"'
+        return f"{cmd} {location}"
 
     def _check_success(self, response: List[Dict[str, Any]]) -> bool:
         """Check if GDB response indicates success."""
@@ -410,6 +650,13 @@ class GDBBridge:
                     return bytes.fromhex(contents)
         return b""
 
+    def _parse_register_names(self, response: List[Dict[str, Any]]) -> List[str]:
+        """Parse register names response."""
+        for r in response:
+            if r.get("message") == "done":
+                return list(r.get("payload", {}).get("register-names", []))
+        return []
+
     def _parse_register_values(self, response: List[Dict[str, Any]]) -> Dict[str, int]:
         """Parse register values response."""
         result = {}
@@ -419,7 +666,12 @@ class GDBBridge:
                 for reg in payload.get("register-values", []):
                     num = reg.get("number", "")
                     val = reg.get("value", "0")
-                    result[f"r{num}"] = self._parse_int(val)
+                    try:
+                        result[f"r{num}"] = self._parse_int(val)
+                    except ValueError:
+                        # Composite registers (FPU/vector unions such as
+                        # "{float = 0x0, double = 0x0}") have no integer value
+                        continue
         return result
 
     def _parse_eval_result(self, response: List[Dict[str, Any]]) -> Optional[EvalResult]:
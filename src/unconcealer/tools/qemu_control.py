@@ -20,6 +20,9 @@ class QEMUConfig:
         gdb_port: GDB server port
         qmp_port: QMP control port
         extra_args: Additional QEMU arguments
+        log_path: File to receive QEMU's stdout and stderr. Set this when
+            nothing will read QEMU's output pipes, e.g. when the process
+            outlives its controller; a full pipe would block QEMU.
     """
     qemu_path: str = "qemu-system-arm"
     machine: str = "lm3s6965evb"
@@ -28,6 +31,7 @@ class QEMUConfig:
     gdb_port: int = 1234
     qmp_port: int = 4444
     extra_args: List[str] = field(default_factory=list)
+    log_path: Optional[str] = None
 
 
 class QEMUController:
@@ -90,11 +94,20 @@ class QEMUController:
         cmd.extend(self.config.extra_args)
 
         try:
-            self.process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-            )
+            if self.config.log_path:
+                with open(self.config.log_path, "wb") as log:
+                    self.process = subprocess.Popen(
+                        cmd,
+                        stdin=subprocess.DEVNULL,
+                        stdout=log,
+                        stderr=subprocess.STDOUT,
+                    )
+            else:
+                self.process = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                )
         except FileNotFoundError:
             raise RuntimeError(
                 f"QEMU not found at '{self.config.qemu_path}'\n"
@@ -114,7 +127,11 @@ class QEMUController:
 
         # Check if process is still running
         if self.process.poll() is not None:
-            stderr = self.process.stderr.read().decode() if self.process.stderr else ""
+            if self.config.log_path:
+                with open(self.config.log_path, "rb") as log:
+                    stderr = log.read().decode(errors="replace")
+            else:
+                stderr = self.process.stderr.read().decode() if self.process.stderr else ""
             raise RuntimeError(f"QEMU exited immediately: {stderr}")
 
         try:
@@ -143,7 +160,8 @@ class QEMUController:
         if self.process:
             self.process.terminate()
             try:
-                self.process.wait(timeout=5)
+                # Wait off the event loop so other sessions can stop meanwhile
+                await asyncio.to_thread(self.process.wait, timeout=5)
             except subprocess.TimeoutExpired:
                 self.process.kill()
                 self.process.wait()
@@ -0,0 +1,55 @@
+"""Helpers shared by the MCP server and command-line tool handlers."""
+
+from typing import Any, Union
+
+# Maps each byte to itself if printable ASCII, else "." (hex dump column)
+_PRINTABLE_TABLE = bytes(b if 32 <= b < 127 else ord(".") for b in range(256))
+
+
+def hex_dump(data: Union[bytes, bytearray, memoryview], address: int) -> str:
+    """Format memory as 16-byte rows of address, hex bytes and ASCII.
+
+    The whole buffer is converted once and rows are sliced out of it (each
+    byte is 3 chars of the hex string, "xx "), then joined in a bytearray
+    that is decoded once at the end.
+
+    Args:
+        data: Memory contents
+        address: Address of the first byte
+
+    Returns:
+        Hex dump text, without a trailing newline
+    """
+    hex_all = data.hex(" ").encode("ascii")
+    ascii_all = bytes(data).translate(_PRINTABLE_TABLE)
+    out = bytearray()
+    for i in range(0, len(data), 16):
+        out += b"0x%08x: %-48s %s\n" % (
+            address + i, hex_all[i * 3:i * 3 + 47], ascii_all[i:i + 16]
+        )
+    return out[:-1].decode("ascii")
+
+
+async def resolve_address(target: Any, addr_str: str) -> int:
+    """Resolve a numeric address, $register or symbol name to an address.
+
+    Numbers are parsed locally and registers cost a single register read;
+    only symbols need a GDB expression evaluation.
+
+    Args:
+        target: DebugSession or GDBBridge. Its evaluate() may return the
+            value text (DebugSession) or an EvalResult (GDBBridge).
+        addr_str: Address text, e.g. "0x20000000", "$sp" or "main"
+
+    Returns:
+        Resolved address
+    """
+    try:
+        return int(addr_str, 0)
+    except ValueError:
+        pass
+    if addr_str.startswith("$"):
+        return int(await target.read_register(addr_str[1:]))
+    result = await target.evaluate(f"&{addr_str}")
+    value = getattr(result, "value", result)
+    return int(str(value).split()[0], 0)
@@ -70,6 +70,10 @@ class TestArchitectureRegistry:
             get_architecture("unknown-arch")
         assert "Unknown architecture" in str(exc.value)
 
+    def test_get_architecture_is_cached(self) -> None:
+        """Test repeated lookups share one handler instance."""
+        assert get_architecture("cortex-m4") is get_architecture("cortex-m4")
+
     def test_list_architectures(self) -> None:
         """Test listing architectures."""
         archs = list_architectures()
@@ -0,0 +1,132 @@
+"""Tests for the LLM response cache."""
+
+import json
+import time
+from pathlib import Path
+from typing import AsyncIterator, List
+
+import pytest
+
+from unconcealer.agent.cache import ResponseCache, REPLAY_CHUNK_SIZE
+
+
+ELF_DIGEST = "ab" * 32
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> ResponseCache:
+    """Create a cache in a temporary directory."""
+    return ResponseCache(cache_dir=tmp_path / "cache", ttl=60)
+
+
+async def _collect(stream: AsyncIterator[str]) -> List[str]:
+    return [chunk async for chunk in stream]
+
+
+class TestResponseCacheKey:
+    """Test cache key generation."""
+
+    def test_key_is_stable(self) -> None:
+        """Test same inputs give the same key."""
+        k1 = ResponseCache.make_key(ELF_DIGEST, "why?", model="m")
+        k2 = ResponseCache.make_key(ELF_DIGEST, "why?", model="m")
+        assert k1 == k2
+        assert len(k1) == 16
+
+    def test_key_depends_on_inputs(self) -> None:
+        """Test prompt, model, fault and ELF digest change the key."""
+        base = ResponseCache.make_key(ELF_DIGEST, "why?", model="m")
+        assert ResponseCache.make_key(ELF_DIGEST, "how?", model="m") != base
+        assert ResponseCache.make_key(ELF_DIGEST, "why?", model="n") != base
+        assert ResponseCache.make_key(ELF_DIGEST, "why?", model="m", fault="hardfault") != base
+        assert ResponseCache.make_key("cd" * 32, "why?", model="m") != base
+        assert ResponseCache.make_key(ELF_DIGEST, "why?", model="m", provider="openai") != base
+        assert ResponseCache.make_key(
+            ELF_DIGEST, "why?", model="m", target_state="1:0x8000100"
+        ) != base
+
+    def test_key_depends_on_context(self) -> None:
+        """Test the same follow-up after different histories gets different keys."""
+        chain_a = ResponseCache.chain_turn("", "show the stack")
+        chain_b = ResponseCache.chain_turn("", "show the heap")
+
+        key_a = ResponseCache.make_key(ELF_DIGEST, "and now?", context=chain_a)
+        key_b = ResponseCache.make_key(ELF_DIGEST, "and now?", context=chain_b)
+
+        assert key_a != key_b
+
+    def test_chain_turn_is_order_sensitive(self) -> None:
+        """Test the turn chain depends on every prompt and their order."""
+        ab = ResponseCache.chain_turn(ResponseCache.chain_turn("", "a"), "b")
+        ba = ResponseCache.chain_turn(ResponseCache.chain_turn("", "b"), "a")
+
+        assert ab != ba
+        assert ab == ResponseCache.chain_turn(ResponseCache.chain_turn("", "a"), "b")
+
+
+class TestResponseCacheStorage:
+    """Test get/put behavior."""
+
+    def test_get_missing(self, cache: ResponseCache) -> None:
+        """Test lookup of a missing key."""
+        assert cache.get("0123456789abcdef") is None
+
+    def test_put_and_get(self, cache: ResponseCache) -> None:
+        """Test stored responses can be read back."""
+        cache.put("abc", "The PC is 0x1234")
+        assert cache.get("abc") == "The PC is 0x1234"
+
+    def test_put_and_get_extras(self, cache: ResponseCache) -> None:
+        """Test extra texts are stored with a response."""
+        cache.put("abc", "answer", {"findings": "  [high] stack overflow"})
+        assert cache.get_extras("abc") == {"findings": "  [high] stack overflow"}
+        assert cache.get_extras("missing") == {}
+
+    def test_expired_entry(self, cache: ResponseCache) -> None:
+        """Test entries older than the TTL are ignored."""
+        cache.put("abc", "old")
+        path = cache.cache_dir / "abc.json"
+        path.write_text(json.dumps({"created": time.time() - 120, "text": "old"}))
+        assert cache.get("abc") is None
+
+    def test_ttl_from_env(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test TTL is read from UNCONCEALER_CACHE_TTL."""
+        monkeypatch.setenv("UNCONCEALER_CACHE_TTL", "5")
+        assert ResponseCache(cache_dir=tmp_path).ttl == 5
+
+
+class TestResponseCacheStream:
+    """Test streaming through the cache."""
+
+    async def test_miss_passes_through_and_stores(self, cache: ResponseCache) -> None:
+        """Test a miss streams the source and stores the result."""
+        async def source() -> AsyncIterator[str]:
+            yield "Hello, "
+            yield "world"
+
+        chunks = await _collect(cache.stream("k", source))
+        assert chunks == ["Hello, ", "world"]
+        assert cache.get("k") == "Hello, world"
+
+    async def test_miss_stores_extras(self, cache: ResponseCache) -> None:
+        """Test extras are collected after the source stream completes."""
+        produced = []
+
+        async def source() -> AsyncIterator[str]:
+            produced.append("finding")
+            yield "text"
+
+        await _collect(cache.stream("k", source, extras=lambda: {"findings": produced[0]}))
+        assert cache.get_extras("k") == {"findings": "finding"}
+
+    async def test_hit_replays_without_source(self, cache: ResponseCache) -> None:
+        """Test a hit replays cached text in chunks without calling source."""
+        text = "x" * (REPLAY_CHUNK_SIZE * 2 + 10)
+        cache.put("k", text)
+
+        def source() -> AsyncIterator[str]:
+            raise AssertionError("source should not be called on a hit")
+
+        chunks = await _collect(cache.stream("k", source))
+        assert "".join(chunks) == text
+        assert len(chunks) == 3
@@ -0,0 +1,237 @@
+"""Tests for the single-command interface and its daemon."""
+
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from unconcealer import cmd
+from unconcealer.tools.gdb_bridge import StopInfo, StopReason
+
+
+class TestSessionState:
+    """Test session state persistence."""
+
+    def test_to_file_recreates_missing_dir(self, tmp_path: Path) -> None:
+        """Test saving recreates a session directory removed between saves."""
+        state = cmd.SessionState(
+            name="default", elf_path="/fw.elf", machine="mps2-an385",
+            cpu="cortex-m3", gdb_port=1234, qmp_port=4444, qemu_pid=42,
+            architecture="arm", created_at="2026-01-01T00:00:00",
+        )
+        path = tmp_path / "sessions" / "default.json"
+        state.to_file(str(path))
+        path.unlink()
+        path.parent.rmdir()
+
+        state.to_file(str(path))
+
+        assert cmd.SessionState.from_file(str(path)) == state
+
+
+class TestProcessTracking:
+    """Test process liveness checks."""
+
+    def test_exited_child_is_reaped(self) -> None:
+        """Test an exited child isn't reported as running while a zombie."""
+        proc = subprocess.Popen([sys.executable, "-c", "pass"])
+        deadline = time.monotonic() + 5
+        while cmd.is_process_running(proc.pid) and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert cmd.is_process_running(proc.pid) is False
+
+    def test_invalid_pid(self) -> None:
+        """Test a missing PID (0) is never treated as running."""
+        assert cmd.is_process_running(0) is False
+
+    @pytest.mark.asyncio
+    async def test_wait_for_exit(self) -> None:
+        """Test waiting for a child to exit after SIGTERM."""
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        assert cmd.is_process_running(proc.pid)
+
+        proc.terminate()
+
+        assert await cmd._wait_for_exit(proc.pid, 5) is True
+
+
+class TestDaemon:
+    """Test the daemon request path."""
+
+    @pytest.mark.asyncio
+    async def test_call_daemon_runs_tool(self, tmp_path: Path) -> None:
+        """Test a client request is run by the daemon and answered."""
+        sock_path = tmp_path / "daemon.sock"
+        execute = AsyncMock(return_value={"status": "halted"})
+
+        with patch.object(cmd, "execute_tool", execute):
+            server = asyncio.ensure_future(cmd.serve_daemon(sock_path))
+            while not sock_path.exists():
+                await asyncio.sleep(0.01)
+
+            result = await asyncio.to_thread(
+                cmd._call_daemon, str(sock_path), "halt", {"x": 1}, "fw"
+            )
+            server.cancel()
+
+        assert result == {"status": "halted"}
+        execute.assert_awaited_once_with("halt", {"x": 1}, "fw")
+
+    @pytest.mark.asyncio
+    async def test_daemon_reports_tool_errors(self, tmp_path: Path) -> None:
+        """Test an exception in a tool becomes an error result."""
+        sock_path = tmp_path / "daemon.sock"
+        execute = AsyncMock(side_effect=RuntimeError("GDB not started"))
+
+        with patch.object(cmd, "execute_tool", execute):
+            server = asyncio.ensure_future(cmd.serve_daemon(sock_path))
+            while not sock_path.exists():
+                await asyncio.sleep(0.01)
+
+            result = await asyncio.to_thread(
+                cmd._call_daemon, str(sock_path), "halt", {}, "default"
+            )
+            server.cancel()
+
+        assert result == {"error": "GDB not started"}
+
+    @pytest.mark.asyncio
+    async def test_daemon_lists_sessions(self, tmp_path: Path) -> None:
+        """Test a real tool request through the daemon."""
+        sock_path = tmp_path / "daemon.sock"
+
+        with patch.object(cmd, "_SESSION_DIR_STR", str(tmp_path / "sessions")):
+            server = asyncio.ensure_future(cmd.serve_daemon(sock_path))
+            while not sock_path.exists():
+                await asyncio.sleep(0.01)
+
+            result = await asyncio.to_thread(
+                cmd._call_daemon, str(sock_path), "list_sessions", {}, "default"
+            )
+            server.cancel()
+
+        assert result == {"sessions": [], "message": "No active sessions"}
+
+    def test_call_daemon_times_out(self, tmp_path: Path) -> None:
+        """Test a daemon that never replies gives an error instead of hanging."""
+        sock_path = tmp_path / "daemon.sock"
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(str(sock_path))
+        listener.listen(1)
+
+        try:
+            with patch.object(cmd, "DAEMON_REPLY_TIMEOUT", 0.1):
+                result = cmd._call_daemon(str(sock_path), "halt", {}, "default")
+        finally:
+            listener.close()
+
+        assert result == {"error": "Daemon did not reply within 0.1s"}
+
+    def test_call_daemon_not_running(self, tmp_path: Path) -> None:
+        """Test clients fall back when no daemon is listening."""
+        assert cmd._call_daemon(str(tmp_path / "none.sock"), "halt", {}, "default") is None
+
+
+class TestGdbServer:
+    """Test the per-session GDB server and its clients."""
+
+    @pytest.fixture
+    def state(self) -> cmd.SessionState:
+        """Session state whose "QEMU" is this (live) process."""
+        return cmd.SessionState(
+            name="fw", elf_path="/fw.elf", machine="lm3s6965evb", cpu="cortex-m3",
+            gdb_port=1234, qmp_port=2234, qemu_pid=os.getpid(),
+            architecture="cortex-m", created_at="",
+        )
+
+    async def _serve(self, tmp_path: Path, state: cmd.SessionState, gdb: Mock):
+        """Start serve_gdb for state with a mocked GDB; return (task, socket path)."""
+        sock_path = tmp_path / "fw.gdb.sock"
+        with patch.object(cmd, "_SESSION_DIR_STR", str(tmp_path)), \
+                patch.object(cmd, "load_session_state", return_value=state), \
+                patch.object(cmd, "_attach_gdb", AsyncMock(return_value=gdb)):
+            server = asyncio.ensure_future(cmd.serve_gdb("fw"))
+            while not sock_path.exists():
+                await asyncio.sleep(0.01)
+        return server, str(sock_path)
+
+    @pytest.mark.asyncio
+    async def test_runs_tool(self, tmp_path: Path, state: cmd.SessionState) -> None:
+        """Test a tool request is run against the server's GDB."""
+        gdb = Mock()
+        gdb.read_registers = AsyncMock(return_value={"pc": 0x08001234})
+        gdb.close = AsyncMock()
+        server, sock_path = await self._serve(tmp_path, state, gdb)
+
+        result = await cmd._call_gdb_server(sock_path, "read_registers", {})
+        server.cancel()
+
+        assert result == {"registers": {"pc": "0x08001234"}}
+
+    @pytest.mark.asyncio
+    async def test_halt_interrupts_running_continue(
+        self, tmp_path: Path, state: cmd.SessionState
+    ) -> None:
+        """Test halt isn't stuck behind a continue_execution holding the GDB."""
+        stopped = asyncio.Event()
+
+        async def continue_execution():
+            await stopped.wait()
+            return StopInfo(reason=StopReason.SIGNAL, address=0x100, signal_name="SIGINT")
+
+        gdb = Mock()
+        gdb.continue_execution = continue_execution
+        gdb.interrupt = AsyncMock(side_effect=lambda: stopped.set())
+        gdb.close = AsyncMock()
+        server, sock_path = await self._serve(tmp_path, state, gdb)
+
+        running = asyncio.ensure_future(
+            cmd._call_gdb_server(sock_path, "continue_execution", {})
+        )
+        await asyncio.sleep(0.05)
+        halted = await asyncio.wait_for(cmd._call_gdb_server(sock_path, "halt", {}), 5)
+        result = await asyncio.wait_for(running, 5)
+        server.cancel()
+
+        assert halted == {"status": "interrupted"}
+        assert result["signal"] == "SIGINT"
+        gdb.interrupt.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_client_times_out(self, tmp_path: Path) -> None:
+        """Test a client gives up on a server that never answers."""
+        sock_path = str(tmp_path / "hung.sock")
+
+        async def never_reply(reader, writer):
+            await reader.readline()
+            await asyncio.sleep(10)
+
+        server = await asyncio.start_unix_server(never_reply, path=sock_path)
+        with patch.object(cmd, "GDB_SERVER_REPLY_TIMEOUT", 0.05):
+            result = await cmd._call_gdb_server(sock_path, "halt", {})
+        server.close()
+
+        assert "did not reply" in result["error"]
+
+    @pytest.mark.asyncio
+    async def test_no_second_gdb_while_server_alive(
+        self, tmp_path: Path, state: cmd.SessionState
+    ) -> None:
+        """Test tools don't attach their own GDB to a stub the server holds."""
+        state.gdb_socket = str(tmp_path / "gone.sock")
+        state.gdb_pid = os.getpid()
+        attach = AsyncMock()
+
+        with patch.object(cmd, "load_session_state", return_value=state), \
+                patch.object(cmd, "_attach_gdb", attach):
+            result = await cmd.execute_tool("halt", {}, "fw")
+
+        assert "not accepting connections" in result["error"]
+        attach.assert_not_called()
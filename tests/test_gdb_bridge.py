@@ -1,5 +1,8 @@
 """Tests for GDB Bridge."""
 
+import asyncio
+import threading
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from unconcealer.tools.gdb_bridge import (
@@ -202,6 +205,26 @@ class TestGDBBridgeWithMock:
         assert bp.number == 1
         assert bp.location == "main"
 
+    @pytest.mark.asyncio
+    async def test_set_breakpoints_batched(self, mock_gdb: GDBBridge) -> None:
+        """Test several breakpoints are inserted with one write."""
+        mock_gdb.gdb.get_gdb_response.return_value = [
+            {"token": 1, "type": "result", "message": "done",
+             "payload": {"bkpt": {"number": "1", "addr": "0x08001234", "enabled": "y",
+                                  "original-location": "main"}}},
+            {"token": 2, "type": "result", "message": "done",
+             "payload": {"bkpt": {"number": "2", "addr": "0x08001300", "enabled": "y",
+                                  "original-location": "HardFault"}}},
+        ]
+        bps = await mock_gdb.set_breakpoints(["main", "HardFault"])
+
+        assert [bp.location for bp in bps] == ["main", "HardFault"]
+        mock_gdb.gdb.write.assert_called_once_with(
+            ["1-break-insert main", "2-break-insert HardFault"],
+            timeout_sec=10,
+            read_response=False,
+        )
+
     @pytest.mark.asyncio
     async def test_evaluate(self, mock_gdb: GDBBridge) -> None:
         """Test expression evaluation."""
@@ -212,6 +235,166 @@ class TestGDBBridgeWithMock:
         result = await mock_gdb.evaluate("2 + 2")
         assert result.value == "42"
 
+    @pytest.mark.asyncio
+    async def test_batch_matches_results_by_token(self, mock_gdb: GDBBridge) -> None:
+        """Test batched commands are tokenized and results split per command."""
+        mock_gdb.gdb.get_gdb_response.side_effect = [
+            [{"token": 2, "type": "result", "message": "done", "payload": {"value": "2"}}],
+            [
+                {"token": None, "type": "notify", "message": "thread-group-added"},
+                {"token": 1, "type": "result", "message": "done", "payload": {"value": "1"}},
+            ],
+        ]
+        responses = await mock_gdb.batch(["-data-evaluate-expression a", "-data-evaluate-expression b"])
+
+        mock_gdb.gdb.write.assert_called_once_with(
+            ["1-data-evaluate-expression a", "2-data-evaluate-expression b"],
+            timeout_sec=10,
+            read_response=False,
+        )
+        assert [r[0]["payload"]["value"] for r in responses] == ["1", "2"]
+
+    @pytest.mark.asyncio
+    async def test_read_registers_and_memory(self, mock_gdb: GDBBridge) -> None:
+        """Test registers and memory are read in one batch."""
+        mock_gdb.gdb.get_gdb_response.return_value = [
+            {"token": 1, "type": "result", "message": "done", "payload": {"value": "0x20001000"}},
+            {"token": 2, "type": "result", "message": "done",
+             "payload": {"memory": [{"contents": "78563412"}]}},
+        ]
+        regs, memory = await mock_gdb.read_registers_and_memory(["sp"], [(0xE000ED28, 4)])
+
+        assert regs == {"sp": 0x20001000}
+        assert memory == [bytes.fromhex("78563412")]
+        mock_gdb.gdb.write.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_read_all_registers(self, mock_gdb: GDBBridge) -> None:
+        """Test the register file is read once and keyed by name."""
+        mock_gdb.gdb.write.side_effect = [
+            [{"message": "done", "payload": {"register-names": ["r0", "", "sp", "pc"]}}],
+            [{"message": "done", "payload": {"register-values": [
+                {"number": "0", "value": "0x1"},
+                {"number": "1", "value": "0x2"},
+                {"number": "2", "value": "0x20001000"},
+                {"number": "3", "value": "0x08001234"},
+            ]}}],
+            [{"message": "done", "payload": {"register-values": []}}],
+        ]
+
+        regs = await mock_gdb.read_all_registers()
+        await mock_gdb.read_all_registers()
+
+        assert regs == {"r0": 1, "sp": 0x20001000, "pc": 0x08001234}
+        # Names are only listed once
+        assert mock_gdb.gdb.write.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_read_all_registers_skips_composite_values(
+        self, mock_gdb: GDBBridge
+    ) -> None:
+        """Test a non-integer register doesn't break the whole read."""
+        mock_gdb._register_names = ["pc", "ft0", "sp"]
+        mock_gdb.gdb.write.return_value = [
+            {"message": "done", "payload": {"register-values": [
+                {"number": "0", "value": "0x08001234"},
+                {"number": "1", "value": "{float = 0x0, double = 0x0}"},
+                {"number": "2", "value": "0x20001000"},
+            ]}},
+        ]
+
+        regs = await mock_gdb.read_all_registers()
+
+        assert regs == {"pc": 0x08001234, "sp": 0x20001000}
+
+    @pytest.mark.asyncio
+    async def test_read_registers_by_name_with_composite_value(
+        self, mock_gdb: GDBBridge
+    ) -> None:
+        """Test named reads work beside composite registers, and fail only for them."""
+        mock_gdb._register_names = ["pc", "ft0"]
+        mock_gdb.gdb.write.return_value = [
+            {"message": "done", "payload": {"register-values": [
+                {"number": "0", "value": "0x08001234"},
+                {"number": "1", "value": "{float = 0x0, double = 0x0}"},
+            ]}},
+        ]
+        mock_gdb.gdb.get_gdb_response.return_value = [
+            {"token": 1, "type": "result", "message": "done",
+             "payload": {"value": "{float = 0x0, double = 0x0}"}},
+        ]
+
+        assert await mock_gdb.read_registers(["pc"]) == {"pc": 0x08001234}
+        assert await mock_gdb.read_register("pc") == 0x08001234
+        with pytest.raises(ValueError, match="ft0"):
+            await mock_gdb.read_registers(["pc", "ft0"])
+
+    @pytest.mark.asyncio
+    async def test_read_registers_by_name(self, mock_gdb: GDBBridge) -> None:
+        """Test named registers come from the register file, aliases in one batch."""
+        mock_gdb._register_names = ["r0", "sp", "pc"]
+        mock_gdb.gdb.write.side_effect = [
+            [{"message": "done", "payload": {"register-values": [
+                {"number": "0", "value": "0x1"},
+                {"number": "1", "value": "0x20001000"},
+                {"number": "2", "value": "0x08001234"},
+            ]}}],
+            None,
+        ]
+        mock_gdb.gdb.get_gdb_response.return_value = [
+            {"token": 1, "type": "result", "message": "done", "payload": {"value": "0x20001000"}},
+        ]
+
+        regs = await mock_gdb.read_registers(["pc", "r13", "r0"])
+
+        assert regs == {"pc": 0x08001234, "r13": 0x20001000, "r0": 1}
+        assert list(regs) == ["pc", "r13", "r0"]
+        assert mock_gdb.gdb.write.call_count == 2
+        assert mock_gdb.gdb.write.call_args.args[0] == ["1-data-evaluate-expression $r13"]
+
+    @pytest.mark.asyncio
+    async def test_read_register_unknown(self, mock_gdb: GDBBridge) -> None:
+        """Test a register GDB can't evaluate raises instead of reading as 0."""
+        mock_gdb._register_names = ["pc"]
+        mock_gdb.gdb.write.side_effect = [
+            [{"message": "done", "payload": {"register-values": [
+                {"number": "0", "value": "0x08001234"},
+            ]}}],
+            None,
+        ]
+        mock_gdb.gdb.get_gdb_response.return_value = [
+            {"token": 1, "type": "result", "message": "error",
+             "payload": {"msg": "No symbol \"typo\" in current context."}},
+        ]
+
+        with pytest.raises(ValueError, match="typo"):
+            await mock_gdb.read_register("typo")
+
+    @pytest.mark.asyncio
+    async def test_interrupt_skips_worker_queue(self, mock_gdb: GDBBridge) -> None:
+        """Test interrupt writes directly without waiting for a response."""
+        await mock_gdb.interrupt()
+
+        mock_gdb.gdb.write.assert_called_once_with("-exec-interrupt", read_response=False)
+
+    @pytest.mark.asyncio
+    async def test_write_does_not_block_event_loop(self, mock_gdb: GDBBridge) -> None:
+        """Test a slow GDB command runs off the event loop thread."""
+        release = threading.Event()
+
+        def slow_write(command, timeout_sec):
+            release.wait(5)
+            return [{"message": "done"}]
+
+        mock_gdb.gdb.write.side_effect = slow_write
+        load = asyncio.ensure_future(mock_gdb.load_symbols("/path/to/firmware.elf"))
+        await asyncio.sleep(0.01)
+
+        # The loop kept running while GDB was busy
+        assert not load.done()
+        release.set()
+        assert await load is True
+
     @pytest.mark.asyncio
     async def test_close(self, mock_gdb: GDBBridge) -> None:
         """Test closing connection."""
@@ -0,0 +1,30 @@
+"""Tests for the shared JSON codec."""
+
+from unittest.mock import patch
+
+import pytest
+
+from unconcealer import jsoncodec
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+class TestJsonCodec:
+    """Test the orjson and stdlib paths agree."""
+
+    def test_dumps_line(self, use_orjson: bool) -> None:
+        """Test compact, newline-terminated output."""
+        if use_orjson and jsoncodec.orjson is None:
+            pytest.skip("orjson not installed")
+        orjson = jsoncodec.orjson if use_orjson else None
+        with patch.object(jsoncodec, "orjson", orjson):
+            assert jsoncodec.dumps({"id": 1, "s": "µ"}) == '{"id":1,"s":"µ"}'.encode()
+            assert jsoncodec.dumps_line([1, 2]) == b"[1,2]\n"
+            assert jsoncodec.dumps_pretty({"a": 1}) == '{\n  "a": 1\n}'
+
+    def test_loads_bytearray(self, use_orjson: bool) -> None:
+        """Test parsing straight from a read buffer."""
+        if use_orjson and jsoncodec.orjson is None:
+            pytest.skip("orjson not installed")
+        orjson = jsoncodec.orjson if use_orjson else None
+        with patch.object(jsoncodec, "orjson", orjson):
+            assert jsoncodec.loads(bytearray(b' {"id": 2}\r')) == {"id": 2}
@@ -2,7 +2,9 @@
 
 import asyncio
 import json
+import time
 import pytest
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 
@@ -32,6 +34,16 @@ class TestSessionManager:
         assert manager.qemu_paths["arm"] == "/custom/qemu-arm"
         assert manager.qemu_paths["riscv32"] == "/custom/qemu-rv32"
 
+    def test_snapshot_dir_recreated(self, tmp_path: Path) -> None:
+        """Test a removed snapshot directory is recreated by the next manager."""
+        snap_dir = tmp_path / "snaps"
+        SessionManager(snapshot_dir=str(snap_dir))
+        assert snap_dir.is_dir()
+
+        snap_dir.rmdir()
+        SessionManager(snapshot_dir=str(snap_dir))
+        assert snap_dir.is_dir()
+
     def test_get_qemu_path_arm(self) -> None:
         """Test QEMU path selection for ARM."""
         manager = SessionManager()
@@ -57,6 +69,18 @@ class TestSessionManager:
         port2 = manager._allocate_port()
         assert port2 == port1 + 1
 
+    def test_released_ports_reused_lowest_first(self) -> None:
+        """Test freed ports are handed out again, lowest first."""
+        manager = SessionManager()
+        ports = [manager._allocate_port() for _ in range(3)]
+        manager._release_port(ports[2])
+        manager._release_port(ports[0])
+        manager._release_port(9999)  # not auto-allocated, ignored
+
+        assert manager._allocate_port() == ports[0]
+        assert manager._allocate_port() == ports[2]
+        assert manager._allocate_port() == ports[2] + 1
+
     def test_list_sessions_empty(self) -> None:
         """Test listing sessions when none exist."""
         manager = SessionManager()
@@ -117,6 +141,87 @@ class TestSessionManager:
         assert info.is_active is True
         assert manager.get_current_name() == "test"
 
+    @pytest.mark.asyncio
+    async def test_start_session_generates_unique_names(self, tmp_path: Path) -> None:
+        """Test auto-generated names get a per-ELF suffix."""
+        elf_file = tmp_path / "fw.elf"
+        elf_file.touch()
+
+        manager = SessionManager()
+
+        with patch(
+            "unconcealer.mcp.session_manager.DebugSession",
+            return_value=AsyncMock(),
+        ):
+            await manager.start_session(str(elf_file), name="fw_1")
+            names = [
+                (await manager.start_session(str(elf_file))).name
+                for _ in range(3)
+            ]
+
+        assert names == ["fw", "fw_2", "fw_3"]
+
+    @pytest.mark.asyncio
+    async def test_sessions_start_concurrently(self, tmp_path: Path) -> None:
+        """Test session boots overlap instead of queueing on the manager lock."""
+        elf_file = tmp_path / "fw.elf"
+        elf_file.touch()
+
+        manager = SessionManager()
+        booting = 0
+        peak = 0
+
+        async def start() -> None:
+            nonlocal booting, peak
+            booting += 1
+            peak = max(peak, booting)
+            await asyncio.sleep(0.01)
+            booting -= 1
+
+        def make_session(**kwargs):
+            session = AsyncMock()
+            session.start = start
+            return session
+
+        with patch("unconcealer.mcp.session_manager.DebugSession", side_effect=make_session):
+            infos = await asyncio.gather(
+                manager.start_session(str(elf_file)),
+                manager.start_session(str(elf_file)),
+            )
+
+        assert peak == 2
+        assert all(info.is_active for info in infos)
+        assert {info.name for info in infos} == {"fw", "fw_1"}
+
+    @pytest.mark.asyncio
+    async def test_stop_during_start_waits_for_boot(self, tmp_path: Path) -> None:
+        """Test stop_session on a booting session waits for it, then frees the port."""
+        elf_file = tmp_path / "fw.elf"
+        elf_file.touch()
+
+        manager = SessionManager()
+        booted = asyncio.Event()
+        session = AsyncMock()
+
+        async def start() -> None:
+            await asyncio.sleep(0.01)
+            booted.set()
+
+        session.start = start
+
+        with patch("unconcealer.mcp.session_manager.DebugSession", return_value=session):
+            start_task = asyncio.create_task(manager.start_session(str(elf_file)))
+            await asyncio.sleep(0)
+            assert await manager.stop_session("fw") is True
+            assert booted.is_set()
+
+            with pytest.raises(RuntimeError, match="stopped while starting"):
+                await start_task
+
+        session.stop.assert_awaited_once()
+        assert manager.list_sessions() == []
+        assert manager._free_ports == [1234]
+
     @pytest.mark.asyncio
     async def test_stop_session_not_found(self) -> None:
         """Test stopping nonexistent session."""
@@ -264,6 +369,128 @@ class TestStdioMcpServer:
             assert "description" in tool
             assert "inputSchema" in tool
 
+    @pytest.mark.asyncio
+    async def test_read_lines_splits_chunks(self) -> None:
+        """Test stdin framing across chunk boundaries and oversized lines."""
+        server = StdioMcpServer(SessionManager())
+        server.MAX_MESSAGE_SIZE = 8
+        server.READ_CHUNK_SIZE = 4
+
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"ab\ncd")
+        reader.feed_data(b"ef\n0123456789abcdef\nxy\nlast")
+        reader.feed_eof()
+
+        lines = [bytes(line) async for line in server._read_lines(reader)]
+
+        assert lines == [b"ab", b"cdef", b"xy", b"last"]
+
+    @pytest.mark.asyncio
+    async def test_requests_answer_while_tool_call_runs(self) -> None:
+        """Test a quick request is answered while a slow tool call is in flight."""
+        server = StdioMcpServer(SessionManager())
+        release = asyncio.Event()
+
+        async def slow_tool(args):
+            await release.wait()
+            return _text_response("done")
+
+        server._handlers["halt"] = slow_tool
+        writer = Mock(drain=AsyncMock())
+
+        server._start_task(server._serve_request(
+            {"jsonrpc": "2.0", "id": 1, "method": "tools/call",
+             "params": {"name": "halt", "arguments": {}}},
+            writer,
+        ))
+        server._start_task(server._serve_request(
+            {"jsonrpc": "2.0", "id": 2, "method": "initialize"}, writer
+        ))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        def written_ids():
+            return [
+                json.loads(line)["id"]
+                for call in writer.writelines.call_args_list
+                for line in call.args[0]
+            ]
+
+        assert written_ids() == [2]
+
+        release.set()
+        await asyncio.gather(*server._pending)
+        await asyncio.sleep(0)
+        assert written_ids() == [2, 1]
+        assert not server._pending
+
+    @pytest.mark.asyncio
+    async def test_unencodable_response_answered_with_error(self) -> None:
+        """Test a failure outside the tool guard still answers the request id."""
+        server = StdioMcpServer(SessionManager())
+
+        async def bad_tool(args):
+            return {"content": object()}
+
+        server._handlers["halt"] = bad_tool
+        writer = Mock(drain=AsyncMock())
+
+        server._start_task(server._serve_request(
+            {"jsonrpc": "2.0", "id": 7, "method": "tools/call",
+             "params": {"name": "halt", "arguments": {}}},
+            writer,
+        ))
+        if server._pending:
+            await asyncio.gather(*server._pending)
+        await asyncio.sleep(0)
+
+        (line,) = writer.writelines.call_args.args[0]
+        response = json.loads(line)
+        assert response["id"] == 7
+        assert response["error"]["code"] == -32603
+
+    @pytest.mark.asyncio
+    async def test_responses_in_one_iteration_share_a_write(self) -> None:
+        """Test responses finished together are flushed in one writelines call."""
+        server = StdioMcpServer(SessionManager())
+        writer = Mock()
+
+        async def drain():
+            # Backpressure applies to bytes already handed to stdout
+            writer.writelines.assert_called_once()
+
+        writer.drain = AsyncMock(side_effect=drain)
+
+        for request_id in (1, 2, 3):
+            server._start_task(server._serve_request(
+                {"jsonrpc": "2.0", "id": request_id, "method": "tools/list"}, writer
+            ))
+        if server._pending:
+            await asyncio.gather(*server._pending)
+        await asyncio.sleep(0)
+
+        writer.write.assert_not_called()
+        writer.writelines.assert_called_once()
+        lines = writer.writelines.call_args.args[0]
+        assert [json.loads(line)["id"] for line in lines] == [1, 2, 3]
+        assert server._out_queue == []
+        assert writer.drain.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_every_tool_has_a_handler(self) -> None:
+        """Test the dispatch table matches the advertised tools."""
+        server = StdioMcpServer(SessionManager())
+
+        assert set(server._handlers) == {t["name"] for t in server._tools}
+
+        result = await server._handle_tool_call("no_such_tool", {})
+        assert result["is_error"] is True
+        assert "Unknown tool" in result["content"][0]["text"]
+
+        result = await server._handle_tool_call("write_memory", {"address": "0x0"})
+        assert result["is_error"] is True
+        assert "write_memory: data" in result["content"][0]["text"]
+
     @pytest.mark.asyncio
     async def test_handle_initialize(self) -> None:
         """Test initialize request handling."""
@@ -283,6 +510,9 @@ class TestStdioMcpServer:
         assert "result" in response
         assert response["result"]["serverInfo"]["name"] == "unconcealer"
 
+        line = server._encode_response(response)
+        assert json.loads(line) == json.loads(json.dumps(response))
+
     @pytest.mark.asyncio
     async def test_handle_tools_list(self) -> None:
         """Test tools/list request handling."""
@@ -303,6 +533,11 @@ class TestStdioMcpServer:
         assert "tools" in response["result"]
         assert len(response["result"]["tools"]) > 10
 
+        # Encoded from the pre-serialized definitions, same JSON as a full dump
+        line = server._encode_response(response)
+        assert line.endswith(b"\n")
+        assert json.loads(line) == json.loads(json.dumps(response))
+
     @pytest.mark.asyncio
     async def test_handle_unknown_method(self) -> None:
         """Test unknown method handling."""
@@ -414,6 +649,114 @@ class TestStdioMcpServer:
             assert "is_error" not in response["result"]
             assert "Started session" in response["result"]["content"][0]["text"]
 
+    @pytest.mark.asyncio
+    async def test_get_session_cached_until_sessions_change(self, tmp_path: Path) -> None:
+        """Test repeated lookups reuse the last session until the manager changes."""
+        elf_file = tmp_path / "fw.elf"
+        elf_file.touch()
+
+        manager = SessionManager()
+        server = StdioMcpServer(manager)
+
+        with patch(
+            "unconcealer.mcp.session_manager.DebugSession",
+            side_effect=lambda **kwargs: AsyncMock(),
+        ):
+            await manager.start_session(str(elf_file), name="a")
+            await manager.start_session(str(elf_file), name="b")
+
+            with patch.object(manager, "get_current_session", wraps=manager.get_current_session) as lookup:
+                first = server._get_session({})
+                assert server._get_session({}) is first
+                assert lookup.call_count == 1
+
+            assert first is manager.get_session("a")
+            manager.set_current("b")
+            assert server._get_session({}) is manager.get_session("b")
+
+            await manager.stop_session("b")
+            assert server._get_session({}) is first
+            await manager.stop_session("a")
+            with pytest.raises(ValueError, match="No active session"):
+                server._get_session({})
+
+    @pytest.mark.asyncio
+    async def test_list_sessions_marks_current(self, tmp_path: Path) -> None:
+        """Test list_sessions lists every session and stars the current one."""
+        elf_file = tmp_path / "fw.elf"
+        elf_file.touch()
+
+        manager = SessionManager()
+        server = StdioMcpServer(manager)
+
+        with patch(
+            "unconcealer.mcp.session_manager.DebugSession",
+            return_value=AsyncMock(),
+        ):
+            await manager.start_session(str(elf_file), name="a")
+            await manager.start_session(str(elf_file), name="b", cpu="cortex-m4")
+            result = await server._handle_tool_call("list_sessions", {})
+
+        assert result["content"][0]["text"].split("\n") == [
+            "Active sessions:",
+            f"  * a: {elf_file} (lm3s6965evb/cortex-m3)",
+            f"    b: {elf_file} (lm3s6965evb/cortex-m4)",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_read_registers_keeps_gdb_order(self, tmp_path: Path) -> None:
+        """Test registers are listed in the order GDB returned them."""
+        elf_file = tmp_path / "test.elf"
+        elf_file.touch()
+
+        manager = SessionManager()
+        server = StdioMcpServer(manager)
+
+        mock_session = AsyncMock()
+        mock_session.read_registers = AsyncMock(
+            return_value={"r0": 1, "sp": 0x20001000, "pc": 0x08000100}
+        )
+
+        with patch(
+            "unconcealer.mcp.session_manager.DebugSession",
+            return_value=mock_session,
+        ):
+            await manager.start_session(str(elf_file))
+            result = await server._handle_tool_call("read_registers", {})
+
+        assert result["content"][0]["text"].split("\n") == [
+            "  r0: 0x00000001",
+            "  sp: 0x20001000",
+            "  pc: 0x08000100",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_read_memory_hex_dump(self, tmp_path: Path) -> None:
+        """Test read_memory formats a hex dump with a partial last row."""
+        elf_file = tmp_path / "test.elf"
+        elf_file.touch()
+
+        manager = SessionManager()
+        server = StdioMcpServer(manager)
+
+        mock_session = AsyncMock()
+        data = b"Hello, world!\x00\x01\xff" + bytes(range(0x41, 0x45))
+        mock_session.read_memory = AsyncMock(return_value=data)
+
+        with patch(
+            "unconcealer.mcp.session_manager.DebugSession",
+            return_value=mock_session,
+        ):
+            await manager.start_session(str(elf_file))
+            result = await server._handle_tool_call(
+                "read_memory", {"address": "0x20000000", "length": 20}
+            )
+
+        assert result["content"][0]["text"].split("\n") == [
+            "0x20000000: 48 65 6c 6c 6f 2c 20 77 6f 72 6c 64 21 00 01 ff  Hello, world!...",
+            "0x20000010: 41 42 43 44                                      ABCD",
+        ]
+
 
 class TestSessionInfo:
     """Test SessionInfo dataclass."""
@@ -447,6 +790,41 @@ class TestSessionInfo:
         assert info.session is mock_session
         assert info.is_active is True
 
+    def test_created_at_is_wall_clock(self) -> None:
+        """Test created_at reports the wall-clock time of creation."""
+        info = SessionInfo(
+            name="test",
+            elf_path="/path.elf",
+            machine="mps2-an385",
+            cpu="cortex-m3",
+            gdb_port=1234,
+        )
+        assert abs((datetime.now() - info.created_at).total_seconds()) < 5
+
+        # A later clock step (NTP, resume from suspend) doesn't move it
+        created = info.created_at
+        with patch("time.time_ns", return_value=time.time_ns() + 3600 * 10**9):
+            assert info.created_at == created
+
+    def test_to_dict_cached_until_state_changes(self) -> None:
+        """Test SessionInfo.to_dict reuses its result until is_active flips."""
+        info = SessionInfo(
+            name="test",
+            elf_path="/path/to/fw.elf",
+            machine="lm3s6965evb",
+            cpu="cortex-m3",
+            gdb_port=1234,
+        )
+        first = info.to_dict()
+        assert info.to_dict() is first
+        assert first["is_active"] is False
+
+        info.is_active = True
+        second = info.to_dict()
+        assert second is not first
+        assert second["is_active"] is True
+        assert second["created_at"] == first["created_at"]
+
 
 class TestSessionManagerArchitecture:
     """Test SessionManager architecture features."""
@@ -468,6 +846,24 @@ class TestSessionManagerArchitecture:
             )
             assert info.architecture == "cortex-m4"
 
+    @pytest.mark.asyncio
+    async def test_architecture_failure_keeps_no_port(self, tmp_path: Path) -> None:
+        """Test a failed architecture lookup leaves no port reserved."""
+        elf_file = tmp_path / "test.elf"
+        elf_file.touch()
+
+        manager = SessionManager()
+
+        with patch(
+            "unconcealer.mcp.session_manager.get_architecture",
+            side_effect=ValueError("unsupported"),
+        ):
+            with pytest.raises(ValueError):
+                await manager.start_session(str(elf_file))
+
+        assert manager._allocated_ports == set()
+        assert manager.list_sessions() == []
+
     @pytest.mark.asyncio
     async def test_session_detects_riscv_architecture(self, tmp_path: Path) -> None:
         """Test RISC-V architecture detection."""
@@ -510,6 +906,22 @@ class TestSessionManagerArchitecture:
             # cortex-m3 maps to CortexMTarget which has name "cortex-m"
             assert "cortex" in arch.name.lower()
 
+    @pytest.mark.asyncio
+    async def test_get_architecture_resolved_at_start(self, tmp_path: Path) -> None:
+        """Test the handler is resolved once and kept on the SessionInfo."""
+        elf_file = tmp_path / "test.elf"
+        elf_file.touch()
+
+        manager = SessionManager()
+
+        with patch(
+            "unconcealer.mcp.session_manager.DebugSession",
+            return_value=AsyncMock(),
+        ):
+            info = await manager.start_session(str(elf_file), cpu="cortex-m3")
+            assert info.arch is not None
+            assert manager.get_architecture() is info.arch
+
     @pytest.mark.asyncio
     async def test_get_current_architecture(self, tmp_path: Path) -> None:
         """Test get_current_architecture."""
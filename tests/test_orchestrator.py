@@ -1,5 +1,7 @@
 """Tests for Agent Orchestrator."""
 
+import dataclasses
+
 import pytest
 from datetime import datetime
 from unittest.mock import Mock, AsyncMock, patch
@@ -37,6 +39,12 @@ class TestFinding:
         assert finding.evidence == {}
         assert finding.severity == "info"
 
+    def test_finding_is_frozen(self) -> None:
+        """Test findings cannot be modified after creation."""
+        finding = Finding(timestamp=datetime.now(), description="Test finding")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            finding.severity = "error"  # type: ignore[misc]
+
 
 class TestSessionMemory:
     """Test SessionMemory dataclass."""
@@ -62,6 +70,19 @@ class TestSessionMemory:
         assert memory.findings[0].description == "Found corruption at 0x20001000"
         assert memory.findings[0].severity == "warning"
 
+    def test_render_findings(self) -> None:
+        """Test findings render is cached and refreshed on new findings."""
+        memory = SessionMemory()
+        assert memory.render_findings() == ""
+
+        memory.add_finding("PC corrupted", severity="error")
+        first = memory.render_findings()
+        assert first == "  [error] PC corrupted"
+        assert memory.render_findings() is first
+
+        memory.add_finding("Stack low", severity="warning")
+        assert memory.render_findings() == "  [error] PC corrupted\n  [warning] Stack low"
+
     def test_get_context_summary_empty(self) -> None:
         """Test context summary when empty."""
         memory = SessionMemory()
@@ -209,6 +230,15 @@ class TestAgentOrchestratorHistory:
         # Original should be unchanged
         assert len(orchestrator._conversation_history) == 1
 
+    def test_record_turn(self, orchestrator: AgentOrchestrator) -> None:
+        """Test recording a turn answered outside the provider."""
+        orchestrator.record_turn("What is the PC?", "PC is 0x1234")
+
+        assert orchestrator.conversation_history == [
+            {"role": "user", "content": "What is the PC?"},
+            {"role": "assistant", "content": "PC is 0x1234"},
+        ]
+
 
 class TestAgentOrchestratorOptions:
     """Test options building."""
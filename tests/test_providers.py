@@ -128,6 +128,25 @@ class TestModelProviderBase:
         result = await provider.call_tool("add", {"a": 2, "b": 3})
         assert result == "5"
 
+    @pytest.mark.asyncio
+    async def test_call_tool_sync_handler(self) -> None:
+        """Test synchronous handlers run off the event loop."""
+        import threading
+
+        provider = ConcreteProvider()
+        caller = {}
+
+        def handler(x: int) -> str:
+            caller["thread"] = threading.current_thread()
+            return str(x + 1)
+
+        provider.register_tool("inc", "Increment", {}, handler)
+
+        result = await provider.call_tool("inc", {"x": 41})
+
+        assert result == "42"
+        assert caller["thread"] is not threading.main_thread()
+
     @pytest.mark.asyncio
     async def test_call_tool_unknown(self) -> None:
         """Test calling an unknown tool."""
@@ -343,3 +362,45 @@ class TestOrchestratorWithProvider:
 
         assert response == "Test response"
         assert len(orchestrator.conversation_history) == 2
+
+    def test_prefix_cache_disabled_by_default(self, mock_session) -> None:
+        """Test no cache options are sent unless requested."""
+        from unconcealer.agent.orchestrator import AgentOrchestrator
+
+        orchestrator = AgentOrchestrator(mock_session, provider=ConcreteProvider())
+
+        assert orchestrator.prefix_cache_key is None
+        assert orchestrator._cache_options == {}
+
+    @pytest.mark.asyncio
+    async def test_prefix_cache_options_passed_to_provider(self, mock_session) -> None:
+        """Test prefix cache options reach the provider on each turn."""
+        from unconcealer.agent.orchestrator import AgentOrchestrator
+
+        class CachingProvider(ConcreteProvider):
+            def __init__(self) -> None:
+                super().__init__()
+                self.seen_kwargs: list = []
+
+            def prefix_cache_options(self, cache_key):
+                return {"prompt_cache_key": cache_key}
+
+            async def complete(self, messages, system_prompt, **kwargs):
+                self.seen_kwargs.append(kwargs)
+                yield CompletionChunk(type="text", text="ok")
+
+        provider = CachingProvider()
+        orchestrator = AgentOrchestrator(
+            mock_session, provider=provider, prefix_cacheable=True, elf_digest="ab" * 32
+        )
+
+        await orchestrator.query("first")
+        await orchestrator.query("second")
+
+        key = orchestrator.prefix_cache_key
+        assert key is not None and len(key) == 64
+        assert provider.seen_kwargs == [{"prompt_cache_key": key}] * 2
+
+    def test_base_provider_has_no_cache_options(self) -> None:
+        """Test providers without prompt caching add no options."""
+        assert ConcreteProvider().prefix_cache_options("key") == {}
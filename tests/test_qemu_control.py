@@ -286,6 +286,23 @@ class TestQEMUControllerStart:
         assert "-S" in call_args  # Wait for GDB
 
 
+    @pytest.mark.asyncio
+    async def test_start_logs_output_to_file(self, tmp_path) -> None:
+        """Test QEMU output goes to log_path instead of unread pipes."""
+        fake_qemu = tmp_path / "qemu"
+        fake_qemu.write_text("#!/bin/sh\necho 'qemu: bad machine' >&2\nexit 1\n")
+        fake_qemu.chmod(0o755)
+        log_path = tmp_path / "qemu.log"
+
+        qemu = QEMUController(QEMUConfig(qemu_path=str(fake_qemu), log_path=str(log_path)))
+
+        with pytest.raises(RuntimeError, match="qemu: bad machine"):
+            await qemu.start("/path/to/firmware.elf")
+        assert qemu.process.stdout is None
+        assert qemu.process.stderr is None
+        assert "qemu: bad machine" in log_path.read_text()
+
+
 # Integration tests - require actual QEMU running
 @pytest.mark.integration
 class TestQEMUControllerIntegration:
@@ -1,8 +1,11 @@
 """Tests for Debug Session."""
 
+import asyncio
+
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 from unconcealer.core.session import DebugSession
+from unconcealer.core.types import RegisterSnapshot
 from unconcealer.tools.qemu_control import QEMUConfig
 from unconcealer.tools.gdb_bridge import StopReason, StopInfo, BreakpointInfo
 
@@ -75,6 +78,56 @@ class TestDebugSessionLifecycle:
             mock_gdb.load_symbols.assert_called_once_with("/path/to/firmware.elf")
             mock_gdb.connect.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_start_connects_after_qemu_and_symbols(self) -> None:
+        """Test GDB connects only once QEMU is up and symbols are loaded."""
+        session = DebugSession(elf_path="/path/to/firmware.elf")
+        calls = []
+
+        def record(name):
+            async def call(*args, **kwargs):
+                calls.append(name)
+                return True
+            return call
+
+        with patch("unconcealer.core.session.QEMUController") as mock_qemu_cls, \
+             patch("unconcealer.core.session.GDBBridge") as mock_gdb_cls:
+            mock_qemu_cls.return_value.start = record("qemu.start")
+            mock_gdb = mock_gdb_cls.return_value
+            mock_gdb.start = record("gdb.start")
+            mock_gdb.load_symbols = record("gdb.load_symbols")
+            mock_gdb.connect = record("gdb.connect")
+
+            await session.start()
+
+        assert calls[-1] == "gdb.connect"
+        assert set(calls[:-1]) == {"qemu.start", "gdb.start", "gdb.load_symbols"}
+
+    @pytest.mark.asyncio
+    async def test_start_failure_stops_started_gdb(self) -> None:
+        """Test GDB is shut down when QEMU fails to start beside it."""
+        session = DebugSession(elf_path="/path/to/firmware.elf")
+
+        with patch("unconcealer.core.session.QEMUController") as mock_qemu_cls, \
+             patch("unconcealer.core.session.GDBBridge") as mock_gdb_cls:
+            mock_qemu = mock_qemu_cls.return_value
+            mock_qemu.start = AsyncMock(side_effect=RuntimeError("QEMU not found"))
+            mock_qemu.stop = AsyncMock()
+            mock_gdb = mock_gdb_cls.return_value
+            mock_gdb.start = AsyncMock()
+            mock_gdb.load_symbols = AsyncMock(return_value=True)
+            mock_gdb.connect = AsyncMock()
+            mock_gdb.close = AsyncMock()
+
+            with pytest.raises(RuntimeError, match="QEMU not found"):
+                await session.start()
+
+        mock_gdb.close.assert_awaited_once()
+        mock_qemu.stop.assert_awaited_once()
+        mock_gdb.connect.assert_not_called()
+        assert session.started is False
+        assert session.gdb is None
+
     @pytest.mark.asyncio
     async def test_stop_closes_gdb_and_qemu(self, mock_session: DebugSession) -> None:
         """Test stop closes both GDB and QEMU."""
@@ -136,6 +189,30 @@ class TestDebugSessionExecution:
         assert result.reason == StopReason.STEP
         started_session.gdb.step.assert_called_once_with(instruction=False)
 
+    @pytest.mark.asyncio
+    async def test_iter_backtrace_stops_early(self, started_session: DebugSession) -> None:
+        """Test that iter_backtrace only fetches the batches consumed."""
+        started_session.gdb.get_backtrace_range = AsyncMock(
+            side_effect=lambda low, high: [
+                {"level": i, "func": f"f{i}"} for i in range(low, min(high, 5) + 1)
+            ]
+        )
+
+        frames = []
+        async for frame in started_session.iter_backtrace(batch_size=2):
+            frames.append(frame)
+            if len(frames) == 1:
+                break
+
+        assert frames[0]["func"] == "f0"
+        started_session.gdb.get_backtrace_range.assert_awaited_once_with(0, 1)
+
+        levels = [f["level"] async for f in started_session.iter_backtrace(batch_size=4)]
+        assert levels == [0, 1, 2, 3, 4, 5]
+
+        limited = [f async for f in started_session.iter_backtrace(max_frames=3)]
+        assert len(limited) == 3
+
     @pytest.mark.asyncio
     async def test_step_instruction(self, started_session: DebugSession) -> None:
         """Test single step instruction."""
@@ -155,6 +232,36 @@ class TestDebugSessionExecution:
 
         started_session.gdb.halt.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_run_generation_bumped_by_execution(
+        self, started_session: DebugSession
+    ) -> None:
+        """Test execution control advances the run generation."""
+        stop_info = StopInfo(reason=StopReason.STEP, address=0x08001238)
+        started_session.gdb.step = AsyncMock(return_value=stop_info)
+        started_session.gdb.continue_execution = AsyncMock(side_effect=TimeoutError)
+
+        assert started_session.run_generation == 0
+        await started_session.step()
+        assert started_session.run_generation == 1
+
+        with pytest.raises(TimeoutError):
+            await started_session.continue_execution()
+        assert started_session.run_generation == 2
+
+    @pytest.mark.asyncio
+    async def test_run_generation_unchanged_by_reads(
+        self, started_session: DebugSession
+    ) -> None:
+        """Test plain reads leave the run generation alone."""
+        started_session.gdb.read_registers = AsyncMock(return_value={"pc": 0})
+        started_session.gdb.read_memory = AsyncMock(return_value=b"\x00")
+
+        await started_session.read_registers()
+        await started_session.read_memory(0x20000000, 1)
+
+        assert started_session.run_generation == 0
+
 
 class TestDebugSessionRegisters:
     """Test register operations."""
@@ -170,25 +277,130 @@ class TestDebugSessionRegisters:
 
     @pytest.mark.asyncio
     async def test_read_registers(self, started_session: DebugSession) -> None:
-        """Test reading registers."""
-        started_session.gdb.read_registers = AsyncMock(
-            return_value={"pc": 0x08001234, "sp": 0x20001000}
+        """Test named registers are sliced from one register file read."""
+        started_session.gdb.read_all_registers = AsyncMock(
+            return_value={"r0": 0, "sp": 0x20001000, "pc": 0x08001234}
         )
 
         result = await started_session.read_registers(["pc", "sp"])
 
-        assert result["pc"] == 0x08001234
-        assert result["sp"] == 0x20001000
+        assert result == {"pc": 0x08001234, "sp": 0x20001000}
+        started_session.gdb.read_all_registers.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_read_registers_unlisted_name(self, started_session: DebugSession) -> None:
+        """Test names missing from the register file are read individually."""
+        started_session.gdb.read_all_registers = AsyncMock(return_value={"pc": 0x08001234})
+        started_session.gdb.evaluate_registers = AsyncMock(return_value={"x2": 0x20001000})
+
+        result = await started_session.read_registers(["pc", "x2"])
+
+        assert result == {"pc": 0x08001234, "x2": 0x20001000}
+        started_session.gdb.evaluate_registers.assert_called_once_with(["x2"])
 
     @pytest.mark.asyncio
     async def test_read_register(self, started_session: DebugSession) -> None:
         """Test reading single register."""
-        started_session.gdb.read_register = AsyncMock(return_value=0x08001234)
+        started_session.gdb.read_all_registers = AsyncMock(return_value={"pc": 0x08001234})
 
         result = await started_session.read_register("pc")
 
         assert result == 0x08001234
 
+    @pytest.mark.asyncio
+    async def test_read_register_unknown(self, started_session: DebugSession) -> None:
+        """Test a register GDB can't read raises instead of reading as 0."""
+        started_session.gdb.read_all_registers = AsyncMock(return_value={"pc": 0x08001234})
+        started_session.gdb.evaluate_registers = AsyncMock(return_value={})
+
+        with pytest.raises(ValueError, match="typo"):
+            await started_session.read_register("typo")
+
+    @pytest.mark.asyncio
+    async def test_read_register_snapshot(self, started_session: DebugSession) -> None:
+        """Test register snapshot is in sorted name order."""
+        started_session.gdb.read_registers = AsyncMock(
+            return_value={"r1": 1, "r0": 0, "pc": 0x08001234}
+        )
+
+        snap = await started_session.read_register_snapshot()
+
+        assert snap.names == ("pc", "r0", "r1")
+        assert list(snap.values) == [0x08001234, 0, 1]
+        assert snap.to_dict() == {"pc": 0x08001234, "r0": 0, "r1": 1}
+
+    @pytest.mark.asyncio
+    async def test_read_register_snapshot_reuses_order(
+        self, started_session: DebugSession
+    ) -> None:
+        """Test the sorted name order is reused across reads."""
+        started_session.gdb.read_registers = AsyncMock(return_value={"r1": 1, "r0": 0})
+
+        first = await started_session.read_register_snapshot()
+        second = await started_session.read_register_snapshot()
+
+        assert first.names is second.names
+
+    @pytest.mark.asyncio
+    async def test_read_registers_cached_until_target_changes(
+        self, started_session: DebugSession
+    ) -> None:
+        """Test register reads are cached until execution resumes."""
+        started_session.gdb.read_all_registers = AsyncMock(
+            return_value={"pc": 0x08001234, "sp": 0x20001000}
+        )
+        started_session.gdb.halt = AsyncMock()
+
+        await started_session.read_registers(["pc", "sp"])
+        assert await started_session.read_registers(["sp"]) == {"sp": 0x20001000}
+        assert await started_session.read_register("pc") == 0x08001234
+        assert started_session.gdb.read_all_registers.call_count == 1
+
+        await started_session.halt()
+        await started_session.read_registers(["pc", "sp"])
+        assert started_session.gdb.read_all_registers.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_register_file_not_cached(
+        self, started_session: DebugSession
+    ) -> None:
+        """Test an empty read (target still running) is retried next time."""
+        started_session.gdb.read_registers = AsyncMock(
+            side_effect=[{}, {"pc": 0x08001234}]
+        )
+
+        assert await started_session.read_registers() == {}
+        assert await started_session.read_registers() == {"pc": 0x08001234}
+
+    @pytest.mark.asyncio
+    async def test_no_caching_until_target_stops(
+        self, started_session: DebugSession
+    ) -> None:
+        """Test reads after a continue that didn't see a stop go to GDB."""
+        started_session.gdb.continue_execution = AsyncMock(
+            return_value=StopInfo(reason=StopReason.SIGNAL, address=0)
+        )
+        started_session.gdb.read_registers = AsyncMock(
+            return_value={"pc": 0x08001234, "sp": 0x20001000}
+        )
+        started_session.gdb.halt = AsyncMock()
+
+        await started_session.continue_execution()
+        await started_session.read_registers()
+        await started_session.read_registers(["pc"])
+        assert started_session.gdb.read_registers.call_count == 2
+
+        await started_session.halt()
+        await started_session.read_registers()
+        await started_session.read_registers()
+        assert started_session.gdb.read_registers.call_count == 3
+
+    def test_register_snapshot_wide_values(self) -> None:
+        """Test values wider than 64 bits are kept."""
+        snap = RegisterSnapshot.from_dict(("q0",), {"q0": 1 << 100})
+
+        assert list(snap) == [("q0", 1 << 100)]
+
 
 class TestDebugSessionMemory:
     """Test memory operations."""
@@ -229,11 +441,119 @@ class TestDebugSessionMemory:
     @pytest.mark.asyncio
     async def test_read_memory_word(self, started_session: DebugSession) -> None:
         """Test reading memory word."""
-        started_session.gdb.read_memory_word = AsyncMock(return_value=0xDEADBEEF)
+        started_session.gdb.read_memory = AsyncMock(return_value=b"\xef\xbe\xad\xde")
 
         result = await started_session.read_memory_word(0x20000000)
 
         assert result == 0xDEADBEEF
+        started_session.gdb.read_memory.assert_called_once_with(0x20000000, 4)
+
+    @pytest.mark.asyncio
+    async def test_read_memory_words(self, started_session: DebugSession) -> None:
+        """Test several words come from one memory read."""
+        started_session.gdb.read_memory = AsyncMock(
+            return_value=b"\xef\xbe\xad\xde\x01\x00\x00\x00\x02\x00\x00\x00"
+        )
+
+        result = await started_session.read_memory_words(0x20000000, 3)
+
+        assert result == [0xDEADBEEF, 1, 2]
+        started_session.gdb.read_memory.assert_called_once_with(0x20000000, 12)
+
+    @pytest.mark.asyncio
+    async def test_read_memory_cached_until_target_changes(
+        self, started_session: DebugSession
+    ) -> None:
+        """Test repeat and enclosed reads are served from cache until a step."""
+        started_session.gdb.read_memory = AsyncMock(return_value=b"\x01\x02\x03\x04")
+        started_session.gdb.step = AsyncMock(
+            return_value=StopInfo(reason=StopReason.STEP, address=0x08001238)
+        )
+
+        assert await started_session.read_memory(0x20000000, 4) == b"\x01\x02\x03\x04"
+        assert await started_session.read_memory(0x20000000, 4) == b"\x01\x02\x03\x04"
+        assert await started_session.read_memory(0x20000001, 2) == b"\x02\x03"
+        assert started_session.gdb.read_memory.call_count == 1
+
+        await started_session.step()
+        await started_session.read_memory(0x20000000, 4)
+        assert started_session.gdb.read_memory.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reads_coalesced(self, started_session: DebugSession) -> None:
+        """Test adjacent concurrent reads share one GDB request."""
+        started_session.gdb.read_memory = AsyncMock(return_value=bytes(range(12)))
+
+        a, b, c = await asyncio.gather(
+            started_session.read_memory(0xE000ED28, 4),
+            started_session.read_memory(0xE000ED30, 4),
+            started_session.read_memory(0xE000ED2C, 4),
+        )
+
+        started_session.gdb.read_memory.assert_called_once_with(0xE000ED28, 12)
+        assert a == bytes([0, 1, 2, 3])
+        assert b == bytes([8, 9, 10, 11])
+        assert c == bytes([4, 5, 6, 7])
+        assert type(a) is bytes
+
+    @pytest.mark.asyncio
+    async def test_stop_with_reads_queued(self, started_session: DebugSession) -> None:
+        """Test reads still queued when the session stops fail instead of hanging."""
+        started_session.gdb.close = AsyncMock()
+        started_session.qemu.stop = AsyncMock()
+
+        reads = [
+            asyncio.ensure_future(started_session.read_memory(0x20000000, 4)),
+            asyncio.ensure_future(started_session.read_memory(0x20001000, 4)),
+        ]
+        await asyncio.sleep(0)  # both reads are now queued
+        await started_session.stop()
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*reads, return_exceptions=True), timeout=1
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_gap_between_reads_not_read(self, started_session: DebugSession) -> None:
+        """Test bytes between two reads are never requested (MMIO side effects)."""
+        started_session.gdb.read_memory = AsyncMock(side_effect=[b"\x01" * 4, b"\x02" * 4])
+
+        await asyncio.gather(
+            started_session.read_memory(0xE000ED28, 4),
+            started_session.read_memory(0xE000ED30, 4),
+        )
+
+        assert [c.args for c in started_session.gdb.read_memory.call_args_list] == [
+            (0xE000ED28, 4),
+            (0xE000ED30, 4),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_distant_reads_not_coalesced(self, started_session: DebugSession) -> None:
+        """Test reads far apart are issued separately."""
+        started_session.gdb.read_memory = AsyncMock(side_effect=[b"\x01", b"\x02"])
+
+        a, b = await asyncio.gather(
+            started_session.read_memory(0x20000000, 1),
+            started_session.read_memory(0x08000000, 1),
+        )
+
+        assert (a, b) == (b"\x02", b"\x01")
+        assert started_session.gdb.read_memory.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_short_coalesced_read_retried(self, started_session: DebugSession) -> None:
+        """Test a failed merged read falls back to the individual reads."""
+        started_session.gdb.read_memory = AsyncMock(side_effect=[b"", b"\x01", b"\x02"])
+
+        a, b = await asyncio.gather(
+            started_session.read_memory(0x20000000, 1),
+            started_session.read_memory(0x20000001, 1),
+        )
+
+        assert (a, b) == (b"\x01", b"\x02")
+        assert started_session.gdb.read_memory.call_count == 3
 
 
 class TestDebugSessionBreakpoints:
@@ -0,0 +1,51 @@
+"""Tests for helpers shared by the MCP server and command-line tools."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from unconcealer.tools.gdb_bridge import EvalResult
+from unconcealer.toolutil import hex_dump, resolve_address
+
+
+class TestHexDump:
+    """Test hex dump formatting."""
+
+    def test_rows(self) -> None:
+        """Test full and partial rows, non-printable bytes and memoryview input."""
+        data = memoryview(b"Hello, world!\x00\x01\xff" + b"ABCD")
+
+        assert hex_dump(data, 0x20000000).split("\n") == [
+            "0x20000000: 48 65 6c 6c 6f 2c 20 77 6f 72 6c 64 21 00 01 ff  Hello, world!...",
+            "0x20000010: 41 42 43 44                                      ABCD",
+        ]
+
+    def test_empty(self) -> None:
+        """Test an empty buffer gives empty text."""
+        assert hex_dump(b"", 0) == ""
+
+
+class TestResolveAddress:
+    """Test address resolution."""
+
+    @pytest.mark.asyncio
+    async def test_session_target(self) -> None:
+        """Test numbers parse locally; registers and symbols go to the session."""
+        session = AsyncMock()
+        session.read_register = AsyncMock(return_value=0x20001000)
+        session.evaluate = AsyncMock(return_value="0x8000100 <main>")
+
+        assert await resolve_address(session, "0X20000000") == 0x20000000
+        assert await resolve_address(session, "4096") == 4096
+        assert await resolve_address(session, "$sp") == 0x20001000
+        assert await resolve_address(session, "main") == 0x8000100
+        session.read_register.assert_awaited_once_with("sp")
+        session.evaluate.assert_awaited_once_with("&main")
+
+    @pytest.mark.asyncio
+    async def test_gdb_bridge_target(self) -> None:
+        """Test a GDBBridge's EvalResult is unwrapped."""
+        gdb = AsyncMock()
+        gdb.evaluate = AsyncMock(return_value=EvalResult(value="0x8000100 <main>"))
+
+        assert await resolve_address(gdb, "main") == 0x8000100